@@ -0,0 +1,238 @@
+"""
+Descomposición de funciones en árboles de MUX de varios niveles.
+Cada MUX elige sus variables de selección y sus entradas de datos son constantes, literales de una
+variable u otros MUX. Los cofactores de Shannon se guardan en una caché de subfunciones, de modo que
+las subtablas idénticas se calculan y se emiten una sola vez (el árbol es en realidad un grafo).
+"""
+import itertools
+import numpy as np
+from NucleoMux import VectorVerdad, calcular_num_vars
+
+VARIABLES = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+#------------------------------------------------------------------------------------------------------------------------
+def reducir_soporte(Vars, Tabla):
+    """
+    Elimina de la subfunción las variables de las que no depende.
+
+    Args:
+        Vars (tuple): Índices de las variables, uno por eje de la tabla.
+        Tabla (numpy.ndarray): Tabla de verdad booleana con un eje de tamaño 2 por variable.
+
+    Returns:
+        tuple: (Vars, Tabla) solo con las variables del soporte.
+    """
+    eje = 0
+    while eje < len(Vars):
+        Cero, Uno = Tabla.take(0, axis=eje), Tabla.take(1, axis=eje)
+        if np.array_equal(Cero, Uno):
+            Vars, Tabla = Vars[:eje] + Vars[eje + 1:], Cero  # La variable no influye
+        else:
+            eje += 1
+    return Vars, Tabla
+#------------------------------------------------------------------------------------------------------------------------
+def hoja(Vars, Tabla):
+    """
+    Retorna la entrada de datos equivalente a una subfunción ya reducida, si es constante o un literal.
+
+    Args:
+        Vars (tuple): Variables del soporte.
+        Tabla (numpy.ndarray): Tabla de verdad reducida.
+
+    Returns:
+        str: "0", "1", la variable o la variable negada; None si la subfunción necesita un MUX.
+    """
+    if not Vars:
+        return "1" if Tabla.item() else "0"
+    if len(Vars) == 1:
+        return VARIABLES[Vars[0]] if Tabla[1] else VARIABLES[Vars[0]] + "'"
+    return None
+#------------------------------------------------------------------------------------------------------------------------
+def cofactores(Vars, Tabla, Selects):
+    """
+    Calcula los cofactores de Shannon de una subfunción respecto a un grupo de variables.
+
+    Args:
+        Vars (tuple): Variables de la subfunción.
+        Tabla (numpy.ndarray): Tabla de verdad de la subfunción.
+        Selects (tuple): Posiciones (ejes) de las variables de selección; la primera es el bit más significativo.
+
+    Returns:
+        tuple: (Restantes, Lista) con las variables que quedan y un cofactor por combinación de los selects.
+    """
+    Resto = [eje for eje in range(len(Vars)) if eje not in Selects]
+    Ordenada = Tabla.transpose(list(Selects) + Resto).reshape((1 << len(Selects),) + (2,) * len(Resto))
+    return tuple(Vars[eje] for eje in Resto), list(Ordenada)
+#------------------------------------------------------------------------------------------------------------------------
+class ArbolMux:
+    """
+    Resultado de la descomposición: un grafo de MUX con subfunciones compartidas.
+
+    Atributos:
+    - num_vars: número de variables de la función
+    - raiz: entrada de datos que representa la función ("0", "1", un literal o "M<i>")
+    - nodos: lista de MUX; cada uno es un diccionario con "selects" (nombres de variables, la primera
+      es el bit más significativo) y "entradas" (una referencia por combinación de los selects)
+    """
+    def __init__(self, num_vars, raiz, nodos):
+        self.num_vars = num_vars
+        self.raiz = raiz
+        self.nodos = nodos
+
+    @property
+    def num_mux(self):
+        return len(self.nodos)
+
+    def evaluar(self, minterm):
+        """
+        Evalúa la función representada en un minterm (A es el bit más significativo).
+        """
+        valores = {VARIABLES[i]: minterm >> (self.num_vars - 1 - i) & 1 for i in range(self.num_vars)}
+        referencia = self.raiz
+        while referencia.startswith("M"):
+            nodo = self.nodos[int(referencia[1:])]
+            indice = 0
+            for select in nodo["selects"]:
+                indice = indice << 1 | valores[select]
+            referencia = nodo["entradas"][indice]
+        if referencia in ("0", "1"):
+            return int(referencia)
+        return valores[referencia[0]] ^ referencia.endswith("'")
+
+    def as_dict(self):
+        """
+        Retorna el árbol como diccionario serializable a JSON.
+        """
+        return {"num_vars": self.num_vars, "num_mux": self.num_mux, "raiz": self.raiz, "nodos": self.nodos}
+#------------------------------------------------------------------------------------------------------------------------
+class DescomposicionMux:
+    """
+    Motor de descomposición en árboles de MUX con caché de cofactores.
+    En cada MUX se eligen hasta `ancho` variables de selección (2 da MUX de 4x1). Si la subfunción tiene
+    a lo más `limite_exacta` variables, el grupo se elige con una búsqueda exhaustiva memorizada que
+    minimiza el número de MUX; si no, se elige de forma voraz el grupo con menos cofactores distintos.
+    Si se indica `orden` (nombres de variables), cada MUX usa como selects las primeras variables de
+    ese orden presentes en su subfunción, sin búsqueda.
+    Una misma instancia puede descomponer varias funciones y reutiliza la caché entre ellas.
+    """
+    def __init__(self, ancho=2, limite_exacta=6, orden=None):
+        if ancho < 1:
+            raise ValueError("cada MUX necesita al menos una variable de selección (ancho >= 1)")
+        invalidas = [nombre for nombre in orden or [] if not (isinstance(nombre, str) and len(nombre) == 1 and nombre in VARIABLES)]
+        if invalidas:
+            raise ValueError(f"variables inválidas en el orden: {', '.join(map(str, invalidas))}")
+        self.ancho = ancho
+        self.limite_exacta = limite_exacta
+        self.orden = [VARIABLES.index(nombre) for nombre in orden] if orden else None
+        self._costos = {}  # Costo mínimo por subfunción (clave de _clave)
+        self._reducidas = {}  # Subfunción reducida y su hoja por cofactor (clave de _clave)
+
+    @staticmethod
+    def _clave(Vars, Tabla):
+        return Vars, Tabla.tobytes()
+
+    def _grupos(self, Vars):
+        return itertools.combinations(range(len(Vars)), min(self.ancho, len(Vars) - 1))
+
+    def _reducir(self, Vars, Tabla):
+        """
+        Retorna (clave, Vars, Tabla, hoja) de la subfunción reducida, usando la caché de cofactores.
+        """
+        clave = self._clave(Vars, Tabla)
+        if clave not in self._reducidas:
+            SubVars, SubTabla = reducir_soporte(Vars, Tabla)
+            self._reducidas[clave] = (self._clave(SubVars, SubTabla), SubVars, SubTabla, hoja(SubVars, SubTabla))
+        return self._reducidas[clave]
+
+    def _hijos(self, Vars, Tabla, Selects):
+        """
+        Retorna los cofactores reducidos distintos que no son hojas, por clave.
+        """
+        Restantes, Lista = cofactores(Vars, Tabla, Selects)
+        hijos = {}
+        for Cofactor in Lista:
+            clave, SubVars, SubTabla, referencia = self._reducir(Restantes, Cofactor)
+            if referencia is None:
+                hijos.setdefault(clave, (SubVars, SubTabla))
+        return hijos
+
+    def costo(self, Vars, Tabla):
+        """
+        Número mínimo de MUX de una subfunción reducida (búsqueda exhaustiva memorizada).
+        Los hijos idénticos de un mismo MUX se cuentan una vez.
+        """
+        if hoja(Vars, Tabla) is not None:
+            return 0
+        clave = self._clave(Vars, Tabla)
+        if clave not in self._costos:
+            self._costos[clave] = min(1 + sum(self.costo(*hijo) for hijo in self._hijos(Vars, Tabla, Selects).values())
+                                      for Selects in self._grupos(Vars))
+        return self._costos[clave]
+
+    def elegir_selects(self, Vars, Tabla):
+        """
+        Elige las posiciones de las variables de selección para el MUX de una subfunción reducida.
+        """
+        tamano = min(self.ancho, len(Vars) - 1)
+        if self.orden is not None:
+            preferidas = [Vars.index(var) for var in self.orden if var in Vars]
+            resto = [eje for eje in range(len(Vars)) if Vars[eje] not in self.orden]
+            return tuple((preferidas + resto)[:tamano])
+        if len(Vars) <= self.limite_exacta:
+            return min(self._grupos(Vars), key=lambda Selects: 1 + sum(
+                self.costo(*hijo) for hijo in self._hijos(Vars, Tabla, Selects).values()))
+
+        def puntaje(Selects):
+            hijos = self._hijos(Vars, Tabla, Selects)
+            return len(hijos), sum(len(SubVars) for SubVars, _ in hijos.values())
+        return min(self._grupos(Vars), key=puntaje)
+
+    def descomponer(self, Minterms, NumVars=None):
+        """
+        Descompone la función dada por sus minterms en un árbol de MUX.
+
+        Args:
+            Minterms (list): Lista de minterms (enteros).
+            NumVars (int): Número de variables; por defecto el mínimo que representa los minterms.
+
+        Returns:
+            ArbolMux: Grafo de MUX con las subfunciones idénticas compartidas.
+        """
+        NumVars = NumVars or calcular_num_vars(Minterms)
+        Tabla = VectorVerdad(Minterms, 1 << NumVars).reshape((2,) * NumVars)  # El eje 0 es A
+        nodos = []
+        emitidos = {}  # Referencia de cada subfunción ya emitida, por clave
+
+        def emitir(Vars, Tabla):
+            clave, Vars, Tabla, referencia = self._reducir(Vars, Tabla)
+            if referencia is not None:
+                return referencia
+            if clave not in emitidos:
+                Selects = self.elegir_selects(Vars, Tabla)
+                Restantes, Lista = cofactores(Vars, Tabla, Selects)
+                entradas = [emitir(Restantes, Cofactor) for Cofactor in Lista]
+                emitidos[clave] = f"M{len(nodos)}"
+                nodos.append({"selects": [VARIABLES[Vars[eje]] for eje in Selects], "entradas": entradas})
+            return emitidos[clave]
+
+        raiz = emitir(tuple(range(NumVars)), Tabla)
+        return ArbolMux(NumVars, raiz, nodos)
+#------------------------------------------------------------------------------------------------------------------------
+def descomponer_mux(Minterms, ancho=2, limite_exacta=6, orden=None, NumVars=None):
+    """
+    Descompone una función en un árbol de MUX de varios niveles.
+
+    Args:
+        Minterms (list): Lista de minterms (enteros).
+        ancho (int): Variables de selección por MUX (1: 2x1, 2: 4x1, 3: 8x1...).
+        limite_exacta (int): Número máximo de variables de una subfunción para la búsqueda exhaustiva.
+        orden (list): Variables a usar como selects en ese orden de preferencia (por ejemplo ["C", "D", "A", "B"]),
+            o None para buscar el orden que minimiza el número de MUX.
+        NumVars (int): Número de variables; por defecto el mínimo que representa los minterms. Hace falta
+            cuando la función no depende de sus variables más significativas.
+
+    Returns:
+        ArbolMux: Grafo de MUX de la función.
+    """
+    return DescomposicionMux(ancho, limite_exacta, orden).descomponer(Minterms, NumVars)
+#------------------------------------------------------------------------------------------------------------------------
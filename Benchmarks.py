@@ -0,0 +1,213 @@
+"""
+Benchmarks reproducibles de los motores de McCluskey y de reducción de MUX.
+Genera funciones con semilla fija (aleatorias, de paridad y de cubo completo), mide el tiempo de
+cada fase con MinimizationStats, la memoria pico y el tamaño de los resultados, y escribe un reporte
+JSON que puede compararse contra una línea base guardada. LineaBaseBenchmarks.json es la línea base
+de la corrida rápida.
+
+Uso:
+    python Benchmarks.py [--max-vars N] [--max-vars-paridad N] [--rapido] [--salida reporte.json]
+                         [--base base.json] [--umbral 0.25]
+    python Benchmarks.py --rapido --base LineaBaseBenchmarks.json
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import tracemalloc
+from Estadisticas import MinimizationStats
+from NucleoMcClusky import count_variables, quine_mccluskey, result_to_string
+from NucleoMux import TablaMux
+
+DENSIDADES = (0.05, 0.25, 0.5, 0.75, 0.95)
+MAX_VARS_RAPIDO = 10  # Número máximo de variables de la corrida rápida
+#------------------------------------------------------------------------------------------------------------------------
+def generar_casos(min_vars=4, max_vars=20, semilla=2024, max_vars_paridad=12):
+    """
+    Genera los casos de prueba: funciones aleatorias para cada número de variables y densidad,
+    funciones de paridad (ningún término se combina, así que la tabla de cobertura crece con el
+    cuadrado de 2^(n-1)) y funciones de cubo completo (todos los minterms, el caso especial cuyo
+    resultado es 1).
+
+    Args:
+        min_vars (int): Número mínimo de variables.
+        max_vars (int): Número máximo de variables.
+        semilla (int): Semilla del generador aleatorio.
+        max_vars_paridad (int): Número máximo de variables para las funciones de paridad.
+
+    Returns:
+        list: Diccionarios con "nombre", "num_vars", "densidad" y "minterms"; los de cubo completo
+        traen además la "expresion" esperada.
+    """
+    generador = random.Random(semilla)
+    casos = []
+    for num_vars in range(min_vars, max_vars + 1):
+        total = 1 << num_vars
+        for densidad in DENSIDADES:
+            cantidad = max(1, round(total * densidad))
+            # El último minterm asegura que se usen todas las variables sin cambiar la densidad
+            minterms = set(generador.sample(range(total - 1), cantidad - 1)) | {total - 1}
+            casos.append({"nombre": f"aleatoria-{num_vars}-{int(densidad * 100)}", "num_vars": num_vars,
+                          "densidad": densidad, "minterms": sorted(minterms)})
+        if num_vars <= max_vars_paridad:
+            paridad = [m for m in range(total) if bin(m).count("1") % 2]
+            casos.append({"nombre": f"paridad-{num_vars}", "num_vars": num_vars, "densidad": 0.5, "minterms": paridad})
+        casos.append({"nombre": f"cubo-{num_vars}", "num_vars": num_vars, "densidad": 1.0, "minterms": list(range(total)),
+                      "expresion": "1"})
+    return casos
+#------------------------------------------------------------------------------------------------------------------------
+def medir_fases(minterms, NumVars=None):
+    """
+    Ejecuta la minimización completa (quine_mccluskey y result_to_string) y la tabla del MUX, y toma
+    el tiempo de cada fase de las estadísticas de la minimización.
+
+    Args:
+        minterms (list): Minterms de la función.
+        NumVars (int): Número de variables, o None para deducirlo de los minterms.
+
+    Returns:
+        dict: Tiempos por fase en segundos (primes, chart, cover, texto y mux), tamaños de los
+        resultados y la expresión obtenida.
+    """
+    stats = MinimizationStats()
+    terminos, _ = quine_mccluskey(minterms, stats, num_vars=NumVars)
+    with stats.phase("texto"):
+        expresion = result_to_string(terminos)
+    with stats.phase("mux"):
+        TablaMux(minterms, NumVars)
+    return {"fases": dict(stats.phases), "implicantes_primos": stats.chart["prime_implicants"],
+            "cobertura": stats.cover["cover_size"], "expresion": expresion}
+#------------------------------------------------------------------------------------------------------------------------
+def ejecutar_caso(caso, repeticiones=3, memoria=True):
+    """
+    Mide un caso: el menor tiempo de cada fase entre varias repeticiones y, aparte, la memoria pico.
+
+    Args:
+        caso (dict): Caso generado por generar_casos.
+        repeticiones (int): Número de repeticiones para los tiempos.
+        memoria (bool): Si se mide la memoria pico con tracemalloc (en una ejecución adicional).
+
+    Returns:
+        dict: Resultado del caso listo para JSON.
+    """
+    mejores = None
+    for _ in range(repeticiones):
+        medicion = medir_fases(caso["minterms"], caso["num_vars"])
+        if mejores is None:
+            mejores = medicion
+        else:
+            for fase, segundos in medicion["fases"].items():
+                mejores["fases"][fase] = min(mejores["fases"][fase], segundos)
+    resultado = {
+        "nombre": caso["nombre"],
+        "num_vars": count_variables(caso["minterms"]),
+        "densidad": caso["densidad"],
+        "minterms": len(caso["minterms"]),
+        "fases": mejores["fases"],
+        "total": sum(mejores["fases"].values()),
+        "implicantes_primos": mejores["implicantes_primos"],
+        "cobertura": mejores["cobertura"],
+    }
+    if "expresion" in caso:
+        resultado["correcto"] = mejores["expresion"] == caso["expresion"]
+    if memoria:
+        tracemalloc.start()
+        medir_fases(caso["minterms"], caso["num_vars"])
+        resultado["memoria_pico"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return resultado
+#------------------------------------------------------------------------------------------------------------------------
+def comparar(reporte, base, umbral=0.25, minimo=0.005):
+    """
+    Compara un reporte contra una línea base. Una fase es una regresión si tarda más de
+    (1 + umbral) veces lo que tardaba y al menos `minimo` segundos más; también se reporta
+    si la cobertura de un caso crece.
+
+    Args:
+        reporte (dict): Reporte actual.
+        base (dict): Reporte guardado como línea base.
+        umbral (float): Aumento relativo tolerado.
+        minimo (float): Aumento absoluto en segundos por debajo del cual se ignora.
+
+    Returns:
+        list: Mensajes de regresión (vacía si no hay regresiones).
+    """
+    anteriores = {caso["nombre"]: caso for caso in base["casos"]}
+    regresiones = []
+    for caso in reporte["casos"]:
+        anterior = anteriores.get(caso["nombre"])
+        if anterior is None:
+            continue
+        for fase, segundos in caso["fases"].items():
+            antes = anterior["fases"].get(fase)
+            if antes is not None and segundos > antes * (1 + umbral) and segundos - antes > minimo:
+                regresiones.append(f"{caso['nombre']}: fase {fase} {antes:.4f}s -> {segundos:.4f}s")
+        if caso["cobertura"] > anterior["cobertura"]:
+            regresiones.append(f"{caso['nombre']}: cobertura {anterior['cobertura']} -> {caso['cobertura']}")
+    return regresiones
+#------------------------------------------------------------------------------------------------------------------------
+def main(argv=None):
+    """
+    Punto de entrada de los benchmarks.
+
+    Args:
+        argv (list): Argumentos (por defecto sys.argv[1:]).
+
+    Returns:
+        int: Código de salida (1 si algún resultado es incorrecto o hay regresiones respecto a la línea base).
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks de McCluskey y reducción de MUX.")
+    parser.add_argument("--min-vars", type=int, default=4, help="número mínimo de variables")
+    parser.add_argument("--max-vars", type=int, default=20, help="número máximo de variables (hasta 20)")
+    parser.add_argument("--max-vars-paridad", type=int, default=12,
+                        help="número máximo de variables de las funciones de paridad (su tabla crece con 4^n)")
+    parser.add_argument("--rapido", action="store_true",
+                        help=f"corrida corta: hasta {MAX_VARS_RAPIDO} variables y una repetición por caso")
+    parser.add_argument("--semilla", type=int, default=2024, help="semilla de las funciones aleatorias")
+    parser.add_argument("--repeticiones", type=int, default=3, help="repeticiones por caso (se toma el menor tiempo)")
+    parser.add_argument("--sin-memoria", action="store_true", help="no medir la memoria pico")
+    parser.add_argument("--filtro", default="", help="solo ejecutar los casos cuyo nombre contenga este texto")
+    parser.add_argument("--salida", default=None, help="archivo JSON donde guardar el reporte")
+    parser.add_argument("--base", default=None, help="reporte JSON de línea base para comparar")
+    parser.add_argument("--umbral", type=float, default=0.25, help="aumento relativo de tiempo tolerado")
+    args = parser.parse_args(argv)
+    if args.rapido:
+        args.max_vars = min(args.max_vars, MAX_VARS_RAPIDO)
+        args.max_vars_paridad = min(args.max_vars_paridad, MAX_VARS_RAPIDO)
+        args.repeticiones = 1
+
+    reporte = {
+        "meta": {"python": platform.python_version(), "plataforma": platform.platform(),
+                 "semilla": args.semilla, "repeticiones": args.repeticiones, "rapido": args.rapido},
+        "casos": [],
+    }
+    incorrectos = []
+    for caso in generar_casos(args.min_vars, args.max_vars, args.semilla, args.max_vars_paridad):
+        if args.filtro not in caso["nombre"]:
+            continue
+        resultado = ejecutar_caso(caso, args.repeticiones, not args.sin_memoria)
+        reporte["casos"].append(resultado)
+        if not resultado.get("correcto", True):
+            incorrectos.append(resultado["nombre"])
+        fases = "  ".join(f"{fase}={segundos:.4f}s" for fase, segundos in resultado["fases"].items())
+        print(f"{resultado['nombre']:<18} PI={resultado['implicantes_primos']:<6} cobertura={resultado['cobertura']:<6} {fases}",
+              file=sys.stderr)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as salida:
+            json.dump(reporte, salida, indent=2)
+    else:
+        json.dump(reporte, sys.stdout, indent=2)
+        print()
+    for nombre in incorrectos:
+        print(f"ERROR {nombre}: la expresión no es la esperada", file=sys.stderr)
+    regresiones = []
+    if args.base:
+        with open(args.base, encoding="utf-8") as entrada:
+            regresiones = comparar(reporte, json.load(entrada), args.umbral)
+        for mensaje in regresiones:
+            print(f"REGRESIÓN {mensaje}", file=sys.stderr)
+    return 1 if incorrectos or regresiones else 0
+#------------------------------------------------------------------------------------------------------------------------
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""
+Caché de resultados de minimización indexada por una forma canónica de la función.
+La clave es el número de variables más un resumen de la tabla de verdad empaquetada; opcionalmente
+la función se lleva antes a una forma semicanónica bajo permutación y negación de entradas (NP),
+de modo que funciones equivalentes comparten la misma entrada de la caché.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+from collections import OrderedDict
+import numpy as np
+from NucleoMcClusky import count_variables, implicants_to_terms, minimize_implicants
+
+# Función para construir la tabla de verdad de una función
+def truth_table(minterms, num_vars):
+    """
+    Construye la tabla de verdad de la función como vector booleano de 2^num_vars posiciones.
+
+    Parámetros:
+    - minterms: lista de minterms de la función
+    - num_vars: número de variables
+
+    Retorna:
+    - Arreglo booleano de NumPy
+    """
+    table = np.zeros(1 << num_vars, dtype=bool)
+    table[np.asarray(minterms, dtype=np.int64)] = True
+    return table
+
+# Función para calcular una transformación NP semicanónica de la tabla de verdad
+def np_transform(table, num_vars):
+    """
+    Elige una permutación y negación de entradas que lleva funciones equivalentes a la misma tabla
+    en la mayoría de los casos: cada entrada se niega si su cofactor en 0 tiene más 1's que su
+    cofactor en 1, y las entradas se ordenan por ese número de 1's. No es una forma canónica exacta
+    (los empates se resuelven por posición), pero toda transformación retornada es válida.
+
+    Parámetros:
+    - table: tabla de verdad (arreglo booleano)
+    - num_vars: número de variables
+
+    Retorna:
+    - Tuple (perm, negated): la variable canónica j (bit j) corresponde al bit perm[j] original,
+      negado si el bit j de negated está en 1
+    """
+    index = np.arange(1 << num_vars, dtype=np.int64)
+    ones = index[table]
+    weights = []
+    negated_bits = []
+    for bit in range(num_vars):
+        high = int(np.count_nonzero(ones >> bit & 1))  # Minterms con la entrada en 1
+        low = len(ones) - high  # Minterms con la entrada en 0
+        negated_bits.append(low > high)
+        weights.append(max(high, low))
+    perm = sorted(range(num_vars), key=lambda bit: (weights[bit], bit))
+    negated = 0
+    for position, bit in enumerate(perm):
+        if negated_bits[bit]:
+            negated |= 1 << position
+    return perm, negated
+
+# Función para aplicar una transformación NP a una tabla de verdad
+def apply_transform(table, num_vars, perm, negated):
+    """
+    Calcula la tabla g(y) = f(x), donde el bit perm[j] de x es el bit j de y (negado si así lo indica negated).
+
+    Parámetros:
+    - table: tabla de verdad original
+    - num_vars: número de variables
+    - perm: permutación de variables
+    - negated: máscara de variables canónicas negadas
+
+    Retorna:
+    - Tabla de verdad transformada
+    """
+    index = np.arange(1 << num_vars, dtype=np.int64)
+    source = np.zeros_like(index)
+    for position, bit in enumerate(perm):
+        source |= ((index >> position & 1) ^ (negated >> position & 1)) << bit
+    return table[source]
+
+# Función para llevar implicantes de la forma canónica a las variables originales
+def map_implicants(implicants, perm, negated):
+    """
+    Traduce implicantes (valor, máscara) de las variables canónicas a las variables originales.
+
+    Parámetros:
+    - implicants: lista de implicantes sobre las variables canónicas
+    - perm: permutación usada en apply_transform
+    - negated: máscara de negación usada en apply_transform
+
+    Retorna:
+    - Lista de implicantes sobre las variables originales
+    """
+    mapped = []
+    for value, mask in implicants:
+        new_value = new_mask = 0
+        for position, bit in enumerate(perm):
+            if mask >> position & 1:
+                new_mask |= 1 << bit
+            elif (value >> position & 1) ^ (negated >> position & 1):
+                new_value |= 1 << bit
+        mapped.append((new_value, new_mask))
+    return mapped
+
+# Caché LRU en memoria con almacenamiento opcional en disco (sqlite)
+class MinimizationCache:
+    """
+    Caché de resultados de minimize_implicants.
+    Los resultados se guardan para la forma (semi)canónica de la función y se traducen a las
+    variables de quien consulta. La memoria está limitada a `maxsize` entradas (LRU); si se indica
+    `path`, los resultados también se guardan en una base sqlite que pueden compartir varios procesos.
+    `cover_budget` se pasa a minimize_implicants para las funciones que no están en la caché.
+
+    Atributos:
+    - hits, misses, evictions: contadores de aciertos, fallos y desalojos de memoria
+    - disk_hits: aciertos resueltos desde el disco (incluidos en hits)
+    """
+    def __init__(self, maxsize=1024, path=None, canonical=True, max_canonical_vars=24, cover_budget=None):
+        self.maxsize = maxsize
+        self.path = path
+        self.canonical = canonical
+        self.max_canonical_vars = max_canonical_vars
+        self.cover_budget = cover_budget
+        self.hits = self.misses = self.evictions = self.disk_hits = 0
+        self._memory = OrderedDict()
+        self._connection = None
+        self._pid = None
+
+    def stats(self):
+        """
+        Retorna los contadores de la caché como diccionario.
+        """
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "disk_hits": self.disk_hits, "size": len(self._memory)}
+
+    def _database(self):
+        # Cada proceso abre su propia conexión (las conexiones no se comparten tras un fork)
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=30)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS resultados (clave BLOB PRIMARY KEY, implicantes TEXT)")
+            self._pid = os.getpid()
+        return self._connection
+
+    def _remember(self, key, implicants):
+        self._memory[key] = implicants
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)  # Desaloja la entrada usada hace más tiempo
+            self.evictions += 1
+
+    def _lookup(self, key):
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+        if self.path:
+            row = self._database().execute("SELECT implicantes FROM resultados WHERE clave = ?", (key,)).fetchone()
+            if row is not None:
+                implicants = [tuple(implicant) for implicant in json.loads(row[0])]
+                self.disk_hits += 1
+                self._remember(key, implicants)
+                return implicants
+        return None
+
+    def _store(self, key, implicants):
+        self._remember(key, implicants)
+        if self.path:
+            with self._database() as connection:
+                connection.execute("INSERT OR REPLACE INTO resultados VALUES (?, ?)", (key, json.dumps(implicants)))
+
+    def minimize(self, minterms, num_vars=None):
+        """
+        Retorna la cobertura mínima de la función como implicantes (valor, máscara) en sus variables
+        originales, consultando la caché antes de calcularla.
+
+        Parámetros:
+        - minterms: lista de minterms
+        - num_vars: número de variables (por defecto el mínimo necesario)
+
+        Retorna:
+        - Lista de implicantes elegidos
+        """
+        num_vars = num_vars or count_variables(minterms)
+        table = truth_table(minterms, num_vars)
+        perm, negated = list(range(num_vars)), 0
+        if self.canonical and num_vars <= self.max_canonical_vars:
+            perm, negated = np_transform(table, num_vars)
+            table = apply_transform(table, num_vars, perm, negated)
+        digest = hashlib.blake2b(np.packbits(table, bitorder="little").tobytes(), digest_size=20).digest()
+        key = num_vars.to_bytes(2, "little") + digest
+        implicants = self._lookup(key)
+        if implicants is None:
+            self.misses += 1
+            implicants = minimize_implicants(np.flatnonzero(table).tolist(), cover_budget=self.cover_budget)
+            self._store(key, implicants)
+        else:
+            self.hits += 1
+        return map_implicants(implicants, perm, negated)
+
+    def quine_mccluskey(self, minterms):
+        """
+        Equivalente a NucleoMcClusky.quine_mccluskey usando la caché.
+
+        Parámetros:
+        - minterms: lista de minterms para simplificar
+
+        Retorna:
+        - Tuple con la lista de expresiones booleanas simplificadas y el número de variables
+        """
+        num_vars = count_variables(minterms)
+        return implicants_to_terms(self.minimize(minterms, num_vars), num_vars), num_vars
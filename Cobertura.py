@@ -0,0 +1,377 @@
+"""
+Resolución de la tabla de cobertura de implicantes primos.
+Cada fila (implicante) se representa como un entero cuyos bits son las columnas (minterms) que cubre.
+"""
+import heapq
+import time
+import numpy as np
+from Estadisticas import active_progress
+
+# Función para recorrer los índices de los bits en 1 de un entero
+def iter_bits(bitset):
+    """
+    Recorre las posiciones de los bits en 1 de un entero, de menor a mayor.
+
+    Parámetros:
+    - bitset: entero a recorrer
+
+    Retorna:
+    - Generador con los índices de los bits en 1
+    """
+    while bitset:
+        bit = bitset & -bitset  # Bit en 1 menos significativo
+        yield bit.bit_length() - 1
+        bitset ^= bit
+
+# Tabla de cobertura: implicantes (filas) contra minterms (columnas)
+class CoverageChart:
+    """
+    Tabla de cobertura construida de forma vectorizada.
+    Guarda los minterms como arreglo de NumPy, la cobertura empaquetada (8 columnas por byte)
+    y, para cada implicante, un entero con los bits de las columnas que cubre.
+
+    Atributos:
+    - implicants: lista de implicantes (valor, máscara), uno por fila
+    - minterms: arreglo ordenado de minterms distintos, uno por columna
+    - packed: matriz uint8 (filas x columnas/8) con la cobertura empaquetada
+    - rows: lista de enteros con la cobertura de cada fila, lista para solve_cover
+    """
+    def __init__(self, implicants, minterms, packed):
+        self.implicants = implicants
+        self.minterms = minterms
+        self.packed = packed
+        self.rows = [int.from_bytes(row.tobytes(), "little") for row in packed]
+
+    @property
+    def num_columns(self):
+        return len(self.minterms)
+
+    def matrix(self):
+        """
+        Retorna la tabla como matriz booleana (filas x columnas).
+        """
+        return np.unpackbits(self.packed, axis=1, count=self.num_columns, bitorder="little").astype(bool)
+
+    def density(self):
+        """
+        Retorna la fracción de celdas de la tabla que están marcadas.
+        """
+        cells = len(self.implicants) * self.num_columns
+        return sum(row.bit_count() for row in self.rows) / cells if cells else 0.0
+
+# Función para construir la tabla de cobertura de forma vectorizada
+def build_chart(implicants, minterms, block_cells=1 << 22):
+    """
+    Construye la tabla de cobertura probando cada implicante contra todos los minterms a la vez
+    con la condición (m & ~máscara) == valor. Los implicantes se procesan por bloques para
+    limitar la memoria de la matriz intermedia.
+
+    Parámetros:
+    - implicants: lista de implicantes (valor, máscara)
+    - minterms: minterms de la función (lista o arreglo, puede tener repetidos)
+    - block_cells: número máximo de celdas booleanas evaluadas por bloque
+
+    Retorna:
+    - CoverageChart con la cobertura de cada implicante
+    """
+    columns = np.unique(np.asarray(minterms, dtype=np.int64))  # Columnas ordenadas y sin repetir
+    implicants = list(implicants)
+    values = np.array([value for value, _ in implicants], dtype=np.int64)
+    masks = np.array([mask for _, mask in implicants], dtype=np.int64)
+    packed = np.zeros((len(implicants), (len(columns) + 7) // 8), dtype=np.uint8)
+    block = max(1, block_cells // max(1, len(columns)))  # Filas por bloque
+    progress = active_progress()
+    for start in range(0, len(implicants), block):
+        if progress is not None:
+            progress("chart", start, len(implicants))
+        stop = start + block
+        hits = (columns[None, :] & ~masks[start:stop, None]) == values[start:stop, None]
+        packed[start:stop] = np.packbits(hits, axis=1, bitorder="little")
+    return CoverageChart(implicants, columns, packed)
+
+# Función para construir las columnas (implicantes que cubren cada minterm) a partir de las filas
+def transpose(rows, num_columns):
+    """
+    Transpone la tabla de cobertura: para cada columna obtiene el conjunto de filas que la cubren.
+
+    Parámetros:
+    - rows: lista de enteros, uno por fila, con las columnas que cubre
+    - num_columns: número de columnas de la tabla
+
+    Retorna:
+    - Lista de enteros, uno por columna, con las filas que la cubren
+    """
+    columns = [0] * num_columns
+    progress = active_progress()
+    for index, row in enumerate(rows):
+        if progress is not None and not index & 255:
+            progress("cover", index, len(rows))  # También es un punto de cancelación
+        row_bit = 1 << index
+        for column in iter_bits(row):
+            columns[column] |= row_bit
+    return columns
+
+# Función para extraer los implicantes primos esenciales
+def essential_rows(rows, columns, active_rows, uncovered):
+    """
+    Busca las filas esenciales: aquellas que son la única fila activa que cubre alguna columna pendiente.
+    Después de la reducción por dominancia una fila puede quedar como única opción de una columna.
+
+    Parámetros:
+    - rows: lista de filas (bitsets de columnas)
+    - columns: lista de columnas (bitsets de filas)
+    - active_rows: bitset de filas todavía candidatas
+    - uncovered: bitset de las columnas aún sin cubrir
+
+    Retorna:
+    - Lista de índices de filas esenciales, sin repetir
+    """
+    essentials = []
+    found = 0  # Bitset de filas esenciales ya encontradas
+    for column in iter_bits(uncovered):
+        candidates = columns[column] & active_rows
+        if candidates and not candidates & (candidates - 1) and not candidates & found:
+            found |= candidates  # Solo una fila cubre esta columna
+            essentials.append(candidates.bit_length() - 1)
+    return essentials
+
+# Función para eliminar filas y columnas dominadas
+def reduce_dominance(rows, columns, active_rows, uncovered):
+    """
+    Aplica la reducción por dominancia sobre la parte activa de la tabla.
+    Una fila cuyas columnas pendientes están contenidas en las de otra fila se descarta;
+    una columna cuyas filas contienen a las de otra columna se descarta, porque cubrir la otra basta.
+
+    Parámetros:
+    - rows: lista de filas (bitsets de columnas)
+    - columns: lista de columnas (bitsets de filas)
+    - active_rows: bitset de filas todavía candidatas
+    - uncovered: bitset de columnas aún sin cubrir
+
+    Retorna:
+    - Tuple (active_rows, uncovered) reducidos
+    """
+    progress = active_progress()
+    total = active_rows.bit_count() + uncovered.bit_count()
+    # Dominancia de filas: se compara solo contra las filas de la columna más restrictiva
+    for position, row in enumerate(iter_bits(active_rows)):
+        if progress is not None and not position & 255:
+            progress("cover", position, total)
+        own = rows[row] & uncovered
+        if not own:
+            active_rows &= ~(1 << row)  # La fila ya no cubre nada pendiente
+            continue
+        pivot = min(iter_bits(own), key=lambda column: (columns[column] & active_rows).bit_count())
+        for other in iter_bits(columns[pivot] & active_rows & ~(1 << row)):
+            other_cover = rows[other] & uncovered
+            if own & ~other_cover == 0 and (own != other_cover or other < row):
+                active_rows &= ~(1 << row)  # La fila está dominada por otra
+                break
+    # Dominancia de columnas: se compara solo contra las columnas de la fila más restrictiva
+    offset = total - uncovered.bit_count()
+    for position, column in enumerate(iter_bits(uncovered)):
+        if progress is not None and not position & 255:
+            progress("cover", offset + position, total)
+        own = columns[column] & active_rows
+        if not own:
+            continue
+        pivot = min(iter_bits(own), key=lambda row: (rows[row] & uncovered).bit_count())
+        for other in iter_bits(rows[pivot] & uncovered & ~(1 << column)):
+            other_rows = columns[other] & active_rows
+            if other_rows & ~own == 0 and (own != other_rows or other < column):
+                uncovered &= ~(1 << column)  # Cubrir la otra columna cubre también esta
+                break
+    return active_rows, uncovered
+
+# Función para resolver la cobertura de forma voraz con conteos incrementales
+def greedy_cover(rows, columns, active_rows, uncovered):
+    """
+    Elige filas de forma voraz, siempre la que cubre más columnas pendientes.
+    Los conteos se actualizan de forma incremental al cubrir cada columna.
+
+    Parámetros:
+    - rows: lista de filas (bitsets de columnas)
+    - columns: lista de columnas (bitsets de filas)
+    - active_rows: bitset de filas candidatas
+    - uncovered: bitset de columnas a cubrir
+
+    Retorna:
+    - Lista de índices de las filas elegidas, o None si alguna columna no se puede cubrir
+    """
+    counts = {row: (rows[row] & uncovered).bit_count() for row in iter_bits(active_rows)}
+    heap = [(-count, row) for row, count in counts.items() if count]
+    heapq.heapify(heap)
+    chosen = []
+    progress = active_progress()
+    total, steps = uncovered.bit_count(), 0
+    while uncovered:
+        if progress is not None and not steps & 255:
+            progress("cover", total - uncovered.bit_count(), total)
+        steps += 1
+        if not heap:
+            return None  # Quedan columnas que ninguna fila cubre
+        count, row = heapq.heappop(heap)
+        if -count != counts[row]:
+            if counts[row]:
+                heapq.heappush(heap, (-counts[row], row))  # Conteo desactualizado, se reinserta
+            continue
+        chosen.append(row)
+        newly_covered = rows[row] & uncovered
+        uncovered &= ~newly_covered
+        for column in iter_bits(newly_covered):
+            for other in iter_bits(columns[column] & active_rows):
+                counts[other] -= 1  # Actualización incremental de los conteos
+    return chosen
+
+# Función para eliminar filas redundantes de una cobertura
+def remove_redundant(rows, chosen, target):
+    """
+    Elimina de la cobertura las filas cuyas columnas ya quedan cubiertas por las demás filas elegidas.
+    Se lleva la cuenta de cuántas filas elegidas cubren cada columna para no recalcular uniones.
+
+    Parámetros:
+    - rows: lista de filas (bitsets de columnas)
+    - chosen: lista de índices de filas elegidas
+    - target: bitset de columnas que deben quedar cubiertas
+
+    Retorna:
+    - Lista de índices sin filas redundantes, en el mismo orden
+    """
+    cover_count = {}  # Número de filas elegidas que cubren cada columna
+    progress = active_progress()
+    for position, row in enumerate(chosen):
+        if progress is not None and not position & 255:
+            progress("cover", position, 2 * len(chosen))
+        for column in iter_bits(rows[row] & target):
+            cover_count[column] = cover_count.get(column, 0) + 1
+    redundant = set()
+    for position, row in enumerate(sorted(chosen, key=lambda index: (rows[index] & target).bit_count())):
+        if progress is not None and not position & 255:
+            progress("cover", len(chosen) + position, 2 * len(chosen))
+        own = list(iter_bits(rows[row] & target))
+        if all(cover_count[column] > 1 for column in own):
+            redundant.add(row)  # El resto de filas ya cubre todas sus columnas
+            for column in own:
+                cover_count[column] -= 1
+    return [row for row in chosen if row not in redundant]
+
+# Cota inferior: columnas que no comparten ninguna fila necesitan filas distintas
+def _lower_bound(rows, columns, active_rows, uncovered):
+    used_rows = 0
+    bound = 0
+    for column in sorted(iter_bits(uncovered), key=lambda c: (columns[c] & active_rows).bit_count()):
+        candidates = columns[column] & active_rows
+        if not candidates & used_rows:
+            used_rows |= candidates
+            bound += 1
+    return bound
+
+# Función para resolver la cobertura mínima de forma exacta con ramificación y poda
+def exact_cover(rows, columns, active_rows, uncovered, best, time_limit=1.0, node_limit=100000, stats=None):
+    """
+    Busca una cobertura de tamaño mínimo con ramificación y poda, partiendo de una solución conocida.
+    Si se agota el presupuesto de tiempo o de nodos, retorna la mejor solución encontrada hasta ese momento.
+
+    Parámetros:
+    - rows: lista de filas (bitsets de columnas)
+    - columns: lista de columnas (bitsets de filas)
+    - active_rows: bitset de filas candidatas
+    - uncovered: bitset de columnas a cubrir
+    - best: cobertura inicial (por ejemplo la voraz) usada como cota superior
+    - time_limit: tiempo máximo de búsqueda en segundos
+    - node_limit: número máximo de nodos a explorar
+    - stats: diccionario opcional donde se guarda el número de nodos explorados (exact_nodes)
+
+    Retorna:
+    - Tuple (cobertura, exacta) con la mejor lista de filas y si la búsqueda terminó sin agotar el presupuesto
+    """
+    deadline = time.perf_counter() + time_limit
+    state = {"best": list(best), "nodes": 0, "complete": True}
+    progress = active_progress()
+
+    def branch(pending, chosen):
+        state["nodes"] += 1
+        if progress is not None and not state["nodes"] & 255:
+            progress("cover", state["nodes"], node_limit)
+        if state["nodes"] > node_limit or time.perf_counter() > deadline:
+            state["complete"] = False
+            return
+        if not pending:
+            if len(chosen) < len(state["best"]):
+                state["best"] = list(chosen)  # Nueva mejor solución
+            return
+        if len(chosen) + _lower_bound(rows, columns, active_rows, pending) >= len(state["best"]):
+            return  # No puede mejorar la mejor solución conocida
+        # Se ramifica sobre la columna con menos filas candidatas
+        column = min(iter_bits(pending), key=lambda c: (columns[c] & active_rows).bit_count())
+        candidates = sorted(iter_bits(columns[column] & active_rows), key=lambda r: -(rows[r] & pending).bit_count())
+        for row in candidates:
+            chosen.append(row)
+            branch(pending & ~rows[row], chosen)
+            chosen.pop()
+            if not state["complete"]:
+                return
+
+    branch(uncovered, [])
+    if stats is not None:
+        stats["exact_nodes"] = state["nodes"]
+    return state["best"], state["complete"]
+
+# Función principal para resolver la tabla de cobertura
+def solve_cover(rows, num_columns, time_limit=1.0, node_limit=100000, size_limit=500, stats=None):
+    """
+    Resuelve la tabla de cobertura en tres etapas: extracción de esenciales y reducción por dominancia
+    (repetidas hasta que la tabla no cambia), y búsqueda exacta con ramificación y poda sobre el núcleo
+    cíclico restante. Si la búsqueda excede el presupuesto se usa la mejor cobertura voraz encontrada.
+
+    Parámetros:
+    - rows: lista de enteros, uno por implicante, con los bits de las columnas (minterms) que cubre
+    - num_columns: número de columnas de la tabla
+    - time_limit: tiempo máximo en segundos para la búsqueda exacta
+    - node_limit: número máximo de nodos para la búsqueda exacta
+    - size_limit: tamaño máximo de la cobertura voraz del núcleo cíclico para intentar la búsqueda exacta
+    - stats: diccionario opcional donde se guardan essentials, reduction_iterations, greedy_picks,
+      exact_nodes, exact_complete y cover_size
+
+    Retorna:
+    - Lista de índices de filas elegidas (primero las esenciales), o None si alguna columna no se puede cubrir
+    """
+    columns = transpose(rows, num_columns)
+    uncovered = (1 << num_columns) - 1  # Todas las columnas pendientes
+    active_rows = (1 << len(rows)) - 1  # Todas las filas candidatas
+    if any(column == 0 for column in columns):
+        return None  # Hay minterms que ningún implicante cubre
+    chosen = []
+    iterations = 0  # Rondas de extracción de esenciales y reducción por dominancia
+    progress = active_progress()
+    while uncovered:
+        iterations += 1
+        if progress is not None:
+            progress("cover", 0, node_limit)
+        essentials = essential_rows(rows, columns, active_rows, uncovered)
+        for row in essentials:
+            chosen.append(row)
+            uncovered &= ~rows[row]
+            active_rows &= ~(1 << row)
+        reduced_rows, reduced_uncovered = reduce_dominance(rows, columns, active_rows, uncovered)
+        if not essentials and reduced_rows == active_rows and reduced_uncovered == uncovered:
+            break  # Núcleo cíclico: la tabla ya no se reduce
+        active_rows, uncovered = reduced_rows, reduced_uncovered
+    if stats is not None:
+        stats.update(essentials=len(chosen), reduction_iterations=iterations, greedy_picks=0,
+                     exact_nodes=0, exact_complete=True)
+    if uncovered:
+        greedy = greedy_cover(rows, columns, active_rows, uncovered)
+        core = remove_redundant(rows, greedy, uncovered)
+        if stats is not None:
+            stats["greedy_picks"] = len(greedy)
+        if len(core) <= size_limit:
+            core, complete = exact_cover(rows, columns, active_rows, uncovered, core, time_limit, node_limit, stats)
+            if stats is not None:
+                stats["exact_complete"] = complete
+        elif stats is not None:
+            stats["exact_complete"] = False
+        chosen.extend(core)
+    if stats is not None:
+        stats["cover_size"] = len(chosen)
+    return chosen
@@ -0,0 +1,203 @@
+"""
+Rondas de combinación de McCluskey repartidas en un grupo de procesos.
+Los términos de cada ronda se guardan en memoria compartida como claves (máscara << 32 | valor) ordenadas
+por número de 1's. Cada proceso recibe solo los rangos de un par de grupos adyacentes, marca en el arreglo
+compartido los términos que se combinaron y retorna los términos nuevos, que se unen y deduplican antes
+de la ronda siguiente.
+"""
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+import numpy as np
+from Estadisticas import active_progress
+
+VALUE_BITS = 32  # La máscara va en los bits altos de la clave
+MAX_VARS = 31  # Con más variables la clave no cabe en un int64
+MIN_TERMS = 20000  # Por debajo de este número de términos la ronda se hace en el proceso actual
+BYTE_ONES = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)  # Número de 1's de cada byte
+
+# Función para contar los 1's de cada elemento de un arreglo
+def count_ones_array(values):
+    """
+    Cuenta los bits en 1 de cada elemento con una tabla por byte (np.bitwise_count requiere NumPy 2).
+
+    Parámetros:
+    - values: arreglo de enteros no negativos
+
+    Retorna:
+    - Arreglo int64 con el número de 1's de cada elemento
+    """
+    values = np.ascontiguousarray(values, dtype=np.int64)
+    return BYTE_ONES[values.view(np.uint8)].reshape(-1, 8).sum(axis=1, dtype=np.int64)
+
+# Función para combinar los términos de un grupo con los del grupo anterior
+def combine_pair(keys, checked, lower, upper, num_vars):
+    """
+    Combina cada término del rango upper con los términos del rango lower que difieren en un solo bit.
+    Los dos rangos pertenecen a grupos adyacentes (upper tiene un 1 más) y lower está ordenado.
+
+    Parámetros:
+    - keys: arreglo de claves (máscara << 32 | valor) de la ronda
+    - checked: arreglo uint8 donde se marcan con 1 los términos combinados
+    - lower: rango (inicio, fin) del grupo con un 1 menos
+    - upper: rango (inicio, fin) de los términos a combinar
+    - num_vars: número de variables
+
+    Retorna:
+    - Tuple con las claves nuevas (sin repetir), el número de combinaciones y el número de comparaciones
+    """
+    lower_keys = keys[lower[0]:lower[1]]
+    upper_keys = keys[upper[0]:upper[1]]
+    produced = []
+    merges = comparisons = 0
+    for position in range(num_vars):
+        bit = np.int64(1 << position)
+        candidates = np.flatnonzero(upper_keys & bit)  # El bit en 1 puede volverse guion
+        if not len(candidates):
+            continue
+        comparisons += len(candidates)
+        neighbors = upper_keys[candidates] ^ bit
+        found = np.searchsorted(lower_keys, neighbors)
+        found[found == len(lower_keys)] = 0
+        matches = lower_keys[found] == neighbors
+        if not matches.any():
+            continue
+        merges += int(matches.sum())
+        checked[upper[0] + candidates[matches]] = 1
+        checked[lower[0] + found[matches]] = 1
+        produced.append(neighbors[matches] | (bit << VALUE_BITS))
+    new_keys = np.unique(np.concatenate(produced)) if produced else np.empty(0, dtype=np.int64)
+    return new_keys, merges, comparisons
+
+# Función que ejecuta un proceso trabajador sobre la memoria compartida de la ronda
+def _combine_shared(name, length, lower, upper, num_vars):
+    memory = shared_memory.SharedMemory(name=name)  # Solo el proceso principal libera el bloque
+    try:
+        keys = np.ndarray(length, dtype=np.int64, buffer=memory.buf)
+        checked = np.ndarray(length, dtype=np.uint8, buffer=memory.buf, offset=8 * length)
+        result = combine_pair(keys, checked, lower, upper, num_vars)
+        del keys, checked  # Las vistas deben soltarse antes de cerrar el bloque
+        return result
+    finally:
+        memory.close()
+
+# Función para repartir los pares de grupos adyacentes de una ronda
+def split_pairs(boundaries, shards):
+    """
+    Arma las tareas de una ronda: un par (grupo anterior, parte del grupo) por cada grupo con vecino.
+    Los grupos grandes se parten para que haya alrededor de `shards` tareas del mismo tamaño.
+
+    Parámetros:
+    - boundaries: diccionario número de 1's -> rango (inicio, fin) del grupo en el arreglo de claves
+    - shards: número aproximado de tareas
+
+    Retorna:
+    - Lista de pares (rango del grupo anterior, rango de términos a combinar)
+    """
+    pairs = [(boundaries[ones - 1], boundaries[ones]) for ones in sorted(boundaries) if ones - 1 in boundaries]
+    total = sum(upper[1] - upper[0] for _, upper in pairs)
+    size = max(1, -(-total // max(1, shards)))
+    tasks = []
+    for lower, (start, end) in pairs:
+        for piece in range(start, end, size):
+            tasks.append((lower, (piece, min(piece + size, end))))
+    return tasks
+
+# Función para ordenar las claves de una ronda por grupo
+def group_keys(keys):
+    """
+    Ordena las claves por número de 1's del valor y después por clave.
+
+    Parámetros:
+    - keys: arreglo de claves sin repetir
+
+    Retorna:
+    - Tuple con las claves ordenadas y el diccionario número de 1's -> rango (inicio, fin)
+    """
+    ones = count_ones_array(keys & ((1 << VALUE_BITS) - 1))
+    order = np.lexsort((keys, ones))
+    keys, ones = keys[order], ones[order]
+    present, starts = np.unique(ones, return_index=True)
+    ends = np.append(starts[1:], len(keys))
+    return keys, {int(count): (int(start), int(end)) for count, start, end in zip(present, starts, ends)}
+
+# Función para generar los implicantes primos con las rondas repartidas en procesos
+def parallel_prime_implicants(minterms, num_vars, workers, stats=None, min_terms=MIN_TERMS):
+    """
+    Genera los implicantes primos igual que find_prime_implicants, pero cada ronda reparte sus pares de
+    grupos adyacentes en un grupo de procesos. Las rondas con menos de `min_terms` términos se combinan
+    en el proceso actual, y el grupo de procesos solo se crea si alguna ronda lo necesita.
+
+    Parámetros:
+    - minterms: minterms de la función (incluidos los don't care)
+    - num_vars: número de variables (a lo más MAX_VARS)
+    - workers: número de procesos
+    - stats: MinimizationStats opcional donde se registra cada ronda de combinación
+    - min_terms: número de términos desde el que una ronda se reparte
+
+    Retorna:
+    - Conjunto de implicantes primos como pares (valor, máscara)
+    """
+    if num_vars > MAX_VARS:
+        raise ValueError(f"la combinación en paralelo admite a lo más {MAX_VARS} variables")
+    keys, boundaries = group_keys(np.unique(np.asarray(minterms, dtype=np.int64)))
+    primes = []
+    progress = active_progress()
+    total_rounds = max(boundaries, default=0) + 1
+    round_index = 0
+    pool = None
+    try:
+        while len(keys):
+            start = time.perf_counter() if stats is not None else 0.0
+            tasks = split_pairs(boundaries, 4 * workers)
+            results = []
+            if len(keys) < min_terms:
+                checked = np.zeros(len(keys), dtype=np.uint8)
+                for done, (lower, upper) in enumerate(tasks):
+                    if progress is not None:
+                        progress("primes", round_index + done / len(tasks), total_rounds)
+                    results.append(combine_pair(keys, checked, lower, upper, num_vars))
+            else:
+                if pool is None:
+                    pool = ProcessPoolExecutor(max_workers=workers)
+                memory = shared_memory.SharedMemory(create=True, size=9 * len(keys))
+                shared = np.ndarray(len(keys), dtype=np.int64, buffer=memory.buf)
+                flags = np.ndarray(len(keys), dtype=np.uint8, buffer=memory.buf, offset=8 * len(keys))
+                try:
+                    shared[:] = keys
+                    flags[:] = 0
+                    pending = {pool.submit(_combine_shared, memory.name, len(keys), lower, upper, num_vars)
+                               for lower, upper in tasks}
+                    while pending:
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        results.extend(future.result() for future in finished)
+                        if progress is not None:
+                            progress("primes", round_index + len(results) / len(tasks), total_rounds)
+                    checked = flags.copy()
+                except BaseException:
+                    # Ningún trabajador debe seguir usando el bloque cuando se libera
+                    pool.shutdown(cancel_futures=True)
+                    pool = None
+                    raise
+                finally:
+                    del shared, flags  # Las vistas deben soltarse antes de cerrar el bloque
+                    memory.close()
+                    memory.unlink()
+            # Agrega términos no combinados a los implicantes primos
+            primes.append(keys[checked == 0])
+            produced = [new_keys for new_keys, _, _ in results if len(new_keys)]
+            following = np.unique(np.concatenate(produced)) if produced else np.empty(0, dtype=np.int64)
+            if stats is not None:
+                merges = sum(merges for _, merges, _ in results)
+                comparisons = sum(comparisons for _, _, comparisons in results)
+                stats.add_round(len(keys), comparisons, merges, merges - len(following), len(following),
+                                time.perf_counter() - start)
+            keys, boundaries = group_keys(following)
+            round_index += 1
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    primes = np.concatenate(primes) if primes else np.empty(0, dtype=np.int64)
+    values = (primes & ((1 << VALUE_BITS) - 1)).tolist()
+    masks = (primes >> VALUE_BITS).tolist()
+    return set(zip(values, masks))
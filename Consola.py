@@ -0,0 +1,158 @@
+"""
+Interfaz de línea de comandos para procesar muchas funciones sin interfaz gráfica.
+Lee un conjunto de minterms por línea (desde archivos o la entrada estándar) y escribe
+un resultado JSON por línea. Con --formato también lee una tabla de verdad hexadecimal por línea,
+mapas de bits empaquetados (una función por archivo) o archivos PLA (una función por salida).
+
+Uso:
+    python Consola.py [--modo ambos|mcclusky|mux] [--metodo mcclusky|espresso|bdd] [--procesos N] [--timeout S]
+                      [--cache RUTA] [--formato lineas|hex|mapa|pla] [archivo ...]
+"""
+import argparse
+import itertools
+import json
+import sys
+from Formatos import cargar_mapa_bits, leer_pla, minterms_desde_verdad, verdad_desde_hex, verdad_desde_mapa
+from Lotes import minimize_many
+
+#------------------------------------------------------------------------------------------------------------------------
+def leer_lineas(archivos):
+    """
+    Recorre las líneas de los archivos indicados sin cargarlos completos en memoria.
+    Un nombre "-" (o ninguna ruta) significa la entrada estándar.
+
+    Args:
+        archivos (list): Rutas de los archivos a leer.
+
+    Yields:
+        tuple: (origen, numero_linea, texto) por cada línea leída.
+    """
+    for archivo in archivos or ["-"]:
+        if archivo == "-":
+            for numero, linea in enumerate(sys.stdin, 1):
+                yield "-", numero, linea
+        else:
+            with open(archivo, encoding="utf-8") as entrada:
+                for numero, linea in enumerate(entrada, 1):
+                    yield archivo, numero, linea
+#------------------------------------------------------------------------------------------------------------------------
+def funcion_desde_verdad(Verdad):
+    """
+    Convierte una tabla de verdad en la tarea (minterms, don't care, número de variables), conservando
+    el ancho de la tabla aunque las variables más significativas no aparezcan en los minterms.
+
+    Args:
+        Verdad (numpy.ndarray): Vector booleano de 2^NumVars posiciones.
+
+    Returns:
+        tuple: (minterms, None, NumVars).
+    """
+    return minterms_desde_verdad(Verdad), None, len(Verdad).bit_length() - 1
+#------------------------------------------------------------------------------------------------------------------------
+def leer_funciones(archivos, formato="lineas"):
+    """
+    Recorre las funciones de los archivos según su formato. Las líneas de texto se entregan sin
+    convertir (se ignoran después si están vacías); las tablas y mapas se entregan como arreglos, y las
+    salidas de un PLA como sus cubos, sin expandir. Un PLA inválido se entrega como la excepción de
+    su lectura, que procesar reporta como error.
+
+    Args:
+        archivos (list): Rutas de los archivos a leer ("-" para la entrada estándar en los formatos de texto).
+        formato (str): "lineas" (minterms y rangos), "hex" (tabla de verdad hexadecimal por línea),
+            "mapa" (mapa de bits empaquetado por archivo) o "pla" (archivo de cubos, una función por salida).
+
+    Yields:
+        tuple: (origen, numero, elemento); numero es la línea, o la salida (desde 1) en los archivos PLA
+        (None si el archivo no se pudo leer).
+    """
+    if formato == "lineas":
+        yield from leer_lineas(archivos)
+    elif formato == "hex":
+        for origen, numero, linea in leer_lineas(archivos):
+            linea = linea.strip()
+            if linea and not linea.startswith("#"):
+                yield origen, numero, funcion_desde_verdad(verdad_desde_hex(linea))
+    elif formato == "mapa":
+        for archivo in archivos:
+            yield archivo, 1, funcion_desde_verdad(verdad_desde_mapa(cargar_mapa_bits(archivo)))
+    elif formato == "pla":
+        for archivo in archivos:
+            try:
+                pla = leer_pla(archivo)
+            except ValueError as error:
+                yield archivo, None, error  # Se reporta como un registro de error sin detener los demás archivos
+                continue
+            for salida, (on, dc) in enumerate(zip(pla["on"], pla["dc"]), 1):
+                yield archivo, salida, {"on": on, "dc": dc, "num_vars": pla["num_vars"]}
+    else:
+        raise ValueError(f"formato desconocido: {formato}")
+#------------------------------------------------------------------------------------------------------------------------
+def procesar(lineas, salida, modo="ambos", procesos=0, timeout=None, chunksize=64, cache=None, metodo="mcclusky"):
+    """
+    Procesa un flujo de líneas de minterms y escribe un objeto JSON por cada línea no vacía,
+    en el mismo orden de la entrada. Las líneas vacías o que empiezan con '#' se ignoran.
+    Un error en una línea se reporta en su propio objeto JSON y no detiene el procesamiento.
+
+    Args:
+        lineas (iterable): Tuplas (origen, numero_linea, elemento) de leer_funciones; el elemento es
+            texto, minterms ya convertidos, cubos de un PLA o el error con que falló su lectura.
+        salida (file): Archivo de texto donde se escriben los resultados.
+        modo (str): "mcclusky", "mux" o "ambos".
+        procesos (int): Número de procesos trabajadores (0 procesa en el proceso actual).
+        timeout (float): Límite de tiempo por línea en segundos, o None.
+        chunksize (int): Número de líneas por bloque enviado a cada proceso.
+        cache (str): Ruta de la caché de resultados en disco ("" solo en memoria), o None.
+        metodo (str): Motor de minimización: "mcclusky", "espresso" o "bdd".
+
+    Returns:
+        int: Número de líneas que produjeron error.
+    """
+    origenes = {}  # Origen y número de línea de cada tarea pendiente, por índice de tarea
+    contador = itertools.count()
+
+    def tareas():
+        for origen, numero, elemento in lineas:
+            if isinstance(elemento, str):
+                elemento = elemento.strip()
+                if not elemento or elemento.startswith("#"):
+                    continue
+            origenes[next(contador)] = (origen, numero)
+            yield elemento
+
+    errores = 0
+    for indice, resultado in minimize_many(tareas(), workers=procesos, chunksize=chunksize, timeout=timeout, modo=modo,
+                                           cache=cache, metodo=metodo):
+        origen, numero = origenes.pop(indice)
+        registro = {"origen": origen, "linea": numero}
+        registro.update(resultado)
+        errores += "error" in resultado
+        salida.write(json.dumps(registro, ensure_ascii=False) + "\n")
+    return errores
+#------------------------------------------------------------------------------------------------------------------------
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos.
+
+    Args:
+        argv (list): Argumentos (por defecto sys.argv[1:]).
+
+    Returns:
+        int: Código de salida (0 si todas las líneas se procesaron sin error).
+    """
+    parser = argparse.ArgumentParser(description="Minimización de McCluskey y reducción de MUX por lotes (JSON por línea).")
+    parser.add_argument("archivos", nargs="*", help="archivos con un conjunto de minterms por línea ('-' para la entrada estándar)")
+    parser.add_argument("--modo", choices=["ambos", "mcclusky", "mux"], default="ambos", help="análisis a realizar")
+    parser.add_argument("--metodo", choices=["mcclusky", "espresso", "bdd"], default="mcclusky",
+                        help="motor de minimización (espresso y bdd sirven para funciones grandes)")
+    parser.add_argument("--procesos", type=int, default=0, help="procesos trabajadores (0: en el proceso actual)")
+    parser.add_argument("--timeout", type=float, default=None, help="límite de tiempo por línea en segundos")
+    parser.add_argument("--chunksize", type=int, default=64, help="líneas por bloque enviado a cada proceso")
+    parser.add_argument("--formato", choices=["lineas", "hex", "mapa", "pla"], default="lineas",
+                        help="formato de entrada: minterms y rangos, tabla hexadecimal, mapa de bits o PLA")
+    parser.add_argument("--cache", default=None, help="base sqlite para la caché de resultados ('' solo en memoria)")
+    args = parser.parse_args(argv)
+    errores = procesar(leer_funciones(args.archivos, args.formato), sys.stdout, args.modo, args.procesos, args.timeout, args.chunksize, args.cache, args.metodo)
+    return 1 if errores else 0
+#------------------------------------------------------------------------------------------------------------------------
+if __name__ == "__main__":
+    sys.exit(main())
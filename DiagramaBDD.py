@@ -0,0 +1,436 @@
+"""
+Diagramas de decisión binarios reducidos y ordenados (ROBDD) para funciones demasiado grandes para
+la tabla de McCluskey. Incluye la construcción desde minterms, cubos o archivos de tabla de verdad,
+la extracción de una suma de productos irredundante (ISOP de Minato-Morreale) y las consultas de
+residuos del MUX reducido sin recorrer las 2^n entradas.
+"""
+import bisect
+from collections import OrderedDict
+import numpy as np
+from Estadisticas import active_progress
+from NucleoMcClusky import implicants_to_terms
+
+PROGRESS_STEP = 4096  # Nodos nuevos o fallos de caché entre avisos de avance
+
+# Diagrama de decisión binario reducido y ordenado
+class BDD:
+    """
+    Administrador de nodos ROBDD compartidos por todas las funciones de `num_vars` variables.
+    Los nodos se identifican con enteros: 0 es la constante falsa y 1 la verdadera. Cada nodo se guarda
+    una sola vez gracias a la tabla única (hash-consing), y los resultados de las operaciones se guardan
+    en una caché LRU limitada a `cache_size` entradas.
+    La variable 0 es A, que corresponde al bit más significativo del minterm, como en el resto del proyecto.
+
+    Atributos:
+    - num_vars: número de variables
+    - order: orden de las variables de la raíz a las hojas (lista de índices, A = 0)
+    - cache_hits, cache_misses, evictions: contadores de la caché de operaciones
+    - stage, stages: etapa actual y número de etapas que se informan en los avisos de avance
+    """
+    def __init__(self, num_vars, order=None, cache_size=1 << 18):
+        self.num_vars = num_vars
+        self.order = list(order) if order is not None else list(range(num_vars))
+        if sorted(self.order) != list(range(num_vars)):
+            raise ValueError("order debe ser una permutación de las variables")
+        self.level_of = {var: level for level, var in enumerate(self.order)}
+        self.cache_size = cache_size
+        self.cache_hits = self.cache_misses = self.evictions = 0
+        self.stage, self.stages = 0, 1
+        self._level = [num_vars, num_vars]  # Nivel de cada nodo; los terminales están debajo de todos
+        self._low = [0, 1]
+        self._high = [0, 1]
+        self._unique = {}  # (nivel, bajo, alto) -> nodo
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self._level)
+
+    # Crea (o reutiliza) el nodo de un nivel con sus dos hijos
+    def mk(self, level, low, high):
+        if low == high:
+            return low  # El nodo sería redundante
+        key = (level, low, high)
+        node = self._unique.get(key)
+        if node is None:
+            node = len(self._level)
+            self._level.append(level)
+            self._low.append(low)
+            self._high.append(high)
+            self._unique[key] = node
+            if not node % PROGRESS_STEP:
+                self._report()
+        return node
+
+    # Avisa el avance durante las operaciones largas, para que se puedan cancelar
+    def _report(self):
+        progress = active_progress()
+        if progress is not None:
+            progress("bdd", self.stage, self.stages)
+
+    def _cache_get(self, key):
+        value = self._cache.get(key)
+        if value is None:
+            self.cache_misses += 1
+        else:
+            self.cache_hits += 1
+            self._cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, key, value):
+        self._cache[key] = value
+        if not self.cache_misses % PROGRESS_STEP:
+            self._report()
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+            self.evictions += 1
+
+    def var(self, index, positive=True):
+        """
+        Retorna el nodo del literal de la variable `index` (negado si positive es False).
+        """
+        level = self.level_of[index]
+        return self.mk(level, 0, 1) if positive else self.mk(level, 1, 0)
+
+    # Cofactores de un nodo respecto al nivel indicado
+    def _cofactors(self, node, level):
+        if self._level[node] == level:
+            return self._low[node], self._high[node]
+        return node, node
+
+    def apply(self, op, u, v):
+        """
+        Aplica una operación binaria ("and", "or" o "xor") a dos funciones.
+
+        Parámetros:
+        - op: nombre de la operación
+        - u, v: nodos de las funciones
+
+        Retorna:
+        - Nodo del resultado
+        """
+        if op == "and":
+            if u == 0 or v == 0:
+                return 0
+            if u == 1:
+                return v
+            if v == 1 or u == v:
+                return u
+        elif op == "or":
+            if u == 1 or v == 1:
+                return 1
+            if u == 0:
+                return v
+            if v == 0 or u == v:
+                return u
+        elif op == "xor":
+            if u == v:
+                return 0
+            if u == 0:
+                return v
+            if v == 0:
+                return u
+        else:
+            raise ValueError(f"operación desconocida: {op}")
+        if u > v:
+            u, v = v, u  # Las tres operaciones son conmutativas
+        key = (op, u, v)
+        result = self._cache_get(key)
+        if result is None:
+            level = min(self._level[u], self._level[v])
+            u0, u1 = self._cofactors(u, level)
+            v0, v1 = self._cofactors(v, level)
+            result = self.mk(level, self.apply(op, u0, v0), self.apply(op, u1, v1))
+            self._cache_put(key, result)
+        return result
+
+    def negate(self, u):
+        """
+        Retorna el complemento de una función.
+        """
+        return self.apply("xor", u, 1)
+
+    def restrict(self, u, index, value):
+        """
+        Fija la variable `index` en `value` (0 o 1) y retorna el cofactor resultante.
+        """
+        level = self.level_of[index]
+        key = ("restrict", u, level, value)
+        if self._level[u] > level:
+            return u  # La variable no aparece debajo de este nodo
+        result = self._cache_get(key)
+        if result is None:
+            if self._level[u] == level:
+                result = self._high[u] if value else self._low[u]
+            else:
+                result = self.mk(self._level[u], self.restrict(self._low[u], index, value),
+                                 self.restrict(self._high[u], index, value))
+            self._cache_put(key, result)
+        return result
+
+    def from_cube(self, cube):
+        """
+        Construye la conjunción de literales de un implicante (valor, máscara) o de una cadena con '0', '1' y '-'.
+        """
+        value, mask = parse_cube(cube, self.num_vars) if isinstance(cube, str) else cube
+        node = 1
+        for level in reversed(range(self.num_vars)):  # De abajo hacia arriba, sin operaciones
+            bit = 1 << (self.num_vars - 1 - self.order[level])
+            if not mask & bit:
+                node = self.mk(level, 0, node) if value & bit else self.mk(level, node, 0)
+        return node
+
+    def from_cubes(self, cubes):
+        """
+        Construye la disyunción de una colección de cubos (ver from_cube).
+        """
+        node = 0
+        for cube in cubes:
+            node = self.apply("or", node, self.from_cube(cube))
+        return node
+
+    def from_minterms(self, minterms):
+        """
+        Construye la función a partir de sus minterms. Los minterms se reordenan según el orden de las
+        variables y se dividen recursivamente por nivel, sin operaciones entre diagramas.
+
+        Parámetros:
+        - minterms: iterable o arreglo de NumPy de minterms entre 0 y 2^num_vars - 1
+
+        Retorna:
+        - Nodo de la función
+        """
+        n = self.num_vars
+        if isinstance(minterms, np.ndarray) and n <= 62:
+            keys = self._array_keys(minterms)
+        else:
+            identity = self.order == list(range(n))
+            keys = set()
+            for minterm in minterms:
+                if not 0 <= minterm < 1 << n:
+                    raise ValueError(f"minterm fuera de rango para {n} variables: {minterm}")
+                if not identity:
+                    minterm = sum((minterm >> (n - 1 - var) & 1) << (n - 1 - level) for level, var in enumerate(self.order))
+                keys.add(minterm)
+            keys = sorted(keys)
+
+        def build(lo, hi, level, prefix):
+            if lo == hi:
+                return 0
+            if hi - lo == 1 << (n - level):
+                return 1  # Todas las combinaciones de los niveles restantes están presentes
+            bit = 1 << (n - 1 - level)
+            if isinstance(keys, np.ndarray):
+                mid = lo + int(np.searchsorted(keys[lo:hi], prefix | bit))
+            else:
+                mid = bisect.bisect_left(keys, prefix | bit, lo, hi)
+            return self.mk(level, build(lo, mid, level + 1, prefix), build(mid, hi, level + 1, prefix | bit))
+
+        return build(0, len(keys), 0, 0)
+
+    # Claves ordenadas y sin repetir de un arreglo de minterms, reordenadas según el orden de las variables
+    def _array_keys(self, minterms):
+        n = self.num_vars
+        minterms = np.asarray(minterms, dtype=np.int64)
+        if minterms.size and (minterms.min() < 0 or minterms.max() >> n):
+            raise ValueError(f"hay minterms fuera de rango para {n} variables")
+        if self.order != list(range(n)):
+            keys = np.zeros_like(minterms)
+            for level, var in enumerate(self.order):
+                keys |= (minterms >> (n - 1 - var) & 1) << (n - 1 - level)
+            minterms = keys
+        return np.unique(minterms)
+
+    def from_truth_table(self, path):
+        """
+        Construye la función desde un archivo de tabla de verdad: una cadena de '0' y '1' (se ignoran los
+        espacios y saltos de línea) donde el carácter i es el valor del minterm i.
+        """
+        return self.from_minterms(read_truth_table(path))
+
+    def from_truth_vector(self, truth):
+        """
+        Construye la función desde un vector de verdad booleano (por ejemplo un mapa de bits de Formatos).
+        """
+        return self.from_minterms(np.flatnonzero(truth))
+
+    def evaluate(self, u, minterm):
+        """
+        Evalúa la función en un minterm.
+        """
+        while u > 1:
+            var = self.order[self._level[u]]
+            u = self._high[u] if minterm >> (self.num_vars - 1 - var) & 1 else self._low[u]
+        return u
+
+    def sat_count(self, u):
+        """
+        Retorna el número de minterms de la función.
+        """
+        counts = {0: 0, 1: 1}
+
+        def count(node):
+            if node not in counts:
+                level = self._level[node]
+                low, high = self._low[node], self._high[node]
+                counts[node] = (count(low) << (self._level[low] - level - 1)) + (count(high) << (self._level[high] - level - 1))
+            return counts[node]
+
+        return count(u) << self._level[u]
+
+    def isop(self, lower, upper=None):
+        """
+        Calcula una suma de productos irredundante (algoritmo de Minato-Morreale) de una función
+        incompletamente especificada: todo minterm de `lower` queda cubierto y ningún cubo sale de `upper`.
+
+        Parámetros:
+        - lower: nodo con los minterms que deben cubrirse
+        - upper: nodo con los minterms permitidos (por defecto igual a lower)
+
+        Retorna:
+        - Tuple (cubos, nodo): lista de implicantes (valor, máscara) y el nodo de la cobertura
+        """
+        upper = lower if upper is None else upper
+        full = (1 << self.num_vars) - 1
+        cubes, node = self._isop(lower, upper)
+        return [(value, full & ~fixed) for value, fixed in cubes], node
+
+    # Recursión de ISOP; los cubos se llevan como (valor, bits fijados)
+    def _isop(self, lower, upper):
+        if lower == 0:
+            return [], 0
+        if upper == 1:
+            return [(0, 0)], 1
+        key = ("isop", lower, upper)
+        result = self._cache_get(key)
+        if result is None:
+            level = min(self._level[lower], self._level[upper])
+            bit = 1 << (self.num_vars - 1 - self.order[level])
+            l0, l1 = self._cofactors(lower, level)
+            u0, u1 = self._cofactors(upper, level)
+            cubes0, r0 = self._isop(self.apply("and", l0, self.negate(u1)), u0)
+            cubes1, r1 = self._isop(self.apply("and", l1, self.negate(u0)), u1)
+            rest_lower = self.apply("or", self.apply("and", l0, self.negate(r0)), self.apply("and", l1, self.negate(r1)))
+            cubes_rest, r_rest = self._isop(rest_lower, self.apply("and", u0, u1))
+            node = self.apply("or", self.mk(level, r0, r1), r_rest)
+            cubes = [(value, fixed | bit) for value, fixed in cubes0]
+            cubes += [(value | bit, fixed | bit) for value, fixed in cubes1]
+            cubes += cubes_rest
+            result = (cubes, node)
+            self._cache_put(key, result)
+        return result
+
+    # Nombre de una variable con el mismo formato de implicant_to_variables
+    def _literal(self, index):
+        bit = 1 << (self.num_vars - 1 - index)
+        return implicants_to_terms([(bit, ((1 << self.num_vars) - 1) & ~bit)], self.num_vars)[0]
+
+    def mux_residues(self, u, select=0):
+        """
+        Calcula los residuos del MUX reducido que resulta de llevar la variable `select` (por defecto A)
+        a las entradas de datos, como TablaMux, pero sin recorrer la tabla: para cada residuo retorna la
+        función (sobre las demás variables) de las entradas del MUX que lo reciben.
+
+        Parámetros:
+        - u: nodo de la función
+        - select: variable que se lleva a las entradas de datos
+
+        Retorna:
+        - Diccionario {"0", "A'", "A", "1"} -> nodo con las entradas que tienen ese residuo
+        """
+        name = self._literal(select)
+        f0, f1 = self.restrict(u, select, 0), self.restrict(u, select, 1)
+        not0, not1 = self.negate(f0), self.negate(f1)
+        return {"0": self.apply("and", not0, not1), name + "'": self.apply("and", f0, not1),
+                name: self.apply("and", not0, f1), "1": self.apply("and", f0, f1)}
+
+    def mux_residue(self, u, index, select=0):
+        """
+        Retorna el residuo ("0", "1", la variable o su negación) de la entrada `index` del MUX reducido.
+        El índice se forma con las demás variables en su orden (A..), como las columnas de TablaMux.
+        """
+        rest = self.num_vars - 1 - select  # Bits del índice por debajo de la variable select
+        low_part = index & ((1 << rest) - 1)
+        high_part = index >> rest
+        at0 = self.evaluate(u, (high_part << (rest + 1)) | low_part)
+        at1 = self.evaluate(u, (high_part << (rest + 1)) | (1 << rest) | low_part)
+        name = self._literal(select)
+        return ("0", name + "'", name, "1")[at0 | at1 << 1]
+
+# Función para convertir una cadena de cubo en un implicante (valor, máscara)
+def parse_cube(text, num_vars):
+    """
+    Convierte un cubo escrito con '0', '1' y '-' (la primera posición es A) en un implicante (valor, máscara).
+
+    Parámetros:
+    - text: cadena del cubo
+    - num_vars: número de variables (longitud esperada de la cadena)
+
+    Retorna:
+    - Implicante (valor, máscara)
+    """
+    if len(text) != num_vars or set(text) - set("01-"):
+        raise ValueError(f"cubo inválido para {num_vars} variables: {text!r}")
+    value = int(text.replace("-", "0"), 2)
+    mask = int(text.replace("1", "0").replace("-", "1"), 2)
+    return value, mask
+
+# Función para leer los minterms de un archivo de tabla de verdad
+def read_truth_table(path):
+    """
+    Lee un archivo con una cadena de '0' y '1' (se ignoran espacios y saltos de línea) y recorre los
+    índices de los caracteres '1' sin cargar la tabla completa en memoria.
+
+    Parámetros:
+    - path: ruta del archivo
+
+    Retorna:
+    - Generador de minterms
+    """
+    index = 0
+    with open(path, encoding="utf-8") as source:
+        for line in source:
+            for char in line:
+                if char == "1":
+                    yield index
+                elif char != "0":
+                    if char.isspace():
+                        continue
+                    raise ValueError(f"carácter inválido en la tabla de verdad: {char!r}")
+                index += 1
+
+# Función para minimizar con el BDD en lugar de la tabla de McCluskey
+def bdd_minimize(minterms=None, num_vars=None, cubes=None, order=None, dont_cares=None, dc_cubes=None):
+    """
+    Minimiza una función construyendo su ROBDD y extrayendo una suma de productos irredundante (ISOP).
+    A diferencia de quine_mccluskey, no enumera implicantes primos, por lo que sirve para funciones
+    de muchas variables; el resultado es irredundante pero no necesariamente mínimo.
+
+    Parámetros:
+    - minterms: minterms de la función (lista o arreglo de NumPy)
+    - num_vars: número de variables (por defecto el mínimo que representa los minterms)
+    - cubes: cubos adicionales (valor, máscara) o cadenas con '0', '1' y '-'
+    - order: orden de las variables en el BDD (lista de índices, A = 0)
+    - dont_cares: minterms don't care opcionales (lista o arreglo de NumPy)
+    - dc_cubes: cubos don't care opcionales, con el mismo formato que cubes
+
+    Retorna:
+    - Tuple con la lista de términos (como quine_mccluskey) y el número de variables
+    """
+    minterms = np.asarray(minterms if minterms is not None else [], dtype=np.int64)
+    dont_cares = np.asarray(dont_cares if dont_cares is not None else [], dtype=np.int64)
+    if num_vars is None:
+        largest = int(max(minterms.max(initial=0), dont_cares.max(initial=0)))
+        num_vars = max([1, largest.bit_length()] + [len(c) for c in (cubes or []) + (dc_cubes or []) if isinstance(c, str)])
+    if num_vars > 26:
+        raise ValueError("implicant_to_variables solo nombra 26 variables (A..Z); use BDD.isop directamente")
+    manager = BDD(num_vars, order)
+    manager.stages = 3  # Construcción, don't care e ISOP; las operaciones avisan dentro de cada etapa
+    manager._report()
+    node = manager.apply("or", manager.from_minterms(minterms), manager.from_cubes(cubes or []))
+    manager.stage = 1
+    manager._report()
+    upper = manager.apply("or", node, manager.apply("or", manager.from_minterms(dont_cares), manager.from_cubes(dc_cubes or [])))
+    manager.stage = 2
+    manager._report()
+    implicants, _ = manager.isop(node, upper)
+    return implicants_to_terms(implicants, num_vars), num_vars
@@ -0,0 +1,568 @@
+"""
+Minimización heurística al estilo Espresso sobre listas de cubos (valor, máscara).
+En lugar de generar todos los implicantes primos, repite los pasos EXPAND, IRREDUNDANT y REDUCE sobre
+la cobertura actual hasta que su costo deja de mejorar o se agota el presupuesto de iteraciones o tiempo.
+Los cubos usan la misma representación que NucleoMcClusky: la máscara tiene un 1 en cada posición
+eliminada ('-') y el valor tiene 0 en esas posiciones.
+"""
+import time
+import numpy as np
+from Estadisticas import active_progress
+from NucleoMcClusky import implicants_to_terms
+
+LARGE_COVER = 256  # Desde este número de cubos los conteos por variable se hacen con NumPy
+TABLE_VARS = 24  # Hasta este número de variables los pasos trabajan sobre la tabla de verdad
+
+# Excepción para cortar un paso cuando se agota el tiempo
+class DeadlineExceeded(Exception):
+    """
+    Se lanza dentro de complement cuando pasa el tiempo límite; espresso la atrapa y retorna la
+    cobertura que tenga en ese momento.
+    """
+
+# Función para saber si ya pasó el tiempo límite (None significa sin límite)
+def past(deadline):
+    return deadline is not None and time.perf_counter() > deadline
+
+# Función para intersecar dos cubos
+def intersect(cube1, cube2):
+    """
+    Calcula la intersección de dos cubos.
+
+    Parámetros:
+    - cube1, cube2: cubos (valor, máscara)
+
+    Retorna:
+    - Cubo intersección, o None si los cubos son disjuntos
+    """
+    value1, mask1 = cube1
+    value2, mask2 = cube2
+    if (value1 ^ value2) & ~mask1 & ~mask2:
+        return None  # Hay una posición fijada con valores opuestos
+    return value1 | value2, mask1 & mask2
+
+# Función para saber si un cubo contiene a otro
+def contains(outer, inner):
+    """
+    Indica si el cubo `outer` contiene al cubo `inner`.
+    """
+    return not inner[1] & ~outer[1] and not (outer[0] ^ inner[0]) & ~outer[1]
+
+# Función para calcular el cofactor de una cobertura respecto a un cubo
+def cofactor(cover, cube, full):
+    """
+    Calcula el cofactor de una cobertura respecto a un cubo: los cubos que lo intersecan, con las
+    posiciones fijadas por el cubo convertidas en guiones.
+
+    Parámetros:
+    - cover: lista de cubos
+    - cube: cubo (valor, máscara)
+    - full: máscara con todas las variables
+
+    Retorna:
+    - Lista de cubos del cofactor
+    """
+    value, mask = cube
+    fixed = full & ~mask
+    result = []
+    for other_value, other_mask in cover:
+        if not (other_value ^ value) & fixed & ~other_mask:
+            result.append((other_value & mask, other_mask | fixed))
+    return result
+
+# Variable más binaria de una cobertura (aparece con ambos valores en más cubos)
+def _binate_variable(cover, full):
+    best, best_count = None, 0
+    used = 0  # Variables que aparecen en algún cubo
+    if len(cover) > LARGE_COVER:
+        values, masks = _arrays(cover)
+    bit = 1
+    while bit <= full:
+        if len(cover) > LARGE_COVER:
+            present = (masks & bit) == 0
+            count1 = int(np.count_nonzero(present & ((values & bit) != 0)))
+            count0 = int(np.count_nonzero(present)) - count1
+        else:
+            count1 = sum(1 for value, mask in cover if not mask & bit and value & bit)
+            count0 = sum(1 for value, mask in cover if not mask & bit and not value & bit)
+        if count1 and count0 and count1 + count0 > best_count:
+            best, best_count = bit, count1 + count0
+        if count1 or count0:
+            used |= bit
+        bit <<= 1
+    return best, used
+
+# Función para verificar si una cobertura es una tautología
+def tautology(cover, full):
+    """
+    Verifica si una cobertura cubre todo el espacio de las variables de `full`, dividiendo por la
+    variable más binaria; una cobertura unate es tautología solo si contiene el cubo universal.
+
+    Parámetros:
+    - cover: lista de cubos
+    - full: máscara con las variables libres
+
+    Retorna:
+    - True si la cobertura es una tautología
+    """
+    if any(mask & full == full for _, mask in cover):
+        return True
+    if not cover or sum(1 << (mask & full).bit_count() for _, mask in cover) < 1 << full.bit_count():
+        return False  # No hay suficientes minterms para cubrir el espacio
+    bit, _ = _binate_variable(cover, full)
+    if bit is None:
+        return False  # Cobertura unate sin el cubo universal
+    return tautology(cofactor(cover, (0, full & ~bit), full), full) and \
+        tautology(cofactor(cover, (bit, full & ~bit), full), full)
+
+# Función para calcular el complemento de una cobertura
+def complement(cover, full, deadline=None):
+    """
+    Calcula una cobertura del complemento por expansión de Shannon sobre la variable más binaria.
+    Los cubos que aparecen en el complemento de ambos cofactores se unen sin el literal de la variable.
+
+    Parámetros:
+    - cover: lista de cubos
+    - full: máscara con todas las variables
+    - deadline: instante (time.perf_counter) desde el que se lanza DeadlineExceeded, o None
+
+    Retorna:
+    - Lista de cubos del complemento
+    """
+    if past(deadline):
+        raise DeadlineExceeded()
+    if not cover:
+        return [(0, full)]
+    if any(mask == full for _, mask in cover):
+        return []
+    if len(cover) == 1:
+        value, mask = cover[0]
+        result = []
+        bit = 1
+        while bit <= full:
+            if not mask & bit:
+                result.append((~value & bit, full & ~bit))  # Un cubo por literal negado (De Morgan)
+            bit <<= 1
+        return result
+    bit, used = _binate_variable(cover, full)
+    if bit is None:
+        bit = used & -used  # Cobertura unate: se divide por cualquier variable usada
+    low = complement(cofactor(cover, (0, full & ~bit), full), full, deadline)
+    high = complement(cofactor(cover, (bit, full & ~bit), full), full, deadline)
+    shared = set(low) & set(high)
+    result = list(shared)
+    result += [(value, mask & ~bit) for value, mask in low if (value, mask) not in shared]
+    result += [(value | bit, mask & ~bit) for value, mask in high if (value, mask) not in shared]
+    return result
+
+# Función para calcular el supercubo de una lista de cubos
+def supercube(cubes, full):
+    """
+    Retorna el menor cubo que contiene a todos los cubos de la lista, o None si la lista está vacía.
+    """
+    if not cubes:
+        return None
+    first_value = cubes[0][0]
+    mask = 0
+    for value, cube_mask in cubes:
+        mask |= cube_mask | (value ^ first_value)
+    mask &= full
+    return first_value & ~mask, mask
+
+# Costo de una cobertura: número de cubos y número de literales
+def cover_cost(cover, full):
+    return len(cover), sum((full & ~mask).bit_count() for _, mask in cover)
+
+# Arreglos de NumPy con los valores y las máscaras de una lista de cubos
+def _arrays(cubes):
+    return (np.array([value for value, _ in cubes], dtype=np.int64),
+            np.array([mask for _, mask in cubes], dtype=np.int64))
+
+# Cubos de los arreglos que intersecan a un cubo
+def _intersecting(values, masks, cube, full):
+    value, mask = cube
+    return ((values ^ value) & ~masks & (full & ~mask)) == 0
+
+# Paso EXPAND: agranda cada cubo tanto como permite el conjunto OFF
+def expand(cover, off_values, off_fixed, full, deadline=None):
+    """
+    Expande cada cubo eliminando literales mientras no toque el conjunto OFF. Los literales que se
+    conservan se eligen como una cobertura voraz de la matriz de bloqueo: por cada cubo OFF hay que
+    conservar al menos un literal que lo separe del cubo. Los cubos contenidos en otro expandido se eliminan.
+
+    Parámetros:
+    - cover: lista de cubos del conjunto ON
+    - off_values, off_fixed: arreglos de NumPy con los valores y las posiciones fijadas del conjunto OFF
+    - full: máscara con todas las variables
+    - deadline: instante desde el que los cubos restantes se conservan sin expandir, o None
+
+    Retorna:
+    - Lista de cubos expandidos
+    """
+    cover = sorted(cover, key=lambda cube: cube[1].bit_count())  # Primero los más pequeños
+    values, masks = _arrays(cover)
+    covered = np.zeros(len(cover), dtype=bool)  # Cubos ya contenidos en un cubo expandido
+    result = []
+    for index, (value, mask) in enumerate(cover):
+        if covered[index]:
+            continue
+        if past(deadline):
+            result.extend(cube for rest, cube in enumerate(cover[index:], index) if not covered[rest])
+            break
+        fixed = full & ~mask
+        blocking = (off_values ^ value) & off_fixed & fixed  # Literales que separan el cubo de cada cubo OFF
+        if not blocking.all():
+            raise ValueError("el cubo interseca el conjunto OFF")
+        keep = 0
+        while blocking.size:
+            single = blocking[(blocking & (blocking - 1)) == 0]
+            if single.size:
+                keep |= int(np.bitwise_or.reduce(single))  # Literales indispensables
+            else:
+                candidates = int(np.bitwise_or.reduce(blocking))
+                best, best_count = 0, -1
+                while candidates:
+                    bit = candidates & -candidates
+                    candidates ^= bit
+                    count = int(np.count_nonzero(blocking & bit))
+                    if count > best_count:
+                        best, best_count = bit, count
+                keep |= best  # Literal que separa más cubos OFF
+            blocking = blocking[(blocking & keep) == 0]
+        new_mask = full & ~keep
+        covered |= ((masks & keep) == 0) & (((values ^ value) & keep) == 0)
+        result.append((value & keep, new_mask))
+    # Un cubo expandido no contiene a los siguientes (se habrían saltado), pero sí puede contener a los anteriores
+    values, masks = _arrays(result)
+    return [cube for index, cube in enumerate(result)
+            if not np.any(((masks[index + 1:] | ~masks[index]) == -1) & (((values[index + 1:] ^ cube[0]) & ~masks[index + 1:]) == 0))]
+
+# Paso IRREDUNDANT: elimina los cubos cubiertos por los demás
+def irredundant(cover, dc, full, deadline=None):
+    """
+    Elimina, empezando por los cubos más pequeños, los que quedan cubiertos por el resto de la cobertura
+    y los don't care. Solo se revisan los cubos que intersecan al que se quiere eliminar.
+
+    Parámetros:
+    - cover: lista de cubos
+    - dc: lista de cubos don't care
+    - full: máscara con todas las variables
+    - deadline: instante desde el que ya no se intenta eliminar cubos, o None
+
+    Retorna:
+    - Lista de cubos irredundante
+    """
+    cover = sorted(cover, key=lambda c: c[1].bit_count())
+    cubes = cover + dc
+    values, masks = _arrays(cubes)
+    alive = np.ones(len(cubes), dtype=bool)
+    for index, cube in enumerate(cover):
+        if past(deadline):
+            break
+        near = alive & _intersecting(values, masks, cube, full)
+        near[index] = False
+        if tautology(cofactor([cubes[j] for j in np.flatnonzero(near)], cube, full), full):
+            alive[index] = False
+    return [cube for index, cube in enumerate(cover) if alive[index]]
+
+# Paso REDUCE: reduce cada cubo a lo que solo él cubre
+def reduce(cover, dc, full, deadline=None):
+    """
+    Reemplaza cada cubo, empezando por los más grandes, por el menor cubo que contiene los minterms que
+    solo él cubre, para que el siguiente EXPAND pueda crecer en otra dirección.
+
+    Parámetros:
+    - cover: lista de cubos
+    - dc: lista de cubos don't care
+    - full: máscara con todas las variables
+    - deadline: instante desde el que los cubos restantes se conservan sin reducir, o None
+
+    Retorna:
+    - Lista de cubos reducidos
+    """
+    cubes = sorted(cover, key=lambda c: -c[1].bit_count()) + dc
+    values, masks = _arrays(cubes)
+    alive = np.ones(len(cubes), dtype=bool)
+    for index in range(len(cover)):
+        cube = cubes[index]
+        near = alive & _intersecting(values, masks, cube, full)
+        near[index] = False
+        try:
+            own = complement(cofactor([cubes[j] for j in np.flatnonzero(near)], cube, full), full, deadline)
+        except DeadlineExceeded:
+            break  # Los cubos restantes se conservan sin reducir
+        reduced = supercube([part for part in (intersect(cube, c) for c in own) if part], full)
+        if reduced is None:
+            alive[index] = False  # El cubo ya no aporta minterms
+            continue
+        cubes[index] = reduced
+        values[index], masks[index] = reduced
+    return [cubes[index] for index in range(len(cover)) if alive[index]]
+
+# Índices de los minterms de un cubo
+def cube_indices(cube):
+    value, mask = cube
+    indices = np.array([value], dtype=np.int64)
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        indices = np.concatenate((indices, indices | bit))
+    return indices
+
+# Tabla de verdad (arreglo booleano) con los minterms de una lista de cubos
+def cubes_table(cubes, num_vars, table=None):
+    table = np.zeros(1 << num_vars, dtype=bool) if table is None else table
+    table[np.array([value for value, mask in cubes if not mask], dtype=np.int64)] = True
+    for cube in cubes:
+        if cube[1]:
+            table[cube_indices(cube)] = True
+    return table
+
+# Número de cubos que cubre cada minterm, junto con los minterms de cada cubo
+def _coverage(cover, size):
+    count = np.zeros(size, dtype=np.int32)
+    members = [cube_indices(cube) for cube in cover]
+    for indices in members:
+        count[indices] += 1
+    return count, members
+
+# Paso EXPAND sobre la tabla de verdad
+def expand_table(cover, on, allowed, full, deadline=None):
+    """
+    Expande cada cubo una variable a la vez hacia la mitad vecina que quede completa dentro de ON y los
+    don't care, eligiendo la que cubre más minterms ON todavía sin cubrir. Después de los cubos dados se
+    expanden, como semillas, los minterms ON que ninguno cubrió. Los cubos cuyos minterms ON ya están
+    cubiertos se omiten.
+
+    Parámetros:
+    - cover: lista de cubos iniciales (puede estar vacía)
+    - on: tabla de verdad del conjunto ON
+    - allowed: tabla de verdad del conjunto ON junto con los don't care
+    - full: máscara con todas las variables
+    - deadline: instante desde el que los cubos y minterms restantes se conservan sin expandir, o None
+
+    Retorna:
+    - Lista de cubos que cubre todo el conjunto ON
+    """
+    pending = on.copy()  # Minterms ON que ningún cubo expandido cubre
+    seeds = sorted(cover, key=lambda cube: cube[1].bit_count())  # Se toman del final: primero los más grandes
+    result = []
+    start = 0
+    while True:
+        if seeds:
+            cube = seeds.pop()
+            members = cube_indices(cube)
+            if not pending[members].any():
+                continue
+        else:
+            start += int(np.argmax(pending[start:])) if start < len(pending) else 0
+            if start >= len(pending) or not pending[start]:
+                break
+            cube, members = (start, 0), np.array([start], dtype=np.int64)
+        if past(deadline):
+            result.append(cube)
+            pending[members] = False
+            result.extend(cube for cube in seeds if pending[cube_indices(cube)].any())
+            result.extend((minterm, 0) for minterm in np.flatnonzero(pending).tolist())
+            break
+        value, mask = cube
+        candidates = full & ~mask
+        while True:
+            best, best_gain = 0, -1
+            remaining = candidates
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                mirror = members ^ bit
+                if not allowed[mirror].all():
+                    candidates ^= bit  # Al crecer el cubo la mitad vecina tampoco quedará completa
+                    continue
+                gain = int(np.count_nonzero(pending[mirror]))
+                if gain > best_gain:
+                    best, best_gain = bit, gain
+            if not best:
+                break
+            candidates ^= best
+            value, mask = value & ~best, mask | best
+            members = np.concatenate((members, members ^ best))
+        pending[members] = False
+        result.append((value, mask))
+    return result
+
+# Paso IRREDUNDANT sobre la tabla de verdad
+def irredundant_table(cover, on, deadline=None):
+    """
+    Elimina, empezando por los cubos más pequeños, los que no son el único en cubrir alguno de sus
+    minterms ON.
+
+    Parámetros:
+    - cover: lista de cubos
+    - on: tabla de verdad del conjunto ON
+    - deadline: instante desde el que ya no se intenta eliminar cubos, o None
+
+    Retorna:
+    - Lista de cubos irredundante
+    """
+    if past(deadline):
+        return cover
+    cover = sorted(cover, key=lambda cube: cube[1].bit_count())
+    count, members = _coverage(cover, len(on))
+    result = []
+    for cube, indices in zip(cover, members):
+        if not past(deadline) and np.all(count[indices[on[indices]]] > 1):
+            count[indices] -= 1
+        else:
+            result.append(cube)
+    return result
+
+# Paso REDUCE sobre la tabla de verdad
+def reduce_table(cover, on, deadline=None):
+    """
+    Reemplaza cada cubo, empezando por los más grandes, por el menor cubo que contiene los minterms ON
+    que solo él cubre.
+
+    Parámetros:
+    - cover: lista de cubos
+    - on: tabla de verdad del conjunto ON
+    - deadline: instante desde el que los cubos restantes se conservan sin reducir, o None
+
+    Retorna:
+    - Lista de cubos reducidos
+    """
+    if past(deadline):
+        return cover
+    cover = sorted(cover, key=lambda cube: -cube[1].bit_count())
+    count, members = _coverage(cover, len(on))
+    result = []
+    for cube, indices in zip(cover, members):
+        if past(deadline):
+            result.append(cube)
+            continue
+        own = indices[on[indices] & (count[indices] == 1)]
+        count[indices] -= 1
+        if own.size:  # Sin minterms propios el cubo ya no aporta nada
+            mask = int(np.bitwise_or.reduce(own ^ own[0]))
+            reduced = (int(own[0]) & ~mask, mask)
+            count[cube_indices(reduced)] += 1
+            result.append(reduced)
+    return result
+
+# Ciclo del método heurístico con los pasos sobre la tabla de verdad
+def _espresso_table(on, allowed, num_vars, cover, max_iterations, deadline):
+    full = (1 << num_vars) - 1
+    best = irredundant_table(expand_table(cover, on, allowed, full, deadline), on, deadline)
+    best_cost = cover_cost(best, full)
+    progress = active_progress()
+    for iteration in range(max_iterations):
+        if progress is not None:
+            progress("espresso", iteration, max_iterations)
+        if past(deadline):
+            break
+        candidate = irredundant_table(expand_table(reduce_table(best, on, deadline), on, allowed, full, deadline),
+                                      on, deadline)
+        cost = cover_cost(candidate, full)
+        if cost >= best_cost:
+            break  # La cobertura dejó de mejorar
+        best, best_cost = candidate, cost
+    return best
+
+# Ciclo del método heurístico con los pasos sobre listas de cubos
+def _espresso_cubes(cover, num_vars, dc, max_iterations, deadline):
+    full = (1 << num_vars) - 1
+    try:
+        off = complement(cover + dc, full, deadline)
+    except DeadlineExceeded:
+        return cover  # Sin conjunto OFF no se puede expandir
+    off_values = np.array([value for value, _ in off], dtype=np.int64)
+    off_fixed = np.array([full & ~mask for _, mask in off], dtype=np.int64)
+    best = irredundant(expand(cover, off_values, off_fixed, full, deadline), dc, full, deadline)
+    best_cost = cover_cost(best, full)
+    progress = active_progress()
+    for iteration in range(max_iterations):
+        if progress is not None:
+            progress("espresso", iteration, max_iterations)
+        if past(deadline):
+            break
+        candidate = irredundant(expand(reduce(best, dc, full, deadline), off_values, off_fixed, full, deadline),
+                                dc, full, deadline)
+        cost = cover_cost(candidate, full)
+        if cost >= best_cost:
+            break  # La cobertura dejó de mejorar
+        best, best_cost = candidate, cost
+    return best
+
+# Función principal del método heurístico
+def espresso(cover, num_vars, dc=None, max_iterations=20, time_limit=10.0):
+    """
+    Minimiza una cobertura con el ciclo EXPAND / IRREDUNDANT / REDUCE.
+    El resultado siempre cubre los mismos minterms (salvo los don't care) y es cercano al mínimo pero no
+    necesariamente mínimo. Hasta TABLE_VARS variables los pasos trabajan sobre la tabla de verdad, así el
+    conjunto OFF nunca se calcula y los minterms sueltos se expanden como semillas; con más variables se
+    usa el complemento de la cobertura como conjunto OFF. El tiempo límite se revisa también dentro de cada
+    paso: si se agota durante la primera pasada, el resultado es la cobertura parcialmente expandida (o la
+    de entrada si ni siquiera alcanzó para calcular el conjunto OFF), que es válida pero puede no ser
+    irredundante.
+
+    Parámetros:
+    - cover: lista de cubos (valor, máscara) del conjunto ON (por ejemplo minterms con máscara 0)
+    - num_vars: número de variables
+    - dc: lista opcional de cubos don't care
+    - max_iterations: número máximo de ciclos REDUCE / EXPAND / IRREDUNDANT
+    - time_limit: tiempo máximo en segundos; al agotarse se retorna la mejor cobertura válida encontrada
+
+    Retorna:
+    - Lista de cubos (valor, máscara)
+    """
+    deadline = time.perf_counter() + time_limit
+    dc = list(dc or [])
+    cover = list(dict.fromkeys(cover))
+    if not cover:
+        return []
+    if num_vars <= TABLE_VARS:
+        on = cubes_table(cover, num_vars)
+        allowed = cubes_table(dc, num_vars, on.copy())
+        return _espresso_table(on, allowed, num_vars, [cube for cube in cover if cube[1]], max_iterations, deadline)
+    return _espresso_cubes(cover, num_vars, dc, max_iterations, deadline)
+
+# Función para minimizar una lista de minterms o de cubos con el método heurístico
+def espresso_minimize(minterms=None, num_vars=None, dont_cares=None, max_iterations=20, time_limit=10.0,
+                      cubes=None, dc_cubes=None):
+    """
+    Minimiza una función con el método heurístico, sin generar todos los implicantes primos.
+    La función puede darse como minterms, como cubos (por ejemplo los renglones de un PLA) o ambos; los
+    cubos dados son el punto de partida de EXPAND. El tiempo de convertir la entrada cuenta dentro de
+    time_limit.
+
+    Parámetros:
+    - minterms: minterms de la función (lista o arreglo de NumPy)
+    - num_vars: número de variables (por defecto el mínimo que representa los minterms y los cubos)
+    - dont_cares: minterms don't care opcionales (lista o arreglo de NumPy)
+    - max_iterations: número máximo de ciclos de mejora
+    - time_limit: tiempo máximo en segundos de toda la minimización
+    - cubes: cubos (valor, máscara) opcionales del conjunto ON
+    - dc_cubes: cubos (valor, máscara) don't care opcionales
+
+    Retorna:
+    - Tuple con la lista de términos (como quine_mccluskey) y el número de variables
+    """
+    deadline = time.perf_counter() + time_limit
+    minterms = np.asarray(minterms if minterms is not None else [], dtype=np.int64)
+    dont_cares = np.asarray(dont_cares if dont_cares is not None else [], dtype=np.int64)
+    cubes = [(int(value), int(mask)) for value, mask in cubes or []]
+    dc_cubes = [(int(value), int(mask)) for value, mask in dc_cubes or []]
+    widest = max((value | mask for value, mask in cubes + dc_cubes), default=0)
+    num_vars = num_vars or max(1, max(int(minterms.max(initial=0)), int(dont_cares.max(initial=0)), widest).bit_length())
+    if num_vars > 26:
+        raise ValueError("implicant_to_variables solo nombra 26 variables (A..Z); use espresso directamente")
+    if num_vars <= TABLE_VARS:
+        on = cubes_table(cubes, num_vars)
+        on[minterms] = True
+        allowed = cubes_table(dc_cubes, num_vars, on.copy())
+        allowed[dont_cares] = True
+        result = _espresso_table(on, allowed, num_vars, [cube for cube in cubes if cube[1]], max_iterations, deadline)
+    else:
+        cover = list(dict.fromkeys(cubes + [(minterm, 0) for minterm in minterms.tolist()]))
+        dc = dc_cubes + [(minterm, 0) for minterm in dont_cares.tolist()]
+        result = _espresso_cubes(cover, num_vars, dc, max_iterations, deadline) if cover else []
+    result.sort()
+    return implicants_to_terms(result, num_vars), num_vars
@@ -0,0 +1,126 @@
+"""
+Estadísticas por fase de la minimización de McCluskey y aviso de avance para las interfaces.
+La recolección es opcional: sin un objeto de estadísticas ni un contexto activo, el núcleo solo
+consulta una variable de contexto por llamada.
+"""
+import contextlib
+import contextvars
+import time
+
+_collector = contextvars.ContextVar("estadisticas_mcclusky", default=None)
+_progress = contextvars.ContextVar("avance_mcclusky", default=None)
+
+# Estadísticas de una minimización
+class MinimizationStats:
+    """
+    Estadísticas de una llamada a quine_mccluskey.
+
+    Atributos:
+    - num_minterms: número de minterms de entrada
+    - rounds: una entrada por ronda de combinación con terms_in, comparisons, merges,
+      duplicates, terms_out y seconds
+    - chart: prime_implicants, columns y density de la tabla de cobertura
+    - cover: essentials, reduction_iterations, greedy_picks, exact_nodes, exact_complete y cover_size
+    - phases: segundos de cada fase (primes, chart, cover)
+    """
+    def __init__(self):
+        self.num_minterms = 0
+        self.rounds = []
+        self.chart = {}
+        self.cover = {}
+        self.phases = {}
+
+    def add_round(self, terms_in, comparisons, merges, duplicates, terms_out, seconds):
+        """
+        Registra una ronda de combinación.
+        """
+        self.rounds.append({"terms_in": terms_in, "comparisons": comparisons, "merges": merges,
+                            "duplicates": duplicates, "terms_out": terms_out, "seconds": seconds})
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Mide el tiempo de una fase y lo guarda en phases[name].
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - start
+
+    def as_dict(self):
+        """
+        Retorna las estadísticas como diccionario serializable a JSON.
+        """
+        return {"num_minterms": self.num_minterms, "rounds": self.rounds, "chart": self.chart,
+                "cover": self.cover, "phases": self.phases}
+
+# Recolector de estadísticas de todas las minimizaciones dentro de un contexto
+class StatsCollector:
+    """
+    Acumula las estadísticas de cada minimización hecha mientras está activo y, si se indicó,
+    llama a `callback(stats)` al terminar cada una.
+    """
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.runs = []
+
+    def finish(self, stats):
+        """
+        Registra las estadísticas de una minimización terminada.
+        """
+        self.runs.append(stats)
+        if self.callback is not None:
+            self.callback(stats)
+
+# Contexto para recolectar estadísticas
+@contextlib.contextmanager
+def collect_stats(callback=None):
+    """
+    Activa la recolección de estadísticas para las minimizaciones hechas dentro del bloque.
+
+    Parámetros:
+    - callback: función opcional que recibe cada MinimizationStats al terminar su minimización
+
+    Retorna:
+    - StatsCollector con la lista `runs` de estadísticas
+    """
+    collector = StatsCollector(callback)
+    token = _collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _collector.reset(token)
+
+# Función para obtener el recolector activo
+def active_collector():
+    """
+    Retorna el StatsCollector activo en el contexto actual, o None.
+    """
+    return _collector.get()
+
+# Contexto para recibir el avance de las minimizaciones
+@contextlib.contextmanager
+def report_progress(callback):
+    """
+    Activa el aviso de avance para las minimizaciones hechas dentro del bloque (en el mismo hilo).
+    El núcleo llama a `callback(stage, done, total)` en cada grupo de una ronda de combinación
+    ("primes"), en cada bloque de la tabla ("chart") y periódicamente durante la cobertura ("cover").
+    Si el callback lanza una excepción, la minimización se interrumpe con esa excepción; así se
+    implementa la cancelación.
+
+    Parámetros:
+    - callback: función que recibe la fase, lo avanzado y el total de esa fase
+    """
+    token = _progress.set(callback)
+    try:
+        yield callback
+    finally:
+        _progress.reset(token)
+
+# Función para obtener el aviso de avance activo
+def active_progress():
+    """
+    Retorna el callback de avance activo en el contexto actual, o None.
+    """
+    return _progress.get()
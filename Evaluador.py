@@ -0,0 +1,295 @@
+"""
+Evaluación masiva de resultados minimizados para bancos de prueba.
+Una suma de productos (los términos de quine_mccluskey, implicantes (valor, máscara) o una expresión
+"A'B + C") se compila a una función de Python generada y guardada en caché por expresión, que opera
+con NumPy sobre arreglos de minterms o sobre planos de bits empaquetados (64 vectores por palabra).
+También se simula la asignación de entradas del MUX reducido (0, 1, A, A') sobre lotes de vectores
+y se verifica la equivalencia contra el conjunto de minterms original.
+"""
+import functools
+import numpy as np
+from Formatos import verdad_desde_cubos
+from NucleoMux import VectorVerdad
+
+VARIABLES = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+CODIGOS = {"0": 0, "A'": 1, "A": 2, "1": 3}  # Residuo del MUX -> código (bit 0: fila A', bit 1: fila A)
+LIMITE_TABLA = 24  # Hasta este número de variables se evalúa con una tabla de verdad precalculada
+TERMINOS_LINEA = 32  # Términos por sentencia en el código generado
+
+#------------------------------------------------------------------------------------------------------------------------
+def termino_a_implicante(termino, NumVars):
+    """
+    Convierte un término con variables ("A'BC", "" para la constante 1) en un implicante (valor, máscara).
+
+    Args:
+        termino (str): Producto de literales; cada variable puede ir seguida de '.
+        NumVars (int): Número de variables.
+
+    Returns:
+        tuple: Implicante (valor, máscara) con 1 en la máscara en cada variable ausente.
+    """
+    Fijos = Valor = 0
+    i = 0
+    termino = termino.replace(" ", "")
+    while i < len(termino):
+        posicion = VARIABLES.find(termino[i])
+        if posicion < 0 or posicion >= NumVars:
+            raise ValueError(f"variable inválida en el término {termino!r}")
+        bit = 1 << (NumVars - 1 - posicion)
+        negada = termino[i + 1:i + 2] == "'"
+        if Fijos & bit and bool(Valor & bit) == negada:
+            return None  # x·x' nunca se cumple
+        Fijos |= bit
+        Valor |= 0 if negada else bit
+        i += 2 if negada else 1
+    return Valor, ((1 << NumVars) - 1) & ~Fijos
+#------------------------------------------------------------------------------------------------------------------------
+def implicantes_de(resultado, NumVars):
+    """
+    Normaliza un resultado de minimización a una tupla de implicantes (valor, máscara).
+
+    Args:
+        resultado: Lista de términos de quine_mccluskey, lista de implicantes (valor, máscara) o
+            expresión en texto ("A'B + C", "1" o "0").
+        NumVars (int): Número de variables.
+
+    Returns:
+        tuple: Implicantes (valor, máscara).
+    """
+    if isinstance(resultado, str):
+        resultado = resultado.strip()
+        if resultado in ("0", ""):
+            return ()
+        resultado = [""] if resultado == "1" else resultado.split("+")
+    implicantes = []
+    for termino in resultado:
+        if isinstance(termino, str):
+            termino = termino_a_implicante(termino, NumVars)
+            if termino is None:
+                continue
+        implicantes.append((int(termino[0]), int(termino[1])))
+    return tuple(implicantes)
+#------------------------------------------------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=256)
+def _compilar(implicantes, NumVars, forma):
+    """
+    Genera y compila el código de una suma de productos. La caché guarda una función por expresión.
+
+    Args:
+        implicantes (tuple): Implicantes (valor, máscara).
+        NumVars (int): Número de variables.
+        forma (str): "indices" (la función recibe minterms) o "planos" (recibe un plano de bits por variable).
+
+    Returns:
+        tuple: (función, código fuente).
+    """
+    completo = (1 << NumVars) - 1
+    productos = []
+    for Valor, Mascara in implicantes:
+        Fijos = completo & ~Mascara
+        if forma == "indices":
+            productos.append(f"((x & {Fijos}) == {Valor})" if Fijos else "uno")
+        else:
+            literales = []
+            for posicion in range(NumVars):
+                bit = 1 << (NumVars - 1 - posicion)
+                if Fijos & bit:
+                    literales.append(f"p[{posicion}]" if Valor & bit else f"~p[{posicion}]")
+            productos.append("(" + " & ".join(literales) + ")" if literales else "uno")
+    constante = ["uno"] if "uno" in productos else []  # Solo se crea si algún término es la constante 1
+    if forma == "indices":
+        cabecera = ["def evaluar(x):", "    x = np.asarray(x)"] + ["    uno = np.ones(x.shape, dtype=bool)" for _ in constante]
+        vacia = "np.zeros(x.shape, dtype=bool)"
+    else:
+        cabecera = ["def evaluar(p):"] + ["    uno = ~np.zeros_like(p[0])" for _ in constante]
+        vacia = "np.zeros_like(p[0])"
+    # La suma se reparte en sentencias de pocos términos: una sola expresión enorme agota la pila del compilador
+    cuerpo = [f"    r {'=' if inicio == 0 else '|='} " + " | ".join(productos[inicio:inicio + TERMINOS_LINEA])
+              for inicio in range(0, len(productos), TERMINOS_LINEA)]
+    codigo = "\n".join(cabecera + cuerpo + ["    return " + ("r" if productos else vacia)]) + "\n"
+    espacio = {"np": np}
+    exec(compile(codigo, f"<sop {forma}>", "exec"), espacio)
+    return espacio["evaluar"], codigo
+#------------------------------------------------------------------------------------------------------------------------
+class EvaluadorSOP:
+    """
+    Suma de productos compilada para evaluar millones de vectores de entrada.
+    Con hasta LIMITE_TABLA variables la evaluación de minterms es una consulta a la tabla de verdad
+    precalculada; con más variables se usa el código generado (una comparación por término).
+
+    Args:
+        resultado: Términos de quine_mccluskey, implicantes (valor, máscara) o expresión en texto.
+        NumVars (int): Número de variables.
+    """
+    def __init__(self, resultado, NumVars):
+        self.NumVars = NumVars
+        self.implicantes = implicantes_de(resultado, NumVars)
+        self._tabla = None
+
+    @property
+    def codigo(self):
+        """Código generado para evaluar arreglos de minterms."""
+        return _compilar(self.implicantes, self.NumVars, "indices")[1]
+
+    @property
+    def codigo_planos(self):
+        """Código generado para evaluar planos de bits."""
+        return _compilar(self.implicantes, self.NumVars, "planos")[1]
+
+    def tabla(self):
+        """
+        Retorna la tabla de verdad (vector booleano de 2^NumVars posiciones), calculada una sola vez.
+        """
+        if self._tabla is None:
+            Valores = np.array([Valor for Valor, _ in self.implicantes], dtype=np.int64)
+            Mascaras = np.array([Mascara for _, Mascara in self.implicantes], dtype=np.int64)
+            self._tabla = verdad_desde_cubos(Valores, Mascaras, self.NumVars)
+        return self._tabla
+
+    def __call__(self, Minterms):
+        return self.evaluar(Minterms)
+
+    def evaluar(self, Minterms):
+        """
+        Evalúa la función en un arreglo de minterms (vectores de entrada, A es el bit más significativo).
+
+        Args:
+            Minterms (numpy.ndarray): Vectores de entrada como enteros.
+
+        Returns:
+            numpy.ndarray: Salida booleana por vector.
+        """
+        Minterms = np.asarray(Minterms, dtype=np.int64)
+        if self.NumVars <= LIMITE_TABLA:
+            return self.tabla()[Minterms]
+        return _compilar(self.implicantes, self.NumVars, "indices")[0](Minterms)
+
+    def evaluar_planos(self, Planos):
+        """
+        Evalúa la función sobre planos de bits: Planos[v] tiene en cada bit el valor de la variable v
+        (A = 0) de un vector, así cada operación procesa 64 vectores por palabra.
+
+        Args:
+            Planos (numpy.ndarray): Matriz (NumVars, palabras) de uint64, por ejemplo de planos_desde_minterms.
+
+        Returns:
+            numpy.ndarray: Salidas empaquetadas (uint64), con el mismo orden de bits que los planos.
+        """
+        return _compilar(self.implicantes, self.NumVars, "planos")[0](Planos)
+#------------------------------------------------------------------------------------------------------------------------
+def compilar_sop(resultado, NumVars):
+    """
+    Compila un resultado de minimización en un EvaluadorSOP.
+
+    Args:
+        resultado: Términos de quine_mccluskey, implicantes (valor, máscara) o expresión en texto.
+        NumVars (int): Número de variables.
+
+    Returns:
+        EvaluadorSOP: Evaluador de la suma de productos.
+    """
+    return EvaluadorSOP(resultado, NumVars)
+#------------------------------------------------------------------------------------------------------------------------
+def planos_desde_minterms(Minterms, NumVars):
+    """
+    Transpone un arreglo de vectores de entrada a planos de bits empaquetados (uno por variable).
+
+    Args:
+        Minterms (numpy.ndarray): Vectores de entrada como enteros.
+        NumVars (int): Número de variables.
+
+    Returns:
+        numpy.ndarray: Matriz (NumVars, ceil(N/64)) de uint64; el bit j de la palabra w es el vector 64*w + j.
+    """
+    Minterms = np.asarray(Minterms, dtype=np.int64)
+    Relleno = -len(Minterms) % 64
+    Bits = (Minterms[None, :] >> np.arange(NumVars - 1, -1, -1, dtype=np.int64)[:, None]) & 1
+    Bits = np.pad(Bits.astype(np.uint8), ((0, 0), (0, Relleno)))
+    return np.packbits(Bits, axis=1, bitorder="little").view(np.uint64)
+#------------------------------------------------------------------------------------------------------------------------
+def desempaquetar(Salida, Cantidad):
+    """
+    Convierte salidas empaquetadas (uint64) de evaluar_planos en un vector booleano de Cantidad posiciones.
+    """
+    return np.unpackbits(np.ascontiguousarray(Salida).view(np.uint8), bitorder="little", count=Cantidad).view(bool)
+#------------------------------------------------------------------------------------------------------------------------
+def codigos_mux(equivalencias):
+    """
+    Convierte los residuos del MUX ("0", "1", "A", "A'") a códigos; los arreglos enteros se dejan igual.
+
+    Args:
+        equivalencias (list): Residuo de cada entrada de datos, o arreglo de códigos de NucleoMux.CodigosMux.
+
+    Returns:
+        numpy.ndarray: Código (int8) por entrada: bit 0 = salida con A = 0, bit 1 = salida con A = 1.
+    """
+    equivalencias = np.asarray(equivalencias)
+    if equivalencias.dtype.kind in "iu":
+        return equivalencias.astype(np.int8)
+    Codigos = np.zeros(len(equivalencias), dtype=np.int8)
+    for Residuo, Codigo in CODIGOS.items():
+        Codigos[equivalencias == Residuo] = Codigo
+    return Codigos
+#------------------------------------------------------------------------------------------------------------------------
+def simular_mux(equivalencias, Selects, A):
+    """
+    Simula el MUX reducido sobre lotes de vectores: la entrada elegida por los selects entrega 0, 1, A o A'.
+
+    Args:
+        equivalencias (list): Residuos o códigos de las entradas de datos.
+        Selects (numpy.ndarray): Número de entrada elegida por vector (variables B, C, ... como entero).
+        A (numpy.ndarray): Valor de la variable A por vector.
+
+    Returns:
+        numpy.ndarray: Salida booleana por vector.
+    """
+    Codigos = codigos_mux(equivalencias)
+    return (Codigos[np.asarray(Selects, dtype=np.int64)] >> np.asarray(A, dtype=np.int8) & 1).astype(bool)
+#------------------------------------------------------------------------------------------------------------------------
+def simular_mux_minterms(equivalencias, Minterms):
+    """
+    Simula el MUX reducido sobre vectores de entrada completos (A es el bit más significativo).
+
+    Args:
+        equivalencias (list): Residuos o códigos de las entradas de datos (2^(NumVars-1) entradas).
+        Minterms (numpy.ndarray): Vectores de entrada como enteros.
+
+    Returns:
+        numpy.ndarray: Salida booleana por vector.
+    """
+    NumeroMux = len(equivalencias)
+    NumVars = NumeroMux.bit_length()
+    Minterms = np.asarray(Minterms, dtype=np.int64)
+    return simular_mux(equivalencias, Minterms & (NumeroMux - 1), Minterms >> (NumVars - 1) & 1)
+#------------------------------------------------------------------------------------------------------------------------
+def contraejemplos(evaluar, Minterms, NumVars, DontCares=None, limite=10, bloque=1 << 20):
+    """
+    Compara una función evaluable con el conjunto de minterms original en todas las 2^NumVars entradas,
+    por bloques, y retorna los vectores donde difieren (fuera de los don't care).
+
+    Args:
+        evaluar (callable): Recibe un arreglo de minterms y retorna un vector booleano (por ejemplo un
+            EvaluadorSOP o lambda X: simular_mux_minterms(equivalencias, X)).
+        Minterms (list): Minterms ON originales.
+        NumVars (int): Número de variables.
+        DontCares (list): Minterms don't care, o None.
+        limite (int): Número máximo de contraejemplos a retornar.
+        bloque (int): Vectores evaluados por bloque.
+
+    Returns:
+        numpy.ndarray: Contraejemplos (int64); vacío si las funciones son equivalentes.
+    """
+    Total = 1 << NumVars
+    Verdad = VectorVerdad(Minterms, Total)
+    Ignorar = VectorVerdad(DontCares, Total) if DontCares is not None and len(DontCares) else None
+    Encontrados = []
+    for Inicio in range(0, Total, bloque):
+        Entradas = np.arange(Inicio, min(Inicio + bloque, Total), dtype=np.int64)
+        Distintos = np.asarray(evaluar(Entradas), dtype=bool) != Verdad[Inicio:Inicio + len(Entradas)]
+        if Ignorar is not None:
+            Distintos &= ~Ignorar[Inicio:Inicio + len(Entradas)]
+        Encontrados.extend(Entradas[Distintos][:limite - len(Encontrados)].tolist())
+        if len(Encontrados) >= limite:
+            break
+    return np.array(Encontrados, dtype=np.int64)
+#------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,203 @@
+"""
+Formatos de entrada compactos para conjuntos de minterms muy grandes.
+Los cargadores producen arreglos de NumPy (vectores de verdad booleanos o índices int64) sin pasar por
+listas de enteros de Python: rangos de minterms ("0-1023"), tablas de verdad en hexadecimal, mapas de
+bits empaquetados en archivos binarios (abiertos con memmap) y archivos de cubos estilo PLA.
+"""
+import re
+import numpy as np
+
+#------------------------------------------------------------------------------------------------------------------------
+def leer_rangos(texto):
+    """
+    Convierte una cadena de minterms y rangos separados por espacios o comas en un arreglo de índices.
+    Un rango "a-b" incluye ambos extremos y se genera con np.arange; los números aceptan prefijos como 0x.
+
+    Args:
+        texto (str): Por ejemplo "0-1023 2048 0x1000-0x10FF".
+
+    Returns:
+        numpy.ndarray: Minterms (int64), en el orden de la entrada.
+    """
+    sueltos, partes = [], []
+    for token in texto.replace(",", " ").split():
+        inicio, guion, fin = token.partition("-")
+        if guion:
+            inicio, fin = int(inicio, 0), int(fin, 0)
+            if fin < inicio:
+                raise ValueError(f"rango inválido: {token}")
+            if sueltos:
+                partes.append(np.array(sueltos, dtype=np.int64))
+                sueltos = []
+            partes.append(np.arange(inicio, fin + 1, dtype=np.int64))
+        else:
+            sueltos.append(int(token, 0))
+    if sueltos:
+        partes.append(np.array(sueltos, dtype=np.int64))
+    return np.concatenate(partes) if partes else np.zeros(0, dtype=np.int64)
+#------------------------------------------------------------------------------------------------------------------------
+def _contar_variables(bits, NumVars):
+    """
+    Número de variables de una tabla de verdad de `bits` posiciones (debe ser potencia de dos si no se indica).
+    """
+    if NumVars is None:
+        NumVars = max(1, bits.bit_length() - 1)
+        if 1 << NumVars != bits:
+            raise ValueError(f"una tabla de verdad de {bits} posiciones no corresponde a un número entero de variables")
+    elif 1 << NumVars > bits:
+        raise ValueError(f"la tabla tiene {bits} posiciones y se necesitan {1 << NumVars}")
+    return NumVars
+#------------------------------------------------------------------------------------------------------------------------
+def verdad_desde_hex(texto, NumVars=None):
+    """
+    Convierte una tabla de verdad escrita en hexadecimal en un vector booleano. Como en ABC, el número
+    se lee completo y su bit i es el valor del minterm i (el último dígito tiene los minterms 0 a 3).
+
+    Args:
+        texto (str): Dígitos hexadecimales, con prefijo 0x, espacios o '_' opcionales.
+        NumVars (int): Número de variables; por defecto se deduce de la cantidad de dígitos.
+
+    Returns:
+        numpy.ndarray: Vector booleano de 2^NumVars posiciones.
+    """
+    digitos = re.sub(r"[\s_]", "", texto)
+    if digitos[:2].lower() == "0x":
+        digitos = digitos[2:]
+    if not digitos:
+        raise ValueError("la tabla hexadecimal está vacía")
+    NumVars = _contar_variables(4 * len(digitos), NumVars)
+    if len(digitos) % 2:
+        digitos = "0" + digitos
+    datos = np.frombuffer(bytes.fromhex(digitos), dtype=np.uint8)[::-1]  # El último byte tiene los minterms 0..7
+    Verdad = np.unpackbits(datos, bitorder="little").view(bool)
+    if Verdad[1 << NumVars:].any():
+        raise ValueError(f"la tabla hexadecimal tiene minterms fuera de {NumVars} variables")
+    return Verdad[:1 << NumVars]
+#------------------------------------------------------------------------------------------------------------------------
+def cargar_mapa_bits(ruta):
+    """
+    Abre un archivo binario de tabla de verdad empaquetada sin leerlo a memoria: el bit j (del menos
+    significativo al más significativo) del byte i es el valor del minterm 8*i + j.
+
+    Args:
+        ruta (str): Ruta del archivo.
+
+    Returns:
+        numpy.memmap: Bytes del archivo (uint8, solo lectura).
+    """
+    return np.memmap(ruta, dtype=np.uint8, mode="r")
+#------------------------------------------------------------------------------------------------------------------------
+def verdad_desde_mapa(Empaquetado, NumVars=None):
+    """
+    Desempaqueta un mapa de bits (por ejemplo el de cargar_mapa_bits) en un vector booleano.
+
+    Args:
+        Empaquetado (numpy.ndarray): Bytes del mapa de bits.
+        NumVars (int): Número de variables; por defecto se deduce del tamaño del mapa.
+
+    Returns:
+        numpy.ndarray: Vector booleano de 2^NumVars posiciones.
+    """
+    NumVars = _contar_variables(8 * len(Empaquetado), NumVars)
+    return np.unpackbits(Empaquetado, bitorder="little", count=1 << NumVars).view(bool)
+#------------------------------------------------------------------------------------------------------------------------
+def escribir_mapa_bits(Verdad, ruta):
+    """
+    Guarda un vector de verdad como mapa de bits empaquetado (formato de cargar_mapa_bits).
+
+    Args:
+        Verdad (numpy.ndarray): Vector booleano.
+        ruta (str): Ruta del archivo a escribir.
+    """
+    np.packbits(np.asarray(Verdad, dtype=bool), bitorder="little").tofile(ruta)
+#------------------------------------------------------------------------------------------------------------------------
+def minterms_desde_verdad(Verdad):
+    """
+    Retorna los índices (int64) de las posiciones verdaderas de un vector de verdad.
+    """
+    return np.flatnonzero(Verdad)
+#------------------------------------------------------------------------------------------------------------------------
+def verdad_desde_cubos(Valores, Mascaras, NumVars):
+    """
+    Marca en un vector de verdad los minterms de una lista de cubos (valor, máscara). Los minterms de
+    cada cubo se generan repartiendo un np.arange sobre las posiciones de su máscara.
+
+    Args:
+        Valores (numpy.ndarray): Valores de los cubos (0 en las posiciones eliminadas).
+        Mascaras (numpy.ndarray): Máscaras de los cubos (1 en cada posición eliminada '-').
+        NumVars (int): Número de variables.
+
+    Returns:
+        numpy.ndarray: Vector booleano de 2^NumVars posiciones.
+    """
+    Verdad = np.zeros(1 << NumVars, dtype=bool)
+    for Valor, Mascara in zip(np.asarray(Valores).tolist(), np.asarray(Mascaras).tolist()):
+        Desplazamientos = np.zeros(1 << Mascara.bit_count(), dtype=np.int64)
+        Contador = np.arange(len(Desplazamientos), dtype=np.int64)
+        j = 0
+        for posicion in range(NumVars):
+            if Mascara >> posicion & 1:
+                Desplazamientos |= (Contador >> j & 1) << posicion
+                j += 1
+        Verdad[Valor | Desplazamientos] = True
+    return Verdad
+#------------------------------------------------------------------------------------------------------------------------
+def leer_pla(ruta):
+    """
+    Lee un archivo de cubos estilo PLA (Berkeley/Espresso) línea por línea. Se reconocen las directivas
+    .i, .o y .e; las demás y los comentarios (#) se ignoran. Cada línea de cubo tiene la parte de
+    entradas ('0', '1', '-', la primera columna es A) y la de salidas: '1' pone el cubo en el conjunto
+    ON de esa salida, '-' o '2' en el de don't care, y '0' o '~' no lo asigna.
+
+    Args:
+        ruta (str): Ruta del archivo.
+
+    Returns:
+        dict: "num_vars", "num_salidas", y "on" y "dc": listas (una por salida) de pares de arreglos
+        (valores, máscaras) de los cubos.
+    """
+    NumVars = NumSalidas = None
+    on, dc = None, None
+    with open(ruta, encoding="utf-8") as entrada:
+        for numero, linea in enumerate(entrada, 1):
+            linea = linea.split("#", 1)[0].strip()
+            if not linea:
+                continue
+            if linea.startswith("."):
+                directiva, _, valor = linea.partition(" ")
+                if directiva == ".i":
+                    NumVars = int(valor)
+                elif directiva == ".o":
+                    NumSalidas = int(valor)
+                elif directiva == ".e":
+                    break
+                continue
+            if NumVars is None:
+                raise ValueError(f"{ruta}:{numero}: falta la directiva .i antes de los cubos")
+            partes = linea.split()
+            if len(partes) == 1:  # Sin espacio entre entradas y salidas
+                partes = [partes[0][:NumVars], partes[0][NumVars:] or "1"]
+            entradas, salidas = partes[0], "".join(partes[1:])
+            if len(entradas) != NumVars or set(entradas) - set("01-"):
+                raise ValueError(f"{ruta}:{numero}: cubo de entrada inválido: {entradas!r}")
+            if on is None:
+                NumSalidas = NumSalidas or len(salidas)
+                on = [([], []) for _ in range(NumSalidas)]
+                dc = [([], []) for _ in range(NumSalidas)]
+            if len(salidas) != NumSalidas:
+                raise ValueError(f"{ruta}:{numero}: se esperaban {NumSalidas} salidas")
+            Valor = int(entradas.replace("-", "0"), 2)
+            Mascara = int(entradas.replace("1", "0").replace("-", "1"), 2)
+            for salida, caracter in enumerate(salidas):
+                destino = on[salida] if caracter == "1" else dc[salida] if caracter in "-2" else None
+                if destino is not None:
+                    destino[0].append(Valor)
+                    destino[1].append(Mascara)
+    NumSalidas = NumSalidas or 1
+    vacios = [([], []) for _ in range(NumSalidas)]
+
+    def arreglos(cubos):
+        return [(np.array(valores, dtype=np.int64), np.array(mascaras, dtype=np.int64)) for valores, mascaras in cubos]
+
+    return {"num_vars": NumVars or 1, "num_salidas": NumSalidas, "on": arreglos(on or vacios), "dc": arreglos(dc or vacios)}
+#------------------------------------------------------------------------------------------------------------------------
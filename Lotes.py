@@ -0,0 +1,258 @@
+"""
+Procesamiento por lotes: minimización de McCluskey y reducción de MUX de muchas funciones
+independientes repartidas en un grupo de procesos.
+"""
+import contextlib
+import itertools
+import os
+import signal
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
+from CacheMinimizacion import MinimizationCache
+from DiagramaBDD import bdd_minimize
+from Espresso import espresso_minimize
+from Formatos import leer_rangos, minterms_desde_verdad, verdad_desde_cubos
+from NucleoMcClusky import quine_mccluskey, result_to_string
+from NucleoMux import TablaMux
+
+METODOS = {"mcclusky": quine_mccluskey, "espresso": espresso_minimize, "bdd": bdd_minimize}  # Motores de minimización
+METODOS_CUBOS = ("espresso", "bdd")  # Motores que reciben los cubos de un PLA sin expandirlos
+LIMITE_VARS_MINTERMS = 24  # Máximo de variables para expandir cubos a minterms (mcclusky y mux)
+# Presupuesto de la búsqueda exacta de cobertura por función en los lotes. El límite de nodos es
+# determinista, así los lotes en el proceso actual y en procesos trabajadores dan las mismas coberturas
+PRESUPUESTO_COBERTURA = {"time_limit": 5.0, "node_limit": 10000}
+
+_caches = {}  # Caché de resultados de cada proceso, por ruta de la base en disco
+
+#------------------------------------------------------------------------------------------------------------------------
+def analizar_minterms(Minterms, modo="ambos", cache=None, metodo="mcclusky", DontCares=None, NumVars=None):
+    """
+    Calcula la minimización por McCluskey y/o la reducción de MUX de un conjunto de minterms.
+    Los arreglos de NumPy se pasan sin convertir a los motores que los aceptan (MUX, BDD, Espresso).
+
+    Args:
+        Minterms (list): Lista o arreglo de NumPy de minterms (enteros).
+        modo (str): "mcclusky", "mux" o "ambos".
+        cache (MinimizationCache): Caché a consultar para la minimización exacta, o None.
+        metodo (str): Motor de minimización: "mcclusky" (exacto), "espresso" (heurístico) o "bdd" (ISOP).
+        DontCares (list): Minterms don't care para la minimización, o None. La tabla del MUX los toma como 0.
+        NumVars (int): Número de variables (por ejemplo el .i de un PLA); por defecto se deduce de los minterms.
+
+    Returns:
+        dict: Resultado serializable a JSON.
+    """
+    resultado = {}
+    if modo in ("mcclusky", "ambos"):
+        if metodo == "mcclusky":
+            Lista = Minterms.tolist() if isinstance(Minterms, np.ndarray) else list(Minterms)
+            if (DontCares is not None and len(DontCares)) or NumVars:
+                DontCares = np.asarray(DontCares if DontCares is not None else [], dtype=np.int64).tolist()
+                terminos, num_vars = quine_mccluskey(Lista, dont_cares=DontCares, num_vars=NumVars,
+                                                     cover_budget=PRESUPUESTO_COBERTURA)
+            elif cache:
+                terminos, num_vars = cache.quine_mccluskey(Lista)
+            else:
+                terminos, num_vars = quine_mccluskey(Lista, cover_budget=PRESUPUESTO_COBERTURA)
+        else:
+            terminos, num_vars = METODOS[metodo](Minterms, num_vars=NumVars, dont_cares=DontCares)
+        resultado["num_vars"] = num_vars
+        resultado["terminos"] = terminos
+        resultado["expresion"] = result_to_string(terminos)
+    if modo in ("mux", "ambos"):
+        NumVars, NumeroMux, Fila1, Fila2, Resultado = TablaMux(Minterms, NumVars)
+        resultado["mux"] = {
+            "num_vars": NumVars,
+            "entradas": NumeroMux,
+            "fila_a_negada": Fila1,
+            "fila_a": Fila2,
+            "residuos": Resultado,
+        }
+    return resultado
+#------------------------------------------------------------------------------------------------------------------------
+def analizar_cubos(On, Dc, NumVars, modo="ambos", cache=None, metodo="mcclusky"):
+    """
+    Analiza una función dada por cubos (por ejemplo una salida de un PLA). Espresso y BDD minimizan
+    directamente los cubos; McCluskey y la reducción de MUX necesitan los minterms, que solo se generan
+    hasta LIMITE_VARS_MINTERMS variables.
+
+    Args:
+        On (tuple): Arreglos (valores, máscaras) de los cubos del conjunto ON.
+        Dc (tuple): Arreglos (valores, máscaras) de los cubos don't care (ON tiene prioridad).
+        NumVars (int): Número de variables.
+        modo (str): "mcclusky", "mux" o "ambos".
+        cache (MinimizationCache): Caché a consultar para la minimización exacta, o None.
+        metodo (str): Motor de minimización (ver METODOS).
+
+    Returns:
+        dict: Resultado serializable a JSON, con las mismas claves que analizar_minterms.
+
+    Raises:
+        ValueError: Si hay que expandir a minterms una función de más de LIMITE_VARS_MINTERMS variables.
+    """
+    resultado = {}
+    if modo in ("mcclusky", "ambos") and metodo in METODOS_CUBOS:
+        cubos = list(zip(np.asarray(On[0]).tolist(), np.asarray(On[1]).tolist()))
+        cubos_dc = list(zip(np.asarray(Dc[0]).tolist(), np.asarray(Dc[1]).tolist()))
+        terminos, num_vars = METODOS[metodo](num_vars=NumVars, cubes=cubos, dc_cubes=cubos_dc)
+        resultado["num_vars"] = num_vars
+        resultado["terminos"] = terminos
+        resultado["expresion"] = result_to_string(terminos)
+        if modo == "mcclusky":
+            return resultado
+        modo = "mux"
+    if NumVars > LIMITE_VARS_MINTERMS:
+        raise ValueError(f"{NumVars} variables son demasiadas para expandir los cubos a minterms (máximo "
+                         f"{LIMITE_VARS_MINTERMS}); use --metodo espresso o bdd con --modo mcclusky")
+    Verdad = verdad_desde_cubos(*On, NumVars)
+    VerdadDc = verdad_desde_cubos(*Dc, NumVars) & ~Verdad
+    resultado.update(analizar_minterms(minterms_desde_verdad(Verdad), modo, cache, metodo,
+                                       minterms_desde_verdad(VerdadDc), NumVars))
+    return resultado
+#------------------------------------------------------------------------------------------------------------------------
+def obtener_cache(ruta):
+    """
+    Retorna la caché de resultados del proceso actual para la base indicada, creándola si hace falta.
+
+    Args:
+        ruta (str): Ruta de la base sqlite compartida, o "" para una caché solo en memoria.
+
+    Returns:
+        MinimizationCache: Caché del proceso.
+    """
+    if ruta not in _caches:
+        _caches[ruta] = MinimizationCache(path=ruta or None, cover_budget=PRESUPUESTO_COBERTURA)
+    return _caches[ruta]
+#------------------------------------------------------------------------------------------------------------------------
+@contextlib.contextmanager
+def _limite_tiempo(segundos):
+    """
+    Interrumpe el bloque con TimeoutError si tarda más de los segundos indicados.
+    Solo tiene efecto en sistemas con signal.setitimer (POSIX); en otros no limita nada.
+    """
+    if not segundos or not hasattr(signal, "setitimer"):
+        yield
+        return
+
+    def expirar(signum, frame):
+        raise TimeoutError(f"la tarea excedió {segundos} s")
+
+    anterior = signal.signal(signal.SIGALRM, expirar)
+    signal.setitimer(signal.ITIMER_REAL, segundos)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, anterior)
+#------------------------------------------------------------------------------------------------------------------------
+def _procesar_bloque(bloque, modo, timeout, cache=None, metodo="mcclusky"):
+    """
+    Procesa un bloque de tareas dentro de un proceso trabajador. Cada tarea tiene su propio
+    límite de tiempo y sus errores se reportan en el resultado sin afectar a las demás.
+
+    Args:
+        bloque (list): Tuplas (indice, elemento); el elemento son minterms en lista, arreglo o texto,
+            una tupla (minterms, don't care) o (minterms, don't care, número de variables), un diccionario
+            de cubos {"on", "dc", "num_vars"} (ver analizar_cubos), o la excepción con la que falló su lectura.
+        modo (str): "mcclusky", "mux" o "ambos".
+        timeout (float): Límite de tiempo por tarea en segundos, o None.
+        cache (str): Ruta de la caché compartida ("" solo en memoria), o None para no usar caché.
+        metodo (str): Motor de minimización (ver METODOS).
+
+    Returns:
+        list: Tuplas (indice, resultado).
+    """
+    cache = obtener_cache(cache) if cache is not None else None
+    resultados = []
+    for indice, elemento in bloque:
+        try:
+            with _limite_tiempo(timeout):
+                if isinstance(elemento, Exception):
+                    raise elemento  # La función no se pudo leer; se reporta en su lugar
+                if isinstance(elemento, dict):
+                    resultado = analizar_cubos(elemento["on"], elemento["dc"], elemento["num_vars"], modo, cache, metodo)
+                else:
+                    if not isinstance(elemento, tuple):
+                        elemento = (elemento,)
+                    Minterms, DontCares, NumVars = (elemento + (None, None))[:3]
+                    if isinstance(Minterms, str):
+                        Minterms = leer_rangos(Minterms)  # Acepta rangos como "0-1023"
+                    resultado = analizar_minterms(Minterms, modo, cache, metodo, DontCares, NumVars)
+            resultados.append((indice, resultado))
+        except Exception as error:
+            resultados.append((indice, {"error": f"{type(error).__name__}: {error}"}))
+    return resultados
+#------------------------------------------------------------------------------------------------------------------------
+def minimize_many(funciones, workers=None, chunksize=64, ordered=True, timeout=None, modo="ambos", cache=None,
+                  metodo="mcclusky"):
+    """
+    Minimiza muchas funciones independientes repartiéndolas en un grupo de procesos.
+    Las tareas se envían en bloques de `chunksize` para amortizar la comunicación entre procesos,
+    y solo se mantienen unos pocos bloques en vuelo, de modo que la entrada puede ser un flujo
+    de cualquier longitud. En cada resultado se incluyen los análisis pedidos en `modo`, así la
+    minimización y la reducción de MUX se calculan en una sola pasada.
+
+    Args:
+        funciones (iterable): Listas o arreglos de minterms, cadenas con minterms y rangos separados por
+            espacios o comas, tuplas (minterms, don't care[, número de variables]) o diccionarios de cubos
+            (ver _procesar_bloque).
+        workers (int): Número de procesos; 0 procesa todo en el proceso actual, None usa todos los núcleos.
+        chunksize (int): Número de funciones por bloque enviado a un proceso.
+        ordered (bool): Si es True los resultados salen en el orden de entrada; si no, según terminan.
+        timeout (float): Límite de tiempo por función en segundos (solo POSIX), o None.
+        modo (str): "mcclusky", "mux" o "ambos".
+        cache (str): Ruta de una base sqlite de resultados compartida entre procesos, "" para usar
+            solo la caché en memoria de cada proceso, o None para no usar caché.
+        metodo (str): "mcclusky" (exacto), "espresso" (heurístico con presupuesto) o "bdd" (ISOP sobre un ROBDD).
+
+    Yields:
+        tuple: (indice, resultado) donde resultado es el diccionario de analizar_minterms,
+        o {"error": ...} si esa función falló o excedió el tiempo. Si un proceso termina de forma
+        anormal (por ejemplo por falta de memoria), las funciones de los bloques que estaban en ese
+        grupo de procesos se reportan con error y el resto del flujo sigue en un grupo nuevo.
+    """
+    tareas = enumerate(funciones)
+    bloques = iter(lambda: list(itertools.islice(tareas, chunksize)), [])
+    if workers == 0:
+        for bloque in bloques:
+            yield from _procesar_bloque(bloque, modo, timeout, cache, metodo)
+        return
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        en_vuelo = {}  # Futuro -> (índices de su bloque, grupo de procesos que lo ejecuta)
+        limite = 2 * workers  # Bloques en vuelo como máximo
+        pendientes = {}  # Resultados que esperan a los anteriores cuando ordered=True
+        siguiente = 0
+        agotado = False
+        while en_vuelo or not agotado:
+            while not agotado and len(en_vuelo) < limite:
+                bloque = next(bloques, None)
+                if bloque is None:
+                    agotado = True
+                else:
+                    futuro = pool.submit(_procesar_bloque, bloque, modo, timeout, cache, metodo)
+                    en_vuelo[futuro] = ([indice for indice, _ in bloque], pool)
+            if not en_vuelo:
+                break
+            terminados, _ = wait(en_vuelo, return_when=FIRST_COMPLETED)
+            for futuro in terminados:
+                indices, origen = en_vuelo.pop(futuro)
+                try:
+                    resultados = futuro.result()
+                except BrokenProcessPool as error:
+                    # Solo fallan las funciones de este bloque; el flujo sigue en un grupo de procesos nuevo
+                    resultados = [(indice, {"error": f"BrokenProcessPool: {error}"}) for indice in indices]
+                    if origen is pool:
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        pool = ProcessPoolExecutor(max_workers=workers)
+                for indice, resultado in resultados:
+                    if not ordered:
+                        yield indice, resultado
+                    else:
+                        pendientes[indice] = resultado
+            while siguiente in pendientes:
+                yield siguiente, pendientes.pop(siguiente)
+                siguiente += 1
+    finally:
+        pool.shutdown(cancel_futures=True)
@@ -0,0 +1,342 @@
+"""
+Minimización de McCluskey incremental para funciones que se editan un minterm a la vez.
+Se conservan las tablas de implicantes de cada ronda, los implicantes primos y la cobertura elegida;
+al agregar o quitar un minterm solo se recalculan los implicantes que lo contienen y la parte de la
+tabla de cobertura que esos cambios afectan.
+"""
+from Cobertura import build_chart, solve_cover
+from Estadisticas import active_progress
+from NucleoMcClusky import check_variables, count_ones, implicants_to_terms
+
+# Función para recorrer los minterms de un implicante
+def cube_minterms(implicant):
+    """
+    Recorre los minterms cubiertos por un implicante (valor, máscara).
+
+    Parámetros:
+    - implicant: implicante (valor, máscara)
+
+    Retorna:
+    - Generador con los minterms del implicante
+    """
+    value, mask = implicant
+    subset = mask
+    while True:
+        yield value | subset
+        if not subset:
+            return
+        subset = (subset - 1) & mask  # Siguiente subconjunto de las posiciones con guion
+
+# Minimizador con estado para ediciones de un minterm
+class IncrementalMinimizer:
+    """
+    Minimizador de Quine-McCluskey que conserva su estado entre ediciones.
+
+    La primera cobertura es la misma que la de quine_mccluskey. Después de cada edición la cobertura se
+    repara localmente: se liberan los implicantes elegidos que dejaron de ser primos o que se cruzan con
+    primos nuevos, se resuelve la tabla de cobertura solo para los minterms que quedaron sin cubrir y se
+    quitan los implicantes que quedaron redundantes. El resultado siempre es una cobertura irredundante
+    de implicantes primos, pero tras muchas ediciones puede tener más términos que una minimización
+    desde cero; resolve() vuelve a resolver toda la tabla y needs_resolve() indica cuándo conviene.
+
+    Atributos:
+    - on: conjunto de minterms ON
+    - dont_cares: conjunto de minterms don't care
+    - rounds: lista con el conjunto de implicantes de cada ronda (la ronda k tiene k guiones)
+    - primes: conjunto de implicantes primos
+    - cover: conjunto de implicantes primos elegidos
+    - region_limit: número máximo de implicantes vecinos que se liberan en cada reparación
+    - resolved_size: número de términos de la última cobertura resuelta completa
+    """
+    def __init__(self, minterms=(), dont_cares=(), num_vars=None, region_limit=32):
+        self.on = set(minterms)
+        self.dont_cares = set(dont_cares) - self.on
+        self.fixed_vars = num_vars
+        self.region_limit = region_limit
+        self.num_vars = check_variables(list(self.on | self.dont_cares), num_vars)
+        self.rounds = []
+        self.primes = set()
+        self.cover = set()
+        self._covering = {}  # Implicantes elegidos que cubren cada minterm
+        self.resolved_size = 0
+        self._build()
+        self.resolve()
+
+    # Genera todas las rondas de combinación a partir de los minterms de la función
+    def _build(self):
+        current = {(minterm, 0) for minterm in self.on | self.dont_cares}
+        self.rounds = []
+        self.primes = set()
+        progress = active_progress()
+        while current:
+            self.rounds.append(current)
+            following = set()
+            checked = set()  # Implicantes contenidos en uno de la ronda siguiente
+            for position, (value, mask) in enumerate(current):
+                if progress is not None and not position & 4095:
+                    progress("primes", len(self.rounds) - 1 + position / len(current), self.num_vars + 1)
+                remaining = value
+                while remaining:
+                    bit = remaining & -remaining
+                    remaining ^= bit
+                    neighbor = (value ^ bit, mask)
+                    if neighbor in current:
+                        following.add((value ^ bit, mask | bit))
+                        checked.add((value, mask))
+                        checked.add(neighbor)
+            self.primes |= current - checked
+            current = following
+
+    def _has(self, implicant):
+        level = count_ones(implicant[1])
+        return level < len(self.rounds) and implicant in self.rounds[level]
+
+    def _free_bits(self, mask):
+        free = ((1 << self.num_vars) - 1) & ~mask
+        while free:
+            bit = free & -free
+            free ^= bit
+            yield bit
+
+    def _is_prime(self, implicant):
+        value, mask = implicant
+        return not any(self._has((value & ~bit, mask | bit)) for bit in self._free_bits(mask))
+
+    def _containing(self, minterm):
+        """
+        Recorre por rondas los implicantes que contienen al minterm, sin pasar de los primos.
+        """
+        frontier = {(minterm, 0)} if self._has((minterm, 0)) else set()
+        while frontier:
+            yield from frontier
+            following = set()
+            for value, mask in frontier:
+                if (value, mask) in self.primes:
+                    continue  # Ningún implicante mayor lo contiene
+                for bit in self._free_bits(mask):
+                    candidate = (value & ~bit, mask | bit)
+                    if self._has(candidate):
+                        following.add(candidate)
+            frontier = following
+
+    def primes_containing(self, minterm):
+        """
+        Retorna la lista de implicantes primos que contienen al minterm.
+        """
+        return [implicant for implicant in self._containing(minterm) if implicant in self.primes]
+
+    # Agrega a la función un minterm que no estaba (ni ON ni don't care)
+    def _grow(self, minterm):
+        if self.fixed_vars is None:
+            self.num_vars = max(self.num_vars, minterm.bit_length())
+        else:
+            check_variables([minterm], self.fixed_vars)
+        frontier = {(minterm, 0)}
+        created, absorbed = set(), set()
+        level = 0
+        while frontier:
+            if level == len(self.rounds):
+                self.rounds.append(set())
+            self.rounds[level] |= frontier
+            created |= frontier
+            following = set()
+            for value, mask in frontier:
+                for bit in self._free_bits(mask):
+                    neighbor = (value ^ bit, mask)  # No contiene al minterm nuevo, así que ya existía
+                    if neighbor in self.rounds[level]:
+                        following.add((value & ~bit, mask | bit))
+                        absorbed.add(neighbor)
+            frontier = following
+            level += 1
+        lost = absorbed & self.primes
+        gained = {implicant for implicant in created if self._is_prime(implicant)}
+        self.primes = (self.primes - lost) | gained
+        return lost, gained
+
+    # Quita de la función un minterm y todos los implicantes que lo contienen
+    def _shrink(self, minterm):
+        removed = []
+        frontier = {(minterm, 0)}
+        level = 0
+        while frontier:
+            self.rounds[level] -= frontier
+            removed.extend(frontier)
+            following = set()
+            for value, mask in frontier:
+                for bit in self._free_bits(mask):
+                    candidate = (value & ~bit, mask | bit)
+                    if self._has(candidate):
+                        following.add(candidate)
+            frontier = following
+            level += 1
+        while self.rounds and not self.rounds[-1]:
+            self.rounds.pop()
+        lost = self.primes.intersection(removed)
+        # La mitad que no contiene al minterm de cada implicante quitado sigue siendo implicante y puede ser primo
+        candidates = set()
+        for value, mask in removed:
+            remaining = mask
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                candidates.add((value | (bit & ~minterm), mask & ~bit))
+        gained = {implicant for implicant in candidates if self._has(implicant) and self._is_prime(implicant)}
+        self.primes = (self.primes - lost) | gained
+        return lost, gained
+
+    def _take(self, implicant):
+        self.cover.add(implicant)
+        for minterm in cube_minterms(implicant):
+            self._covering.setdefault(minterm, set()).add(implicant)
+
+    def _drop(self, implicant):
+        self.cover.discard(implicant)
+        for minterm in cube_minterms(implicant):
+            covering = self._covering[minterm]
+            covering.discard(implicant)
+            if not covering:
+                del self._covering[minterm]
+
+    def _cover_near(self, implicants):
+        """
+        Retorna los implicantes elegidos que comparten algún minterm con los indicados.
+        """
+        near = set()
+        for implicant in implicants:
+            for minterm in cube_minterms(implicant):
+                near.update(self._covering.get(minterm, ()))
+        return near
+
+    # Repara la cobertura después de una edición
+    def _repair(self, lost, gained, touched=()):
+        released = (lost & self.cover) | self._cover_near(gained)
+        # Se liberan también los vecinos de la zona editada para que la tabla local pueda reacomodarlos,
+        # salvo que la zona sea tan grande que la tabla local deje de ser pequeña
+        near = self._cover_near(list(released) + [(minterm, 0) for minterm in touched])
+        if len(near) <= self.region_limit:
+            released |= near
+        pending = {minterm for minterm in touched if minterm in self.on and minterm not in self._covering}
+        for implicant in released:
+            self._drop(implicant)
+            pending.update(minterm for minterm in cube_minterms(implicant)
+                           if minterm in self.on and minterm not in self._covering)
+        picked = []
+        if pending:
+            # Tabla de cobertura solo de los minterms pendientes
+            columns = sorted(pending)
+            implicants, index, rows = [], {}, []
+            for column, minterm in enumerate(columns):
+                for implicant in self.primes_containing(minterm):
+                    if implicant not in index:
+                        index[implicant] = len(implicants)
+                        implicants.append(implicant)
+                        rows.append(0)
+                    rows[index[implicant]] |= 1 << column
+            chosen = solve_cover(rows, len(columns))
+            if chosen is None:
+                raise RuntimeError("la tabla de cobertura incremental quedó sin solución")
+            picked = [implicants[row] for row in chosen]
+            for implicant in picked:
+                self._take(implicant)
+        self._remove_redundant(picked + [(minterm, 0) for minterm in touched])
+
+    # Quita de la cobertura los implicantes que las demás ya cubren, revisando solo los afectados
+    def _remove_redundant(self, seeds):
+        for implicant in sorted(self._cover_near(seeds), key=lambda implicant: implicant[1].bit_count()):
+            if all(len(self._covering[minterm]) > 1 for minterm in cube_minterms(implicant) if minterm in self.on):
+                self._drop(implicant)
+
+    def resolve(self):
+        """
+        Vuelve a resolver la tabla de cobertura completa con los implicantes primos actuales.
+        """
+        for implicant in list(self.cover):
+            self._drop(implicant)
+        chart = build_chart(sorted(self.primes), sorted(self.on))
+        chosen = solve_cover(chart.rows, chart.num_columns)
+        if chosen is None:
+            raise RuntimeError("la tabla de cobertura quedó sin solución")
+        for index in chosen:
+            self._take(chart.implicants[index])
+        self.resolved_size = len(self.cover)
+
+    def needs_resolve(self, slack=0.25):
+        """
+        Indica si la cobertura reparada creció más que la fracción slack (y al menos un término) sobre la
+        última cobertura resuelta completa, es decir, si conviene llamar a resolve().
+        """
+        return len(self.cover) > self.resolved_size + max(1, int(self.resolved_size * slack))
+
+    def add(self, minterm, dont_care=False):
+        """
+        Agrega un minterm ON (o don't care) y actualiza la cobertura.
+
+        Parámetros:
+        - minterm: minterm a agregar
+        - dont_care: si es True el minterm se agrega como don't care
+        """
+        if minterm in (self.dont_cares if dont_care else self.on):
+            return
+        if minterm in self.on or minterm in self.dont_cares:
+            # La función no cambia, solo si el minterm debe cubrirse
+            if dont_care:
+                self.on.discard(minterm)
+                self.dont_cares.add(minterm)
+                self._remove_redundant([(minterm, 0)])
+            else:
+                self.dont_cares.discard(minterm)
+                self.on.add(minterm)
+                self._repair(set(), set(), [minterm])
+            return
+        lost, gained = self._grow(minterm)
+        (self.dont_cares if dont_care else self.on).add(minterm)
+        self._repair(lost, gained, [minterm])
+
+    def remove(self, minterm):
+        """
+        Quita un minterm (ON o don't care) y actualiza la cobertura.
+
+        Parámetros:
+        - minterm: minterm a quitar
+        """
+        if minterm not in self.on and minterm not in self.dont_cares:
+            return
+        self.on.discard(minterm)
+        self.dont_cares.discard(minterm)
+        lost, gained = self._shrink(minterm)
+        if self.fixed_vars is None:
+            self.num_vars = check_variables(list(self.on | self.dont_cares))
+        self._repair(lost, gained)
+
+    def update(self, minterms, dont_cares=()):
+        """
+        Lleva la función a los conjuntos indicados aplicando solo las diferencias con el estado actual.
+
+        Parámetros:
+        - minterms: minterms ON de la función editada
+        - dont_cares: minterms don't care de la función editada
+        """
+        minterms, dont_cares = set(minterms), set(dont_cares)
+        dont_cares -= minterms
+        for minterm in (self.on | self.dont_cares) - minterms - dont_cares:
+            self.remove(minterm)
+        for minterm in dont_cares - self.dont_cares:
+            self.add(minterm, dont_care=True)
+        for minterm in minterms - self.on:
+            self.add(minterm)
+
+    def implicants(self):
+        """
+        Retorna la cobertura actual como lista ordenada de implicantes (valor, máscara).
+        """
+        return sorted(self.cover)
+
+    def result(self):
+        """
+        Retorna la cobertura actual en el formato de quine_mccluskey.
+
+        Retorna:
+        - Tuple con la lista de términos y el número de variables
+        """
+        num_vars = check_variables(list(self.on | self.dont_cares), self.fixed_vars)
+        return implicants_to_terms(self.implicants(), num_vars), num_vars
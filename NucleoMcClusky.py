@@ -0,0 +1,450 @@
+#Librerias necesarias
+import math
+import time
+from CombinacionParalela import MAX_VARS, MIN_TERMS, parallel_prime_implicants
+from Cobertura import build_chart, remove_redundant, solve_cover
+from Estadisticas import MinimizationStats, active_collector, active_progress
+"""
+Núcleo del metodo de McCluskey, sin dependencias de la interfaz gráfica
+"""
+# Función para contar el número de 1's en la representación binaria
+def count_ones(term):
+    """
+    Convierte un número entero a su representación binaria y cuenta el número de bits en 1's.
+    
+    Parámetros:
+    - term: número entero para convertir y contar
+    
+    Retorna:
+    - Número de bits en 1's
+    """
+    return bin(term).count('1')
+
+# Función para obtener la representación binaria de un número con longitud fija
+def to_binary_string(term, length):
+    """
+    Convierte un número entero a una cadena binaria de longitud fija.
+    
+    Parámetros:
+    - term: número entero para convertir
+    - length: longitud deseada de la cadena binaria
+    
+    Retorna:
+    - Cadena binaria de longitud fija
+    """
+    return bin(term)[2:].zfill(length)
+
+# Función para combinar dos implicantes si difieren en exactamente un bit
+def combine_terms(term1, term2):
+    """
+    Combina dos implicantes representados como pares (valor, máscara) si difieren en exactamente un bit.
+    La máscara tiene un 1 en cada posición eliminada ('-'); el valor siempre tiene 0 en esas posiciones.
+    
+    Parámetros:
+    - term1: primer implicante (valor, máscara)
+    - term2: segundo implicante (valor, máscara)
+    
+    Retorna:
+    - Implicante combinado (valor, máscara) con el bit diferente añadido a la máscara, o None si no es combinable
+    """
+    value1, mask1 = term1
+    value2, mask2 = term2
+    if mask1 != mask2:
+        return None  # Solo se combinan implicantes con los guiones en las mismas posiciones
+    difference = value1 ^ value2  # Bits en los que difieren los términos
+    if difference == 0 or difference & (difference - 1):
+        return None  # La diferencia debe ser exactamente una potencia de dos
+    return value1 & ~difference, mask1 | difference
+
+# Función para convertir un implicante (valor, máscara) a su cadena con '0', '1' y '-'
+def implicant_to_string(implicant, num_vars):
+    """
+    Convierte un implicante (valor, máscara) a una cadena binaria con guiones en las posiciones eliminadas.
+    
+    Parámetros:
+    - implicant: implicante (valor, máscara)
+    - num_vars: número de variables (longitud de la cadena)
+    
+    Retorna:
+    - Cadena binaria de longitud fija con '-' en las posiciones de la máscara
+    """
+    value, mask = implicant
+    bits = to_binary_string(value, num_vars) if num_vars else ""
+    dashes = to_binary_string(mask, num_vars) if num_vars else ""
+    return ''.join('-' if dash == '1' else bit for bit, dash in zip(bits, dashes))
+
+# Función para traducir los implicantes a variables A, B, C...
+def implicant_to_variables(implicant, num_vars):
+    """
+    Traduce un implicante binario a una expresión booleana con variables A, B, C...
+    
+    Parámetros:
+    - implicant: término binario combinado
+    - num_vars: número de variables necesarias
+    
+    Retorna:
+    - Expresión booleana en formato de variables
+    """
+    variables = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"[:num_vars]  # Variables necesarias
+    expression = []  # Lista para construir la expresión booleana
+    for i, bit in enumerate(implicant):
+        if bit == '1':
+            expression.append(variables[i])  # Añade la variable si el bit es 1
+        elif bit == '0':
+            expression.append(variables[i] + "'")  # Añade la variable negada si el bit es 0
+    return ''.join(expression)  # Une los elementos en una cadena
+
+# Función para generar los implicantes primos combinando términos adyacentes
+def find_prime_implicants(minterms, stats=None, workers=None):
+    """
+    Genera los implicantes primos de una función a partir de sus minterms.
+    Cada término se guarda como un par de enteros (valor, máscara) y se agrupa por su número de 1's;
+    dos términos se combinan buscando en el grupo anterior el término que difiere en un solo bit.
+    Con `workers` mayor que 1 y funciones grandes, cada ronda reparte sus pares de grupos en procesos
+    (ver CombinacionParalela); el resultado es el mismo.
+    
+    Parámetros:
+    - minterms: lista de minterms de la función
+    - stats: MinimizationStats opcional donde se registra cada ronda de combinación
+    - workers: número de procesos para las rondas de combinación, o None para hacerlas en serie
+    
+    Retorna:
+    - Conjunto de implicantes primos como pares (valor, máscara)
+    """
+    if workers is not None and workers > 1 and len(minterms) >= MIN_TERMS:
+        num_vars = count_variables(minterms)
+        if num_vars <= MAX_VARS:
+            return parallel_prime_implicants(minterms, num_vars, workers, stats)
+    groups = {}  # Diccionario para agrupar términos por número de 1's
+    for minterm in minterms:
+        groups.setdefault(count_ones(minterm), set()).add((minterm, 0))  # Los minterms no tienen guiones
+    prime_implicants = set()  # Conjunto para almacenar implicantes primos
+    progress = active_progress()
+    total_rounds = max(groups, default=0) + 1  # Cada ronda baja en uno el mayor número de 1's
+    round_index = 0
+    while groups:
+        start = time.perf_counter() if stats is not None else 0.0
+        new_groups = {}  # Diccionario para los nuevos grupos de términos combinados
+        checked = set()  # Conjunto para almacenar términos combinados en esta ronda
+        merges = 0  # Combinaciones exitosas, incluidas las que producen un término repetido
+        for position, (ones_count, group) in enumerate(groups.items()):
+            if progress is not None:
+                progress("primes", round_index + position / len(groups), total_rounds)
+            lower_group = groups.get(ones_count - 1)
+            if not lower_group:
+                continue  # No hay grupo adyacente con un 1 menos
+            for term in group:
+                value, mask = term
+                remaining = value  # Bits en 1 candidatos a convertirse en guion
+                while remaining:
+                    bit = remaining & -remaining  # Bit en 1 menos significativo
+                    remaining ^= bit
+                    neighbor = (value ^ bit, mask)  # Término del grupo anterior que difiere solo en este bit
+                    if neighbor in lower_group:
+                        merges += 1
+                        checked.add(term)  # Marca los términos como combinados
+                        checked.add(neighbor)
+                        new_groups.setdefault(ones_count - 1, set()).add(combine_terms(neighbor, term))
+        # Agrega términos no combinados a los implicantes primos
+        for group in groups.values():
+            prime_implicants.update(group - checked)
+        if stats is not None:
+            terms_in = sum(len(group) for group in groups.values())
+            terms_out = sum(len(group) for group in new_groups.values())
+            # Cada término se compara con un vecino del grupo anterior por cada bit en 1
+            comparisons = sum(value.bit_count() for ones_count, group in groups.items()
+                              if groups.get(ones_count - 1) for value, _ in group)
+            stats.add_round(terms_in, comparisons, merges, merges - terms_out, terms_out,
+                            time.perf_counter() - start)
+        groups = new_groups  # Actualiza los grupos para la siguiente iteración
+        round_index += 1
+    return prime_implicants
+
+# Función para generar los implicantes primos de varias salidas en una sola pasada
+def find_tagged_prime_implicants(tagged_minterms, stats=None):
+    """
+    Genera los implicantes primos de varias salidas a la vez. Cada término lleva una etiqueta con un bit
+    por salida para la que es implicante; al combinar dos términos la etiqueta es la intersección de las
+    suyas, y un término solo deja de ser primo si se combina sin perder ninguna de sus salidas.
+    
+    Parámetros:
+    - tagged_minterms: diccionario minterm -> etiqueta (bit k en 1 si el minterm es ON o don't care de la salida k)
+    - stats: MinimizationStats opcional donde se registra cada ronda de combinación
+    
+    Retorna:
+    - Diccionario de implicantes primos (valor, máscara) -> etiqueta de salidas
+    """
+    groups = {}  # Diccionario para agrupar términos por número de 1's, con su etiqueta
+    for minterm, tag in tagged_minterms.items():
+        groups.setdefault(count_ones(minterm), {})[(minterm, 0)] = tag
+    prime_implicants = {}
+    progress = active_progress()
+    total_rounds = max(groups, default=0) + 1
+    round_index = 0
+    while groups:
+        start = time.perf_counter() if stats is not None else 0.0
+        new_groups = {}
+        checked = set()  # Términos contenidos en un término combinado con su misma etiqueta
+        merges = 0
+        for position, (ones_count, group) in enumerate(groups.items()):
+            if progress is not None:
+                progress("primes", round_index + position / len(groups), total_rounds)
+            lower_group = groups.get(ones_count - 1)
+            if not lower_group:
+                continue
+            for term, tag in group.items():
+                value, mask = term
+                remaining = value
+                while remaining:
+                    bit = remaining & -remaining
+                    remaining ^= bit
+                    neighbor = (value ^ bit, mask)
+                    shared = tag & lower_group.get(neighbor, 0)  # Salidas para las que ambos son implicantes
+                    if not shared:
+                        continue
+                    merges += 1
+                    if shared == tag:
+                        checked.add(term)
+                    if shared == lower_group[neighbor]:
+                        checked.add(neighbor)
+                    combined = combine_terms(neighbor, term)
+                    target = new_groups.setdefault(ones_count - 1, {})
+                    target[combined] = target.get(combined, 0) | shared
+        for group in groups.values():
+            for term, tag in group.items():
+                if term not in checked:
+                    prime_implicants[term] = tag
+        if stats is not None:
+            terms_in = sum(len(group) for group in groups.values())
+            terms_out = sum(len(group) for group in new_groups.values())
+            comparisons = sum(value.bit_count() for ones_count, group in groups.items()
+                              if groups.get(ones_count - 1) for value, _ in group)
+            stats.add_round(terms_in, comparisons, merges, merges - terms_out, terms_out,
+                            time.perf_counter() - start)
+        groups = new_groups
+        round_index += 1
+    return prime_implicants
+
+# Función para calcular el número de variables a partir de los minterms
+def count_variables(minterms):
+    """
+    Calcula el número de variables necesarias para representar el minterm más grande.
+    
+    Parámetros:
+    - minterms: lista de minterms
+    
+    Retorna:
+    - Número de variables (al menos una)
+    """
+    return max(1, math.ceil(math.log2(max(minterms, default=0) + 1)))
+
+# Función para obtener la cobertura mínima como implicantes (valor, máscara)
+def minimize_implicants(minterms, stats=None, dont_cares=None, workers=None, cover_budget=None):
+    """
+    Ejecuta el método de Quine-McCluskey y retorna la cobertura como implicantes (valor, máscara),
+    sin convertirlos a texto. El resultado no depende del número de variables.
+    Los don't care participan en la generación de implicantes primos pero no necesitan cubrirse.
+    Si se pasa `stats` o hay un contexto de Estadisticas.collect_stats activo, se registran las
+    estadísticas de cada fase.
+    
+    Parámetros:
+    - minterms: lista de minterms para simplificar
+    - stats: MinimizationStats opcional que se llena durante la minimización
+    - dont_cares: lista opcional de minterms don't care
+    - workers: número de procesos para las rondas de combinación, o None para hacerlas en serie
+    - cover_budget: diccionario opcional con time_limit y node_limit para solve_cover (por defecto los suyos)
+    
+    Retorna:
+    - Lista de implicantes primos elegidos (primero los esenciales), o None si no hay cobertura
+    """
+    collector = active_collector()
+    if stats is None and collector is None:
+        return _minimize_implicants(minterms, dont_cares=dont_cares, workers=workers, cover_budget=cover_budget)
+    if stats is None:
+        stats = MinimizationStats()
+    chosen = _minimize_implicants(minterms, stats, dont_cares, workers, cover_budget)
+    if collector is not None:
+        collector.finish(stats)
+    return chosen
+
+# Minimización con registro opcional de estadísticas por fase
+def _minimize_implicants(minterms, stats=None, dont_cares=None, workers=None, cover_budget=None):
+    terms = list(minterms) + list(dont_cares) if dont_cares else minterms  # Los don't care también se combinan
+    cover_budget = cover_budget or {}
+    if stats is None:
+        prime_implicants = find_prime_implicants(terms, workers=workers)  # Paso 1: Generar los implicantes primos
+        # Paso 2: Construir la tabla de implicantes de forma vectorizada
+        chart = build_chart(sorted(prime_implicants), minterms)
+        # Paso 3: Resolver la cobertura (esenciales, dominancia y búsqueda exacta con presupuesto)
+        chosen = solve_cover(chart.rows, chart.num_columns, **cover_budget)
+    else:
+        stats.num_minterms = len(minterms)
+        with stats.phase("primes"):
+            prime_implicants = find_prime_implicants(terms, stats, workers)
+        with stats.phase("chart"):
+            chart = build_chart(sorted(prime_implicants), minterms)
+        stats.chart = {"prime_implicants": len(chart.implicants), "columns": chart.num_columns,
+                       "density": chart.density()}
+        with stats.phase("cover"):
+            chosen = solve_cover(chart.rows, chart.num_columns, stats=stats.cover, **cover_budget)
+    if chosen is None:  # Si quedan minterms sin cubrir no hay solución
+        return None
+    return [chart.implicants[index] for index in chosen]
+
+# Función para obtener una cobertura conjunta de varias salidas
+def minimize_multi_implicants(on_sets, dc_sets=None, stats=None):
+    """
+    Minimiza varias salidas sobre las mismas entradas compartiendo los implicantes entre ellas.
+    Los implicantes primos se generan en una sola pasada etiquetada y se resuelve una sola tabla de
+    cobertura cuyas columnas son los pares (salida, minterm); así un implicante elegido puede cubrir
+    minterms de varias salidas. Luego se quitan de cada salida los implicantes que le sobran.
+    
+    Parámetros:
+    - on_sets: lista con los minterms ON de cada salida
+    - dc_sets: lista opcional con los minterms don't care de cada salida
+    - stats: MinimizationStats opcional que se llena durante la minimización
+    
+    Retorna:
+    - Lista con los implicantes (valor, máscara) de cada salida, o None si no hay cobertura
+    """
+    collector = active_collector()
+    if stats is None and collector is not None:
+        stats = MinimizationStats()
+    dc_sets = dc_sets or [()] * len(on_sets)
+    tagged = {}  # Etiqueta de salidas de cada minterm
+    for output, (on_set, dc_set) in enumerate(zip(on_sets, dc_sets)):
+        for minterm in list(on_set) + list(dc_set):
+            tagged[minterm] = tagged.get(minterm, 0) | 1 << output
+    start = time.perf_counter()
+    prime_implicants = find_tagged_prime_implicants(tagged, stats)
+    implicants = sorted(prime_implicants)
+    if stats is not None:
+        stats.num_minterms = sum(len(on_set) for on_set in on_sets)
+        stats.phases["primes"] = time.perf_counter() - start
+        start = time.perf_counter()
+    # Tabla conjunta: las columnas de cada salida van a continuación de las de la anterior
+    rows = [0] * len(implicants)
+    spans = []  # (desplazamiento, número de columnas) de cada salida
+    offset = 0
+    for output, on_set in enumerate(on_sets):
+        indices = [index for index, implicant in enumerate(implicants) if prime_implicants[implicant] >> output & 1]
+        chart = build_chart([implicants[index] for index in indices], on_set)
+        for index, row in zip(indices, chart.rows):
+            rows[index] |= row << offset
+        spans.append((offset, chart.num_columns))
+        offset += chart.num_columns
+    if stats is not None:
+        cells = len(implicants) * offset
+        stats.chart = {"prime_implicants": len(implicants), "columns": offset,
+                       "density": sum(row.bit_count() for row in rows) / cells if cells else 0.0}
+        stats.phases["chart"] = time.perf_counter() - start
+        start = time.perf_counter()
+    chosen = solve_cover(rows, offset, stats=stats.cover if stats is not None else None)
+    if stats is not None:
+        stats.phases["cover"] = time.perf_counter() - start
+        if collector is not None:
+            collector.finish(stats)
+    if chosen is None:
+        return None
+    result = []
+    for offset, width in spans:
+        target = ((1 << width) - 1) << offset  # Columnas de esta salida
+        own = remove_redundant(rows, [index for index in chosen if rows[index] & target], target)
+        result.append([implicants[index] for index in own])
+    return result
+
+# Función para traducir una lista de implicantes (valor, máscara) a términos con variables
+def implicants_to_terms(implicants, num_vars):
+    """
+    Traduce cada implicante (valor, máscara) a su término con variables A, B, C...
+    
+    Parámetros:
+    - implicants: lista de implicantes (valor, máscara)
+    - num_vars: número de variables
+    
+    Retorna:
+    - Lista de términos en formato de variables
+    """
+    return [implicant_to_variables(implicant_to_string(imp, num_vars), num_vars) for imp in implicants]
+
+# Función principal para minimizar con el metodo de McCluskey
+def quine_mccluskey(minterms, stats=None, dont_cares=None, num_vars=None, workers=None, cover_budget=None):
+    """
+    Minimiza una función booleana utilizando el método de Quine-McCluskey.
+    
+    Parámetros:
+    - minterms: lista de minterms para simplificar
+    - stats: MinimizationStats opcional donde se guardan las estadísticas por fase
+    - dont_cares: lista opcional de minterms don't care
+    - num_vars: número de variables; por defecto el mínimo que representa los minterms y don't care
+    - workers: número de procesos para las rondas de combinación, o None para hacerlas en serie
+    - cover_budget: diccionario opcional con time_limit y node_limit para solve_cover
+    
+    Retorna:
+    - Tuple con la lista de expresiones booleanas simplificadas y el número de variables
+    """
+    dont_cares = list(dont_cares or [])
+    num_vars = check_variables(list(minterms) + dont_cares, num_vars)  # Determina el número de variables necesarias
+    essential_prime_implicants = minimize_implicants(minterms, stats, dont_cares, workers, cover_budget)
+    if essential_prime_implicants is None:
+        return None
+    result_in_vars = implicants_to_terms(essential_prime_implicants, num_vars)  # Convierte implicantes primos a variables
+    return result_in_vars, num_vars
+
+# Función principal para minimizar varias salidas compartiendo implicantes
+def quine_mccluskey_multi(on_sets, num_vars=None, dc_sets=None, stats=None):
+    """
+    Minimiza varias funciones booleanas de las mismas entradas con implicantes compartidos.
+    
+    Parámetros:
+    - on_sets: lista con los minterms ON de cada salida
+    - num_vars: número de variables; por defecto el mínimo que representa todos los minterms
+    - dc_sets: lista opcional con los minterms don't care de cada salida
+    - stats: MinimizationStats opcional donde se guardan las estadísticas por fase
+    
+    Retorna:
+    - Tuple con la lista de términos de cada salida y el número de variables, o None si no hay cobertura
+    """
+    everything = [minterm for terms in list(on_sets) + list(dc_sets or []) for minterm in terms]
+    num_vars = check_variables(everything, num_vars)
+    outputs = minimize_multi_implicants(on_sets, dc_sets, stats)
+    if outputs is None:
+        return None
+    return [implicants_to_terms(implicants, num_vars) for implicants in outputs], num_vars
+
+# Función para validar el número de variables indicado por el usuario
+def check_variables(minterms, num_vars=None):
+    """
+    Retorna el número de variables indicado, o el mínimo necesario si no se indica.
+    
+    Parámetros:
+    - minterms: lista de todos los minterms (ON y don't care)
+    - num_vars: número de variables pedido, o None
+    
+    Retorna:
+    - Número de variables
+    """
+    if num_vars is None:
+        return count_variables(minterms)
+    if any(minterm < 0 or minterm >> num_vars for minterm in minterms):
+        raise ValueError(f"hay minterms que no caben en {num_vars} variables")
+    return num_vars
+
+# Función para dar formato de suma de productos al resultado
+def result_to_string(result):
+    """
+    Une los términos del resultado en una suma de productos.
+    Si el único término es vacío (la función cubre todos los minterms) el resultado es 1, y si no
+    hay términos (la función no tiene minterms) el resultado es 0.
+    
+    Parámetros:
+    - result: lista de términos retornada por quine_mccluskey
+    
+    Retorna:
+    - Cadena con la expresión simplificada
+    """
+    if not result:
+        return "0"
+    if result[0] == "":  # Verificacion para los casos (0---7) , (0 ---- 15) ,etc.
+        return "1"
+    return ' + '.join(result)  # Formatea el resultado como una suma de términos
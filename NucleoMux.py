@@ -0,0 +1,224 @@
+"""
+Núcleo del proyecto reduccion de MUX, sin dependencias de la interfaz gráfica
+"""
+import numpy as np
+
+#------------------------------------------------------------------------------------------------------------------------
+# Función para calcular el número de variables necesarias a partir de los minterms
+def calcular_num_vars(minterms):
+    """
+    Calcula el número de variables necesarias para representar los minterms.
+    Args:
+        minterms (list): Lista de minterms.
+
+    Returns:
+        int: Número de variables necesarias.
+    """
+    return max(1, int(np.max(minterms)).bit_length())  # Sin redondeos de punto flotante; acepta listas o arreglos
+#------------------------------------------------------------------------------------------------------------------------
+# Función para seleccionar el MUX correcto basado en el número de variables
+def seleccionar_mux(num_vars):
+    """
+    Selecciona el tamaño del MUX (2^n) basado en el número de variables.
+    Args:
+        num_vars (int): Número de variables.
+
+    Returns:
+        int: Número de entradas del MUX.
+    """
+    s = num_vars - 1
+    mux = 2 ** s
+    return mux
+#------------------------------------------------------------------------------------------------------------------------
+def EsPotencia(Numero):
+    """
+    Verifica si un número es potencia de dos.
+    Args:
+        Numero (int): Número a verificar.
+
+    Returns:
+        bool: True si es potencia de dos, False en caso contrario.
+    """
+    return (Numero & (Numero - 1)) == 0 and Numero != 0
+#------------------------------------------------------------------------------------------------------------------------
+RESIDUOS = np.array(["0", "A'", "A", "1"])  # Residuo según (fila A' marcada) + 2 * (fila A marcada)
+#------------------------------------------------------------------------------------------------------------------------
+def VectorVerdad(Minterms, Tamano):
+    """
+    Construye la tabla de verdad de la función como vector booleano. Los minterms fuera del
+    rango 0..Tamano-1 se ignoran.
+
+    Args:
+        Minterms (list): Lista de minterms (enteros).
+        Tamano (int): Número de posiciones de la tabla.
+
+    Returns:
+        numpy.ndarray: Vector booleano con True en cada minterm presente.
+    """
+    Indices = np.asarray(Minterms, dtype=np.int64)
+    Indices = Indices[(Indices >= 0) & (Indices < Tamano)]
+    Verdad = np.zeros(Tamano, dtype=bool)
+    Verdad[Indices] = True
+    return Verdad
+#------------------------------------------------------------------------------------------------------------------------
+def ResiduosMux(Verdad):
+    """
+    Calcula los residuos de cada entrada del MUX a partir de la tabla de verdad reorganizada
+    en dos filas (A' y A) con operaciones sobre arreglos.
+
+    Args:
+        Verdad (numpy.ndarray): Matriz booleana (2, NumeroMux); la fila 0 es A' y la fila 1 es A.
+
+    Returns:
+        numpy.ndarray: Residuos "0", "A'", "A" o "1" por entrada.
+    """
+    return RESIDUOS[CodigosMux(Verdad)]
+#------------------------------------------------------------------------------------------------------------------------
+def CodigosMux(Verdad):
+    """
+    Calcula el código de residuo de cada entrada del MUX (su índice en RESIDUOS) sin crear cadenas.
+
+    Args:
+        Verdad (numpy.ndarray): Matriz booleana (2, NumeroMux); la fila 0 es A' y la fila 1 es A.
+
+    Returns:
+        numpy.ndarray: Códigos (int8) de 0 a 3 por entrada.
+    """
+    return Verdad[0].astype(np.int8) + 2 * Verdad[1].astype(np.int8)
+#------------------------------------------------------------------------------------------------------------------------
+def AnalizarTabla(Fila1, Fila2):
+    """
+    Analiza dos filas de minterms y genera una lista de resultados.
+
+    Args:
+        Fila1 (list): Primera fila de minterms.
+        Fila2 (list): Segunda fila de minterms.
+
+    Returns:
+        list: Lista de resultados analizados.
+    """
+    Verdad = np.array([np.asarray(Fila1) == -1, np.asarray(Fila2) == -1]).reshape(2, -1)
+    return ResiduosMux(Verdad).tolist()
+#------------------------------------------------------------------------------------------------------------------------
+def TablaMux(Minterms, NumVars=None):
+    """
+    Construye la tabla de residuos del MUX reducido: la fila A' contiene los índices 0..NumeroMux-1
+    y la fila A los índices NumeroMux..2*NumeroMux-1; los minterms presentes se marcan con -1.
+    La tabla de verdad se construye como vector booleano y se reorganiza en (2, NumeroMux), de modo
+    que el costo es lineal en el tamaño de la tabla y no depende de buscar cada índice en la lista.
+
+    Args:
+        Minterms (list): Lista o arreglo de NumPy de minterms (enteros).
+        NumVars (int): Número de variables; por defecto el mínimo que representa los minterms.
+
+    Returns:
+        tuple: (NumVars, NumeroMux, Fila1, Fila2, Resultado) con el número de variables, el tamaño
+        del MUX, las dos filas de la tabla y la lista de residuos de AnalizarTabla.
+    """
+    NumVars = NumVars or calcular_num_vars(Minterms)
+    return TablaMuxVerdad(VectorVerdad(Minterms, 1 << NumVars), NumVars)
+#------------------------------------------------------------------------------------------------------------------------
+def TablaMuxVerdad(Verdad, NumVars=None):
+    """
+    Construye la tabla de residuos del MUX reducido directamente desde un vector de verdad (por ejemplo
+    el de un mapa de bits o una tabla hexadecimal), sin pasar por una lista de minterms.
+
+    Args:
+        Verdad (numpy.ndarray): Vector booleano; la posición i es el valor del minterm i.
+        NumVars (int): Número de variables; por defecto el mínimo que representa el último minterm presente.
+
+    Returns:
+        tuple: (NumVars, NumeroMux, Fila1, Fila2, Resultado), como TablaMux.
+    """
+    NumVars, NumeroMux, Tabla, Codigos = TablaMuxArreglos(Verdad, NumVars)
+    Filas = FilasMux(Tabla, 0, NumeroMux)
+    Resultado = RESIDUOS[Codigos].tolist()  # Analizar la tabla
+    return NumVars, NumeroMux, Filas[0].tolist(), Filas[1].tolist(), Resultado
+#------------------------------------------------------------------------------------------------------------------------
+def TablaMuxArreglos(Verdad, NumVars=None):
+    """
+    Construye la tabla del MUX reducido como arreglos, sin convertirla a listas ni cadenas; las vistas
+    y exportaciones formatean solo la parte que necesitan.
+
+    Args:
+        Verdad (numpy.ndarray): Vector booleano; la posición i es el valor del minterm i.
+        NumVars (int): Número de variables; por defecto el mínimo que representa el último minterm presente.
+
+    Returns:
+        tuple: (NumVars, NumeroMux, Tabla, Codigos) con la tabla booleana (2, NumeroMux) de minterms
+        presentes (fila A' y fila A) y el código de residuo de cada entrada (ver CodigosMux).
+    """
+    Verdad = np.asarray(Verdad, dtype=bool)
+    if NumVars is None:
+        Ultimo = len(Verdad) - 1 - int(np.argmax(Verdad[::-1])) if Verdad.any() else 0
+        NumVars = max(1, Ultimo.bit_length())
+    NumeroMux = seleccionar_mux(NumVars)  # Seleccionar el MUX adecuado
+    Tabla = np.zeros(2 * NumeroMux, dtype=bool)
+    Tabla[:min(len(Verdad), 2 * NumeroMux)] = Verdad[:2 * NumeroMux]
+    Tabla = Tabla.reshape(2, NumeroMux)
+    return NumVars, NumeroMux, Tabla, CodigosMux(Tabla)
+#------------------------------------------------------------------------------------------------------------------------
+def FilasMux(Tabla, Inicio, Fin):
+    """
+    Calcula las columnas Inicio..Fin-1 de las filas A' y A de la tabla del MUX: el índice del minterm,
+    o -1 si el minterm está presente.
+
+    Args:
+        Tabla (numpy.ndarray): Tabla booleana (2, NumeroMux) de TablaMuxArreglos.
+        Inicio (int): Primera columna.
+        Fin (int): Columna siguiente a la última.
+
+    Returns:
+        numpy.ndarray: Matriz (2, Fin - Inicio) de enteros.
+    """
+    NumeroMux = Tabla.shape[1]
+    Indices = np.arange(Inicio, Fin) + np.array([[0], [NumeroMux]])
+    return np.where(Tabla[:, Inicio:Fin], -1, Indices)
+#------------------------------------------------------------------------------------------------------------------------
+def ExportarTablaCsv(ruta, Tabla, Codigos, bloque=1 << 16):
+    """
+    Escribe la tabla del MUX en CSV (una fila por entrada), formateando los arreglos por bloques.
+
+    Args:
+        ruta (str): Archivo de salida.
+        Tabla (numpy.ndarray): Tabla booleana (2, NumeroMux) de TablaMuxArreglos.
+        Codigos (numpy.ndarray): Códigos de residuo de cada entrada.
+        bloque (int): Entradas formateadas por escritura.
+    """
+    NumeroMux = Tabla.shape[1]
+    with open(ruta, "w", encoding="utf-8", newline="") as archivo:
+        archivo.write("entrada,fila_a_negada,fila_a,residuo\n")
+        for Inicio in range(0, NumeroMux, bloque):
+            Fin = min(Inicio + bloque, NumeroMux)
+            Filas = FilasMux(Tabla, Inicio, Fin).tolist()
+            Residuos = RESIDUOS[Codigos[Inicio:Fin]].tolist()
+            archivo.write("".join(f"I{Inicio + i},{a_negada},{a},{residuo}\n"
+                                  for i, (a_negada, a, residuo) in enumerate(zip(Filas[0], Filas[1], Residuos))))
+#------------------------------------------------------------------------------------------------------------------------
+def ExportarTablaJson(ruta, NumVars, Tabla, Codigos, bloque=1 << 16):
+    """
+    Escribe la tabla del MUX en JSON con las claves del resultado de Lotes ("num_vars", "entradas",
+    "fila_a_negada", "fila_a" y "residuos"), formateando los arreglos por bloques.
+
+    Args:
+        ruta (str): Archivo de salida.
+        NumVars (int): Número de variables.
+        Tabla (numpy.ndarray): Tabla booleana (2, NumeroMux) de TablaMuxArreglos.
+        Codigos (numpy.ndarray): Códigos de residuo de cada entrada.
+        bloque (int): Entradas formateadas por escritura.
+    """
+    NumeroMux = Tabla.shape[1]
+    Columnas = (("fila_a_negada", lambda Inicio, Fin: FilasMux(Tabla, Inicio, Fin)[0].tolist()),
+                ("fila_a", lambda Inicio, Fin: FilasMux(Tabla, Inicio, Fin)[1].tolist()),
+                ("residuos", lambda Inicio, Fin: [f'"{residuo}"' for residuo in RESIDUOS[Codigos[Inicio:Fin]].tolist()]))
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write(f'{{"num_vars": {NumVars}, "entradas": {NumeroMux}')
+        for Clave, Formatear in Columnas:
+            archivo.write(f', "{Clave}": [')
+            for Inicio in range(0, NumeroMux, bloque):
+                if Inicio:
+                    archivo.write(", ")
+                archivo.write(", ".join(map(str, Formatear(Inicio, min(Inicio + bloque, NumeroMux)))))
+            archivo.write("]")
+        archivo.write("}\n")
+#------------------------------------------------------------------------------------------------------------------------
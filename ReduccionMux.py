@@ -2,153 +2,319 @@
 Proyecto reduccion de MUX
 """
 import math
-import numpy as np
 import tkinter as tk
-from tkinter import messagebox
+import numpy as np
+from tkinter import filedialog, messagebox, ttk
+from Estadisticas import active_progress
+from Formatos import leer_rangos
+from NucleoMux import calcular_num_vars, TablaMuxArreglos, ExportarTablaCsv, ExportarTablaJson, RESIDUOS
+from TrabajoFondo import TrabajoFondo
 
 #------------------------------------------------------------------------------------------------------------------------
-# Función para calcular el número de variables necesarias a partir de los minterms
-def calcular_num_vars(minterms):
+# Función para agrupar las entradas constantes consecutivas
+def agrupar_entradas(equivalencias, minimo=2):
     """
-    Calcula el número de variables necesarias para representar los minterms.
+    Agrupa las entradas consecutivas iguales a "0" (GND) o "1" (V+) para dibujarlas como un solo pin.
+
     Args:
-        minterms (list): Lista de minterms.
+        equivalencias (list): Residuo de cada entrada del MUX.
+        minimo (int): Número mínimo de entradas iguales para formar un grupo.
 
     Returns:
-        int: Número de variables necesarias.
+        list: Filas (inicio, fin, valor); las entradas inicio..fin (inclusive) tienen el mismo valor.
     """
-    if (max(minterms) == 0):
-        return 1
-    else:
-        return math.ceil(math.log2(max(minterms) + 1))
+    Valores = np.asarray(equivalencias)
+    if not len(Valores):
+        return []
+    # Tramos de valores iguales consecutivos
+    Cambios = np.flatnonzero(Valores[1:] != Valores[:-1]) + 1
+    Inicios = np.concatenate(([0], Cambios))
+    Largos = np.diff(np.concatenate((Inicios, [len(Valores)])))
+    Agrupado = np.isin(Valores[Inicios], ["0", "1"]) & (Largos >= minimo)
+    # Cada tramo agrupado da una fila; los demás, una fila por entrada
+    Cuentas = np.where(Agrupado, 1, Largos)
+    Desplazamiento = np.arange(Cuentas.sum()) - np.repeat(np.cumsum(Cuentas) - Cuentas, Cuentas)
+    FilaInicio = np.repeat(Inicios, Cuentas) + Desplazamiento
+    FilaFin = np.where(np.repeat(Agrupado, Cuentas), np.repeat(Inicios + Largos - 1, Cuentas), FilaInicio)
+    filas = list(zip(FilaInicio.tolist(), FilaFin.tolist(), Valores[FilaInicio].tolist()))
+    return filas
 #------------------------------------------------------------------------------------------------------------------------
-# Función para seleccionar el MUX correcto basado en el número de variables
-def seleccionar_mux(num_vars):
+class SimulacionMux:
     """
-    Selecciona el tamaño del MUX (2^n) basado en el número de variables.
-    Args:
-        num_vars (int): Número de variables.
+    Ventana de simulación del circuito MUX que se reutiliza entre cálculos.
+    Solo se dibujan los pines de entrada que caen en la parte visible del canvas (más un margen), y se
+    crean a medida que el usuario se desplaza. Al mostrar un circuito nuevo se conservan los pines que
+    no cambiaron y se mueven los elementos fijos en lugar de volver a crearlos.
 
-    Returns:
-        int: Número de entradas del MUX.
+    Args:
+        master (tk.Misc): Ventana principal de la que depende la simulación.
     """
-    s = num_vars - 1
-    mux = 2 ** s
-    return mux
+    PASO = 30  # Separación vertical entre pines
+    MARGEN = 20  # Filas dibujadas por encima y por debajo de la parte visible
+    RECT_X_START = 300
+    RECT_WIDTH = 100
+    RECT_Y_START = 100
+
+    def __init__(self, master=None):
+        self.ventana = tk.Toplevel(master)
+        self.ventana.title("Simulación de Circuito MUX")
+        self.ventana.geometry("700x500")
+        self.ventana.configure(bg="#E6E6FA")
+        self.ventana.protocol("WM_DELETE_WINDOW", self.cerrar)
+        # Canvas con scrollbar vertical; la región de desplazamiento se fija según el número de filas
+        self.canvas = tk.Canvas(self.ventana, bg="#F4F6F7")
+        self.scrollbar = tk.Scrollbar(self.ventana, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._desplazado)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.bind("<Configure>", lambda event: self._actualizar_visibles())
+        # Desplazar con la rueda del ratón
+        self.canvas.bind("<MouseWheel>", lambda event: self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units"))
+        self.canvas.bind("<Button-4>", lambda event: self.canvas.yview_scroll(-1, "units"))
+        self.canvas.bind("<Button-5>", lambda event: self.canvas.yview_scroll(1, "units"))
+        self.filas = []
+        self.dibujadas = {}  # Fila -> (contenido, ids de sus elementos)
+        self.fijos = {}  # Elementos que siempre existen: rectángulo, título y salida
+        self.selects = []  # Ids (línea, texto) de cada variable de control
+        self._pendiente = False
+
+    def existe(self):
+        return self.ventana.winfo_exists()
+
+    def cerrar(self):
+        """
+        Cierra la ventana de simulación.
+        """
+        global _simulacion
+        self.ventana.destroy()
+        _simulacion = None
+
+    def mostrar(self, filas, NumeroMux):
+        """
+        Muestra un circuito en la ventana, reutilizando los elementos que no cambian.
+
+        Args:
+            filas (list): Pines de entrada (inicio, fin, valor) de agrupar_entradas.
+            NumeroMux (int): Número de entradas del MUX.
+        """
+        canvas = self.canvas
+        # Se borran solo las filas dibujadas cuyo contenido cambió
+        for fila in [fila for fila, (contenido, _) in self.dibujadas.items()
+                     if fila >= len(filas) or filas[fila] != contenido]:
+            self._borrar_fila(fila)
+        self.filas = filas
+        # Ajustar el tamaño del MUX basado en el número de filas
+        rect_x_start = self.RECT_X_START
+        rect_x_end = rect_x_start + self.RECT_WIDTH
+        rect_y_start = self.RECT_Y_START
+        rect_y_end = rect_y_start + 50 + len(filas) * self.PASO
+        salida_y = (rect_y_start + rect_y_end) / 2
+        if not self.fijos:
+            self.fijos = {
+                "mux": canvas.create_rectangle(0, 0, 0, 0, fill="#FF6347", outline="#1C2833", width=2),
+                "titulo": canvas.create_text(0, 0, font=("Helvetica", 14, "bold"), fill="black"),
+                "salida": canvas.create_line(0, 0, 0, 0, fill="red", width=2),
+                "q": canvas.create_text(0, 0, text="Q", font=("Helvetica", 12), anchor=tk.W),
+            }
+        canvas.coords(self.fijos["mux"], rect_x_start, rect_y_start, rect_x_end, rect_y_end)
+        canvas.coords(self.fijos["titulo"], (rect_x_start + rect_x_end) / 2, rect_y_start - 20)
+        canvas.itemconfigure(self.fijos["titulo"], text=f"{NumeroMux}x1 MUX")
+        canvas.coords(self.fijos["salida"], rect_x_end, salida_y, rect_x_end + 50, salida_y)
+        canvas.coords(self.fijos["q"], rect_x_end + 70, salida_y)
+        # Variables de control debajo del MUX, organizadas horizontalmente
+        num_variables = math.ceil(math.log2(NumeroMux)) if NumeroMux > 1 else 0
+        while len(self.selects) > num_variables:
+            canvas.delete(*self.selects.pop())
+        while len(self.selects) < num_variables:
+            self.selects.append((canvas.create_line(0, 0, 0, 0, fill="black", width=2),
+                                 canvas.create_text(0, 0, text=f"S{len(self.selects)}", font=("Helvetica", 12), fill="black")))
+        var_y = rect_y_end + 50
+        var_spacing = (rect_x_end - rect_x_start) / (num_variables + 1)
+        for i, (linea, texto) in enumerate(self.selects):
+            var_x = rect_x_start + (i + 1) * var_spacing
+            canvas.coords(linea, var_x, var_y + 10, var_x, rect_y_end)
+            canvas.coords(texto, var_x, var_y + 30)
+        canvas.configure(scrollregion=(0, 0, 700, var_y + 60))
+        self._actualizar_visibles()
+
+    #--------------------------------------------------------------------------------------------------------------------
+    def _desplazado(self, primero, ultimo):
+        """
+        Recibe los cambios de la vista del canvas: mueve la scrollbar y programa el dibujo de las filas visibles.
+        """
+        self.scrollbar.set(primero, ultimo)
+        if not self._pendiente:
+            self._pendiente = True
+            self.ventana.after_idle(self._actualizar_visibles)
+
+    def _actualizar_visibles(self):
+        """
+        Dibuja las filas visibles que faltan y borra las que quedaron lejos de la vista.
+        """
+        self._pendiente = False
+        if not self.filas:
+            return
+        arriba = self.canvas.canvasy(0)
+        abajo = self.canvas.canvasy(max(self.canvas.winfo_height(), 1))
+        primera = max(0, int((arriba - self.RECT_Y_START) // self.PASO) - self.MARGEN)
+        ultima = min(len(self.filas) - 1, int((abajo - self.RECT_Y_START) // self.PASO) + self.MARGEN)
+        for fila in [fila for fila in self.dibujadas if fila < primera - self.MARGEN or fila > ultima + self.MARGEN]:
+            self._borrar_fila(fila)
+        for fila in range(primera, ultima + 1):
+            if fila not in self.dibujadas:
+                self._dibujar_fila(fila)
+
+    def _borrar_fila(self, fila):
+        _, ids = self.dibujadas.pop(fila)
+        self.canvas.delete(*ids)
+
+    def _dibujar_fila(self, fila):
+        """
+        Dibuja el pin de una fila: una entrada o un grupo de entradas constantes iguales.
+        """
+        canvas = self.canvas
+        inicio, fin, valor = self.filas[fila]
+        rect_x_start = self.RECT_X_START
+        entrada_y = self.RECT_Y_START + 25 + fila * self.PASO
+        ids = [canvas.create_line(rect_x_start - 50, entrada_y, rect_x_start, entrada_y, fill="black", width=2)]
+        # Dibujar el símbolo correspondiente a la entrada
+        if valor == '1':
+            ids.append(canvas.create_line(rect_x_start - 70, entrada_y - 10, rect_x_start - 50, entrada_y, fill="red", width=2))  # Línea para "V+"
+            ids.append(canvas.create_text(rect_x_start - 80, entrada_y - 10, text="V+", font=("Helvetica", 12), anchor=tk.E))
+        elif valor == '0':
+            ids.append(canvas.create_line(rect_x_start - 70, entrada_y - 10, rect_x_start - 50, entrada_y - 10, fill="blue", width=2))
+            ids.append(canvas.create_line(rect_x_start - 65, entrada_y - 5, rect_x_start - 50, entrada_y - 5, fill="blue", width=2))
+            ids.append(canvas.create_line(rect_x_start - 60, entrada_y, rect_x_start - 50, entrada_y, fill="blue", width=2))
+            ids.append(canvas.create_text(rect_x_start - 80, entrada_y - 10, text="GND", font=("Helvetica", 12), anchor=tk.E))
+        else:
+            ids.append(canvas.create_text(rect_x_start - 60, entrada_y, text=valor, font=("Helvetica", 12), anchor=tk.E))
+        if fin > inicio:
+            # Grupo de entradas constantes: se indica el rango de entradas que representa
+            ids.append(canvas.create_text(rect_x_start - 130, entrada_y - 10, text=f"I{inicio}-I{fin} (x{fin - inicio + 1})",
+                                          font=("Helvetica", 10), fill="#555555", anchor=tk.E))
+        self.dibujadas[fila] = (self.filas[fila], ids)
 #------------------------------------------------------------------------------------------------------------------------
-def EsPotencia(Numero):
+_simulacion = None  # Ventana de simulación abierta, reutilizada entre cálculos
+#------------------------------------------------------------------------------------------------------------------------
+# Función para simular el circuito MUX
+def simular_circuito(filas, NumeroMux):
     """
-    Verifica si un número es potencia de dos.
-    Args:
-        Numero (int): Número a verificar.
+    Muestra el circuito MUX en la ventana de simulación, creándola solo si no está abierta.
 
-    Returns:
-        bool: True si es potencia de dos, False en caso contrario.
+    Args:
+        filas (list): Pines de entrada (inicio, fin, valor) de agrupar_entradas, calculados fuera de la interfaz.
+        NumeroMux (int): Número de entradas del MUX.
     """
-    return (Numero & (Numero - 1)) == 0 and Numero != 0
+    global _simulacion
+    if _simulacion is None or not _simulacion.existe():
+        _simulacion = SimulacionMux()
+    _simulacion.mostrar(filas, NumeroMux)
+    _simulacion.ventana.lift()
+#------------------------------------------------------------------------------------------------------------------------
+ETAPAS = {"tabla": "Tabla de residuos"}
+BLOQUE_TABLA = 1 << 20  # Minterms por bloque al construir la tabla de verdad
 #------------------------------------------------------------------------------------------------------------------------
-def AnalizarTabla(Fila1, Fila2):
+# Cálculo que corre en el hilo trabajador
+def preparar_resultado(Minterms):
     """
-    Analiza dos filas de minterms y genera una lista de resultados.
+    Calcula la tabla del MUX reducido como arreglos, sin tocar la interfaz ni formatear texto;
+    la vista y las exportaciones formatean solo lo que necesitan. También agrupa aquí los pines de
+    la simulación, que recorren todas las entradas, para no hacerlo en el hilo de la interfaz.
 
     Args:
-        Fila1 (list): Primera fila de minterms.
-        Fila2 (list): Segunda fila de minterms.
+        Minterms (numpy.ndarray): Minterms de la función.
 
     Returns:
-        list: Lista de resultados analizados.
+        tuple: (NumVars, NumeroMux, Tabla, Codigos, Filas) como TablaMuxArreglos, más las filas de
+        agrupar_entradas para simular_circuito.
     """
-    Resultado = []
-    for i in range(len(Fila1)):
-        if (Fila1[i] == -1 and Fila2[i] == -1):
-            Resultado.append("1")
-        elif (Fila1[i] == -1):
-            Resultado.append("A'")
-        elif (Fila2[i] == -1):
-            Resultado.append("A")
-        else:
-            Resultado.append("0")
-    return Resultado
+    avisar = active_progress() or (lambda fase, avance, total: None)
+    Minterms = np.asarray(Minterms, dtype=np.int64)
+    avisar("tabla", 0, len(Minterms))
+    NumVars = calcular_num_vars(Minterms)
+    Verdad = np.zeros(1 << NumVars, dtype=bool)
+    for Inicio in range(0, len(Minterms), BLOQUE_TABLA):  # Por bloques, para poder avisar y cancelar
+        Bloque = Minterms[Inicio:Inicio + BLOQUE_TABLA]
+        Verdad[Bloque[(Bloque >= 0) & (Bloque < len(Verdad))]] = True
+        avisar("tabla", min(Inicio + BLOQUE_TABLA, len(Minterms)), len(Minterms))
+    NumVars, NumeroMux, Tabla, Codigos = TablaMuxArreglos(Verdad, NumVars)
+    return NumVars, NumeroMux, Tabla, Codigos, agrupar_entradas(RESIDUOS[Codigos])
 #------------------------------------------------------------------------------------------------------------------------
-# Función para simular el circuito MUX
-def simular_circuito(equivalencias, NumeroMux):
+class VistaTablaMux(tk.Frame):
     """
-    Crea una ventana para simular el circuito MUX.
+    Vista paginada de la tabla de residuos (filas A', A y Q) respaldada por los arreglos del cálculo.
+    Solo se formatean las columnas de la página visible.
 
     Args:
-        equivalencias (list): Lista de equivalencias de salida.
-        NumeroMux (int): Número de entradas del MUX.
+        master (tk.Misc): Contenedor de la vista.
+        columnas (int): Entradas del MUX por página.
     """
-    sim_ventana = tk.Toplevel()
-    sim_ventana.title("Simulación de Circuito MUX")
-    sim_ventana.geometry("700x500")
-    sim_ventana.configure(bg="#E6E6FA")
-
-    # Crear un canvas con scrollbar vertical
-    canvas = tk.Canvas(sim_ventana, bg="#F4F6F7")
-    scrollbar = tk.Scrollbar(sim_ventana, orient="vertical", command=canvas.yview)
-    scrollable_frame = tk.Frame(canvas)
-
-    scrollable_frame.bind(
-        "<Configure>",
-        lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-    )
-    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-    canvas.configure(yscrollcommand=scrollbar.set)
-    scrollbar.pack(side="right", fill="y")
-    canvas.pack(side="left", fill="both", expand=True)
-
-    # Añadir funcionalidad para desplazar con la rueda del ratón
-    def on_mouse_wheel(event):
-        canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-    sim_ventana.bind_all("<MouseWheel>", on_mouse_wheel)
+    def __init__(self, master, columnas=12, **opciones):
+        super().__init__(master, **opciones)
+        self.columnas = columnas
+        self.datos = None  # (NumVars, NumeroMux, Tabla, Codigos)
+        self.pagina = 0
+        self.label_resumen = tk.Label(self, text="", bg=self["bg"], justify="left")
+        self.label_resumen.pack(anchor="w")
+        self.tabla = ttk.Treeview(self, show="headings", height=3)
+        self.tabla.pack(fill=tk.X)
+        frame_paginas = tk.Frame(self, bg=self["bg"])
+        frame_paginas.pack(pady=2)
+        self.boton_anterior = tk.Button(frame_paginas, text="<", width=3, command=lambda: self.ir_a(self.pagina - 1))
+        self.boton_anterior.grid(row=0, column=0)
+        self.label_pagina = tk.Label(frame_paginas, text="", bg=self["bg"], width=28)
+        self.label_pagina.grid(row=0, column=1)
+        self.boton_siguiente = tk.Button(frame_paginas, text=">", width=3, command=lambda: self.ir_a(self.pagina + 1))
+        self.boton_siguiente.grid(row=0, column=2)
 
-    # Ajustar el tamaño del MUX basado en el número de entradas
-    rect_width = 100  # Ancho del MUX
-    rect_height = 50 + (len(equivalencias) * 30)  # Altura ajustada según las entradas
-    rect_x_start = 300
-    rect_x_end = rect_x_start + rect_width
-    rect_y_start = 100
-    rect_y_end = rect_y_start + rect_height
-
-    # Dibujar el MUX
-    canvas.create_rectangle(rect_x_start, rect_y_start, rect_x_end, rect_y_end, fill="#FF6347", outline="#1C2833", width=2)
-    canvas.create_text((rect_x_start + rect_x_end) / 2, rect_y_start - 20, text=f"{NumeroMux}x1 MUX", font=("Helvetica", 14, "bold"), fill="black")
-
-    # Dibujar las entradas conectadas al MUX
-    for i in range(NumeroMux):
-        entrada_y = rect_y_start + (i + 1) * (rect_height / (NumeroMux + 1))
-        canvas.create_line(rect_x_start - 50, entrada_y, rect_x_start, entrada_y, fill="black", width=2)
-
-        # Dibujar el símbolo correspondiente a la entrada
-        if equivalencias[i] == '1':
-            canvas.create_line(rect_x_start - 70, entrada_y - 10, rect_x_start - 50, entrada_y, fill="red", width=2)  # Línea para "V+"
-            canvas.create_text(rect_x_start - 80, entrada_y - 10, text="V+", font=("Helvetica", 12), anchor=tk.E)
-        elif equivalencias[i] == '0':
-            canvas.create_line(rect_x_start - 70, entrada_y - 10, rect_x_start - 50, entrada_y - 10, fill="blue", width=2)
-            canvas.create_line(rect_x_start - 65, entrada_y - 5, rect_x_start - 50, entrada_y - 5, fill="blue", width=2)
-            canvas.create_line(rect_x_start - 60, entrada_y, rect_x_start - 50, entrada_y, fill="blue", width=2)
-            canvas.create_text(rect_x_start - 80, entrada_y - 10, text="GND", font=("Helvetica", 12), anchor=tk.E)
-        else:
-            canvas.create_text(rect_x_start - 60, entrada_y, text=equivalencias[i], font=("Helvetica", 12), anchor=tk.E)
+    @property
+    def num_paginas(self):
+        return -(-self.datos[1] // self.columnas) if self.datos else 0
 
-    # Dibujar las variables de control debajo del MUX, organizadas horizontalmente
-    num_variables = math.ceil(math.log2(NumeroMux))
-    var_y_start = rect_y_end + 50
-    var_spacing = (rect_x_end - rect_x_start) / (num_variables + 1)
+    def mostrar(self, NumVars, NumeroMux, Tabla, Codigos):
+        """
+        Muestra una tabla nueva desde su primera página.
+        """
+        Variables = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        self.datos = (NumVars, NumeroMux, Tabla, Codigos)
+        self.label_resumen.config(text=f"La función contiene {NumVars} variables: {' '.join(Variables[:NumVars])}\n"
+                                       f"El MUX reducido será de {NumeroMux}x1")
+        self.ir_a(0)
 
-    for i in range(num_variables):
-        var_x = rect_x_start + (i + 1) * var_spacing
-        var_y = var_y_start
-        canvas.create_line(var_x, var_y + 10, var_x, rect_y_end, fill="black", width=2)  # Línea para la variable
-        canvas.create_text(var_x, var_y + 30, text=f"S{i}", font=("Helvetica", 12), fill="black")  # Texto debajo de la línea
+    def limpiar(self):
+        """
+        Quita la tabla mostrada.
+        """
+        self.datos = None
+        self.label_resumen.config(text="")
+        self.label_pagina.config(text="")
+        self.tabla.delete(*self.tabla.get_children())
+        self.tabla["columns"] = ()
 
-    # Dibujar la salida
-    salida_y = (rect_y_start + rect_y_end) / 2
-    canvas.create_line(rect_x_end, salida_y, rect_x_end + 50, salida_y, fill="red", width=2)
-    canvas.create_text(rect_x_end + 70, salida_y, text="Q", font=("Helvetica", 12), anchor=tk.W)
-    sim_ventana.mainloop()
+    def ir_a(self, pagina):
+        """
+        Muestra la página indicada, formateando solo sus columnas.
+        """
+        if not self.datos:
+            return
+        _, NumeroMux, Tabla, Codigos = self.datos
+        self.pagina = max(0, min(pagina, self.num_paginas - 1))
+        Inicio = self.pagina * self.columnas
+        Fin = min(Inicio + self.columnas, NumeroMux)
+        Entradas = [f"I{i}" for i in range(Inicio, Fin)]
+        self.tabla["columns"] = ["fila"] + Entradas
+        self.tabla.heading("fila", text="")
+        self.tabla.column("fila", width=40, anchor="center", stretch=False)
+        for Entrada in Entradas:
+            self.tabla.heading(Entrada, text=Entrada)
+            self.tabla.column(Entrada, width=50, anchor="center", stretch=False)
+        self.tabla.delete(*self.tabla.get_children())
+        self.tabla.insert("", tk.END, values=["A'"] + list(range(Inicio, Fin)))
+        self.tabla.insert("", tk.END, values=["A"] + list(range(Inicio + NumeroMux, Fin + NumeroMux)))
+        self.tabla.insert("", tk.END, values=["Q:"] + RESIDUOS[Codigos[Inicio:Fin]].tolist())
+        self.label_pagina.config(text=f"Entradas {Inicio}-{Fin - 1} de {NumeroMux} (página {self.pagina + 1}/{self.num_paginas})")
+        self.boton_anterior.config(state=tk.NORMAL if self.pagina > 0 else tk.DISABLED)
+        self.boton_siguiente.config(state=tk.NORMAL if self.pagina < self.num_paginas - 1 else tk.DISABLED)
 #------------------------------------------------------------------------------------------------------------------------
 # Interfaz gráfica principal
 def principal():
@@ -158,77 +324,99 @@ def principal():
     def calcular():
         """
         Función que se ejecuta al presionar el botón "Calcular". 
-        Toma los minterms de entrada y calcula el MUX reducido.
+        Toma los minterms de entrada y lanza el cálculo del MUX reducido en segundo plano;
+        un nuevo clic reemplaza al cálculo en curso.
         """
         try:
             Elementos = entrada_minterms.get()
-            Minterms = Elementos.strip().split()
-            MintermsCopy = [int(minterm) for minterm in Minterms]
-            if (len(Minterms)== 1 and Minterms[0] == "0"):
-                NumVars=1
-            else:
-                NumVars = calcular_num_vars(MintermsCopy)
-            Variables = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-            # Generar cadena con el número de variables
-            variables_str = f"La función contiene {NumVars} variables: "
-            for i in range(NumVars):
-                variables_str += f"{Variables[i]} "
-            NumeroMux = seleccionar_mux(NumVars)  # Seleccionar el MUX adecuado
-            mux_str = f"El MUX reducido será de {NumeroMux}x1\n"
-            # Cabecera de la tabla
-            headers = "\t".join([f"I{i}" for i in range(NumeroMux)])
-            resultado = f"{variables_str}\n{mux_str}\n\t{headers}\n"
-            controlador = max(MintermsCopy)
-            while not EsPotencia(controlador + 1):
-                controlador += 1
-            array = np.arange(0, controlador + 1)  # Crear el rango de minterms
-            Fila1, Fila2 = [], []
-            if (len(Minterms)== 1 and Minterms[0] == "0"):
-                Fila1.append(-1)
-                resultado += "A'\t"
-                resultado += f"0\t"
-                Fila2.append(1)
-                resultado += "\nA\t"
-                resultado += f"1\t"
-            else:
-                resultado += "A'\t"
-                for i in range(NumeroMux):
-                    resultado += f"{array[i]}\t"
-                    if array[i] in MintermsCopy:
-                        Fila1.append(-1)
-                    else:
-                        Fila1.append(int(array[i]))
-                resultado += "\nA\t"
-                for i in range(NumeroMux):
-                    resultado += f"{array[i + NumeroMux]}\t"
-                    if array[i + NumeroMux] in MintermsCopy:
-                        Fila2.append(-1)
-                    else:
-                        Fila2.append(int(array[i + NumeroMux]))
-            Resultado = AnalizarTabla(Fila1, Fila2)  # Analizar la tabla
-            resultado += "\nQ:\t" + "\t".join(Resultado)
-            equivalencias = Resultado[:NumeroMux]
-            label_resultado.config(text=resultado, justify="left")
-            simular_circuito(equivalencias, NumeroMux)  # Simular el circuito
+            Minterms = leer_rangos(Elementos)  # Acepta rangos como "0-1023"
         except ValueError:
+            mostrar_error(ValueError())
+            return
+        trabajo.iniciar(preparar_resultado, Minterms)
+        barra_avance["value"] = 0
+        label_estado.config(text="Calculando...")
+        boton_cancelar.config(state=tk.NORMAL)
+#------------------------------------------------------------------------------------------------------------------------
+    def mostrar_resultado(Datos):
+        """
+        Muestra la tabla calculada en segundo plano y abre la simulación del circuito.
+        """
+        NumVars, NumeroMux, Tabla, Codigos, Filas = Datos
+        terminar_trabajo("Listo")
+        vista_tabla.mostrar(NumVars, NumeroMux, Tabla, Codigos)
+        boton_csv.config(state=tk.NORMAL)
+        boton_json.config(state=tk.NORMAL)
+        simular_circuito(Filas, NumeroMux)  # Simular el circuito
+#------------------------------------------------------------------------------------------------------------------------
+    def mostrar_error(error):
+        """
+        Muestra el error de la entrada o del cálculo en segundo plano.
+        """
+        terminar_trabajo("")
+        if isinstance(error, ValueError):
             messagebox.showerror("Error", "Por favor, ingrese minterms válidos.")
+        else:
+            messagebox.showerror("Error", str(error))
+#------------------------------------------------------------------------------------------------------------------------
+    def mostrar_avance(fase, avance, total):
+        """
+        Actualiza la barra de avance.
+        """
+        barra_avance["value"] = 100 * avance / total if total else 0
+        label_estado.config(text=ETAPAS.get(fase, fase))
+#------------------------------------------------------------------------------------------------------------------------
+    def terminar_trabajo(texto):
+        """
+        Deja la interfaz sin cálculo en curso.
+        """
+        barra_avance["value"] = 0
+        label_estado.config(text=texto)
+        boton_cancelar.config(state=tk.DISABLED)
+#------------------------------------------------------------------------------------------------------------------------
+    def cancelar():
+        """
+        Pide al cálculo en segundo plano que se detenga.
+        """
+        trabajo.cancelar()
+        label_estado.config(text="Cancelando...")
 #------------------------------------------------------------------------------------------------------------------------    
     def limpiar():
         """
         Limpia el campo de entrada y el resultado.
         """
+        trabajo.cancelar()  # El resultado de un cálculo en curso ya no debe mostrarse
         entrada_minterms.delete(0, tk.END)
-        label_resultado.config(text="")
+        vista_tabla.limpiar()
+        boton_csv.config(state=tk.DISABLED)
+        boton_json.config(state=tk.DISABLED)
+#------------------------------------------------------------------------------------------------------------------------
+    def exportar(formato):
+        """
+        Exporta la tabla mostrada a CSV o JSON en segundo plano, escribiendo desde los arreglos por bloques.
+        """
+        if not vista_tabla.datos:
+            return
+        ruta = filedialog.asksaveasfilename(defaultextension=f".{formato}", filetypes=[(formato.upper(), f"*.{formato}")])
+        if not ruta:
+            return
+        NumVars, NumeroMux, Tabla, Codigos = vista_tabla.datos
+        label_estado.config(text=f"Exportando {ruta}...")
+        if formato == "csv":
+            exportador.iniciar(ExportarTablaCsv, ruta, Tabla, Codigos)
+        else:
+            exportador.iniciar(ExportarTablaJson, ruta, NumVars, Tabla, Codigos)
 #------------------------------------------------------------------------------------------------------------------------    
     def salir():
         """
         Cierra la ventana principal.
         """
+        trabajo.cancelar()
         ventana.destroy()
 #------------------------------------------------------------------------------------------------------------------------
     ventana = tk.Tk()
     ventana.title("Reductor de MUX")
-    ventana.geometry("700x400")
+    ventana.geometry("760x480")
     ventana.configure(bg="#ADD8E6")
     # Elementos de la interfaz
     label_titulo = tk.Label(ventana, text="Reductor de MUX", font=("Helvetica", 18, "bold"), bg="#ADD8E6")
@@ -246,27 +434,29 @@ def principal():
     boton_calcular.grid(row=0, column=0, padx=10)
     boton_limpiar = tk.Button(frame_botones, text="Limpiar", command=limpiar, bg="#FFD700", font=("Helvetica", 12), width=10)
     boton_limpiar.grid(row=0, column=1, padx=10)
+    boton_cancelar = tk.Button(frame_botones, text="Cancelar", command=cancelar, bg="#D3D3D3", font=("Helvetica", 12), width=10, state=tk.DISABLED)
+    boton_cancelar.grid(row=0, column=2, padx=10)
     boton_salir = tk.Button(frame_botones, text="Salir", command=salir, bg="#FF6347", font=("Helvetica", 12), width=10)
-    boton_salir.grid(row=0, column=2, padx=10)
-    # Frame para mostrar resultados con scroll horizontal
-    frame_resultado = tk.Frame(ventana, bg="#ADD8E6")
-    frame_resultado.pack(fill=tk.X, padx=10, pady=10)
-    canvas_resultado = tk.Canvas(frame_resultado, bg="#F4F6F7")
-    scrollbar_horizontal = tk.Scrollbar(frame_resultado, orient="horizontal", command=canvas_resultado.xview)
-    scrollable_frame_resultado = tk.Frame(canvas_resultado)
-    # Configurar el scrollable_frame para que se ajuste al canvas
-    scrollable_frame_resultado.bind(
-        "<Configure>",
-        lambda e: canvas_resultado.configure(scrollregion=canvas_resultado.bbox("all"))
-    )
-    canvas_resultado.create_window((0, 0), window=scrollable_frame_resultado, anchor="nw")
-    canvas_resultado.configure(xscrollcommand=scrollbar_horizontal.set)
-    scrollbar_horizontal.pack(side="bottom", fill="x")
-    canvas_resultado.pack(side="top", fill="both", expand=True)
-    # Label para mostrar el resultado
-    label_resultado = tk.Label(scrollable_frame_resultado, text="", bg="#F4F6F7", justify="left")
-    label_resultado.pack()
+    boton_salir.grid(row=0, column=3, padx=10)
+    # Avance del cálculo en segundo plano
+    barra_avance = ttk.Progressbar(ventana, length=400, mode="determinate", maximum=100)
+    barra_avance.pack(pady=2)
+    label_estado = tk.Label(ventana, text="", bg="#ADD8E6")
+    label_estado.pack()
+    trabajo = TrabajoFondo(ventana, mostrar_resultado, mostrar_error, mostrar_avance,
+                           lambda: terminar_trabajo("Cálculo cancelado"))
+    exportador = TrabajoFondo(ventana, lambda _: label_estado.config(text="Tabla exportada"), mostrar_error)
+    # Tabla de residuos paginada
+    vista_tabla = VistaTablaMux(ventana, bg="#ADD8E6")
+    vista_tabla.pack(fill=tk.X, padx=10, pady=10)
+    frame_exportar = tk.Frame(ventana, bg="#ADD8E6")
+    frame_exportar.pack()
+    boton_csv = tk.Button(frame_exportar, text="Exportar CSV", command=lambda: exportar("csv"), state=tk.DISABLED)
+    boton_csv.grid(row=0, column=0, padx=5)
+    boton_json = tk.Button(frame_exportar, text="Exportar JSON", command=lambda: exportar("json"), state=tk.DISABLED)
+    boton_json.grid(row=0, column=1, padx=5)
     ventana.mainloop()
 #------------------------------------------------------------------------------------------------------------------------
-# Inicia la aplicación
-principal()
\ No newline at end of file
+# Inicia la aplicación solo al ejecutar el archivo directamente
+if __name__ == "__main__":
+    principal()
\ No newline at end of file
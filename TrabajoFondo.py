@@ -0,0 +1,124 @@
+"""
+Ejecución de cálculos en segundo plano para las interfaces de Tk.
+El cálculo corre en un hilo trabajador; el avance y el resultado llegan al hilo de Tk por una cola que
+se consulta con root.after, de modo que la ventana sigue respondiendo. La cancelación es cooperativa:
+el núcleo avisa su avance (Estadisticas.report_progress) y en ese aviso se interrumpe el trabajo.
+"""
+import itertools
+import queue
+import threading
+import time
+from Estadisticas import report_progress
+
+#------------------------------------------------------------------------------------------------------------------------
+class Cancelado(Exception):
+    """
+    Se lanza dentro del hilo trabajador para interrumpir un trabajo cancelado o reemplazado.
+    """
+#------------------------------------------------------------------------------------------------------------------------
+class TrabajoFondo:
+    """
+    Ejecuta un trabajo a la vez en un hilo trabajador y entrega sus avisos en el hilo de Tk.
+    Iniciar un trabajo nuevo cancela el anterior; los mensajes de trabajos reemplazados se descartan.
+
+    Args:
+        root (tk.Misc): Ventana (o widget) cuyo after se usa para consultar la cola.
+        al_terminar (callable): Recibe el resultado del trabajo.
+        al_fallar (callable): Recibe la excepción si el trabajo falla.
+        al_avanzar (callable): Recibe (fase, avance, total) del núcleo; opcional.
+        al_cancelar (callable): Se llama cuando el trabajo termina por cancelación; opcional.
+        intervalo (int): Milisegundos entre consultas de la cola.
+    """
+    def __init__(self, root, al_terminar, al_fallar, al_avanzar=None, al_cancelar=None, intervalo=50):
+        self.root = root
+        self.al_terminar = al_terminar
+        self.al_fallar = al_fallar
+        self.al_avanzar = al_avanzar
+        self.al_cancelar = al_cancelar
+        self.intervalo = intervalo
+        self._cola = queue.Queue()
+        self._ids = itertools.count(1)
+        self._actual = None  # (id, evento de cancelación) del trabajo en curso
+        self._consultando = False
+
+    @property
+    def ocupado(self):
+        return self._actual is not None
+
+    def iniciar(self, funcion, *args):
+        """
+        Ejecuta funcion(*args) en un hilo trabajador, reemplazando el trabajo en curso si lo hay.
+
+        Args:
+            funcion (callable): Cálculo a ejecutar; no debe tocar widgets de Tk.
+            *args: Argumentos del cálculo.
+        """
+        self.cancelar()
+        trabajo, cancelado = next(self._ids), threading.Event()
+        self._actual = (trabajo, cancelado)
+        hilo = threading.Thread(target=self._ejecutar, args=(trabajo, cancelado, funcion, args), daemon=True)
+        hilo.start()
+        if not self._consultando:
+            self._consultando = True
+            self.root.after(self.intervalo, self._consultar)
+
+    def cancelar(self):
+        """
+        Pide al trabajo en curso que se detenga en su siguiente aviso de avance.
+        """
+        if self._actual is not None:
+            self._actual[1].set()
+
+    #--------------------------------------------------------------------------------------------------------------------
+    def _ejecutar(self, trabajo, cancelado, funcion, args):
+        """
+        Cuerpo del hilo trabajador: ejecuta el cálculo y deja sus avisos en la cola.
+        """
+        ultimo = [0.0]
+
+        def avisar(fase, avance, total):
+            if cancelado.is_set():
+                raise Cancelado()
+            ahora = time.perf_counter()
+            if ahora - ultimo[0] >= self.intervalo / 1000:  # No se satura la cola con avisos
+                ultimo[0] = ahora
+                self._cola.put((trabajo, "avance", (fase, avance, total)))
+
+        try:
+            with report_progress(avisar):
+                resultado = funcion(*args)
+            if cancelado.is_set():
+                raise Cancelado()
+            self._cola.put((trabajo, "fin", resultado))
+        except Cancelado:
+            self._cola.put((trabajo, "cancelado", None))
+        except Exception as error:
+            self._cola.put((trabajo, "error", error))
+
+    def _consultar(self):
+        """
+        Entrega en el hilo de Tk los mensajes del trabajo actual y vuelve a programarse mientras haya uno.
+        """
+        self._consultando = False  # Un callback puede abrir otro mainloop e iniciar un trabajo nuevo
+        try:
+            while True:
+                trabajo, tipo, dato = self._cola.get_nowait()
+                if self._actual is None or trabajo != self._actual[0]:
+                    continue  # Mensaje de un trabajo reemplazado
+                if tipo == "avance":
+                    if self.al_avanzar is not None:
+                        self.al_avanzar(*dato)
+                    continue
+                self._actual = None
+                if tipo == "fin":
+                    self.al_terminar(dato)
+                elif tipo == "error":
+                    self.al_fallar(dato)
+                elif self.al_cancelar is not None:
+                    self.al_cancelar()
+        except queue.Empty:
+            pass
+        if self._actual is not None and not self._consultando:
+            self._consultando = True
+            self.root.after(self.intervalo, self._consultar)
+#------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,23 @@
+"""
+Funciones auxiliares compartidas por las pruebas. Se implementan aparte de los módulos probados para
+que sirvan de referencia independiente.
+"""
+
+
+# Minterms de un implicante (valor, máscara), recorriendo los subconjuntos de sus posiciones con guion
+def cube_minterms(implicant):
+    value, mask = implicant
+    subset = mask
+    while True:
+        yield value | subset
+        if not subset:
+            return
+        subset = (subset - 1) & mask
+
+
+# Conjunto de minterms cubiertos por una lista de implicantes
+def covered_by(implicants):
+    covered = set()
+    for implicant in implicants:
+        covered.update(cube_minterms(implicant))
+    return covered
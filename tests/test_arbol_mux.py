@@ -0,0 +1,36 @@
+"""
+Pruebas de la descomposición en árboles de MUX contra la tabla de verdad.
+"""
+import random
+import pytest
+from ArbolMux import DescomposicionMux, descomponer_mux
+
+
+@pytest.mark.parametrize("ancho", [1, 2, 3])
+def test_arbol_evalua_la_funcion(ancho):
+    generator = random.Random(ancho)
+    for _ in range(20):
+        NumVars = generator.randint(2, 6)
+        Minterms = set(generator.sample(range(1 << NumVars), generator.randint(1, 1 << NumVars)))
+        arbol = descomponer_mux(sorted(Minterms), ancho=ancho, NumVars=NumVars)
+        assert arbol.num_vars == NumVars
+        assert all(arbol.evaluar(m) == (m in Minterms) for m in range(1 << NumVars))
+
+
+def test_funcion_sin_variables_altas():
+    # A' con tres variables: los minterms no llegan al bit de A
+    arbol = descomponer_mux([0, 1, 2, 3], NumVars=3)
+    assert arbol.num_vars == 3
+    assert [arbol.evaluar(m) for m in range(8)] == [1, 1, 1, 1, 0, 0, 0, 0]
+
+
+def test_orden_fijo():
+    arbol = descomponer_mux([1, 2, 5, 6, 7], ancho=1, orden=["C", "B", "A"], NumVars=3)
+    assert arbol.nodos[int(arbol.raiz[1:])]["selects"] == ["C"]
+    assert all(arbol.evaluar(m) == (m in {1, 2, 5, 6, 7}) for m in range(8))
+
+
+@pytest.mark.parametrize("opciones", [{"ancho": 0}, {"orden": ["A", "AB"]}, {"orden": ["a"]}, {"orden": [0]}])
+def test_opciones_invalidas(opciones):
+    with pytest.raises(ValueError):
+        DescomposicionMux(**opciones)
@@ -0,0 +1,31 @@
+"""
+Pruebas de los benchmarks: los casos se generan igual con la misma semilla y la ruta completa de
+quine_mccluskey produce las fases y la expresión esperadas.
+"""
+import json
+from Benchmarks import comparar, generar_casos, main, medir_fases
+
+
+def test_generar_casos():
+    casos = generar_casos(4, 6, max_vars_paridad=5)
+    assert casos == generar_casos(4, 6, max_vars_paridad=5)
+    nombres = [caso["nombre"] for caso in casos]
+    assert "paridad-5" in nombres and "paridad-6" not in nombres
+    assert all(max(caso["minterms"]).bit_length() == caso["num_vars"] for caso in casos)
+
+
+def test_cubo_completo_da_uno():
+    medicion = medir_fases(list(range(32)), 5)
+    assert medicion["expresion"] == "1" and medicion["cobertura"] == 1
+    assert set(medicion["fases"]) == {"primes", "chart", "cover", "texto", "mux"}
+
+
+def test_main_rapido_contra_su_linea_base(tmp_path):
+    ruta = tmp_path / "reporte.json"
+    assert main(["--rapido", "--max-vars", "5", "--sin-memoria", "--filtro", "cubo", "--salida", str(ruta)]) == 0
+    reporte = json.loads(ruta.read_text(encoding="utf-8"))
+    assert reporte["meta"]["rapido"] and all(caso["correcto"] for caso in reporte["casos"])
+    lento = json.loads(ruta.read_text(encoding="utf-8"))
+    for caso in lento["casos"]:
+        caso["fases"]["cover"] += 1.0
+    assert comparar(lento, reporte) and not comparar(reporte, lento)
@@ -0,0 +1,70 @@
+"""
+Pruebas de la caché de minimización: la transformación NP y la traducción de implicantes de regreso.
+"""
+import random
+import numpy as np
+import pytest
+from CacheMinimizacion import MinimizationCache, apply_transform, map_implicants, np_transform, truth_table
+from NucleoMcClusky import minimize_implicants
+from helpers import covered_by
+
+
+def random_transform(generator, num_vars):
+    perm = list(range(num_vars))
+    generator.shuffle(perm)
+    return perm, generator.getrandbits(num_vars)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_map_implicants_inverts_apply_transform(seed):
+    generator = random.Random(seed)
+    for _ in range(30):
+        num_vars = generator.randint(1, 6)
+        minterms = generator.sample(range(1 << num_vars), generator.randint(1, 1 << num_vars))
+        table = truth_table(minterms, num_vars)
+        perm, negated = random_transform(generator, num_vars)
+        transformed = apply_transform(table, num_vars, perm, negated)
+        assert transformed.sum() == len(minterms)
+        # Los minterms de la tabla transformada, llevados de regreso, son los de la función original
+        back = map_implicants([(minterm, 0) for minterm in np.flatnonzero(transformed).tolist()], perm, negated)
+        assert covered_by(back) == set(minterms)
+        # Lo mismo con una cobertura minimizada en las variables transformadas
+        assert covered_by(map_implicants(minimize_implicants(np.flatnonzero(transformed).tolist()), perm, negated)) == set(minterms)
+
+
+def test_np_transform_is_a_valid_transform():
+    generator = random.Random(9)
+    for _ in range(30):
+        num_vars = generator.randint(1, 6)
+        table = truth_table(generator.sample(range(1 << num_vars), generator.randint(1, 1 << num_vars)), num_vars)
+        perm, negated = np_transform(table, num_vars)
+        assert sorted(perm) == list(range(num_vars))
+        assert 0 <= negated < 1 << num_vars
+        assert apply_transform(table, num_vars, perm, negated).sum() == table.sum()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_equivalent_functions_share_an_entry(seed):
+    # Cada variable tiene un número distinto de 1's en sus cofactores y ninguna empata entre 0 y 1,
+    # así la forma semicanónica no depende de cómo se permuten o nieguen las entradas
+    minterms = [0, 1, 2, 3, 5, 7, 8, 9, 10, 11, 13, 15, 16, 17, 18, 19, 21, 25, 27]
+    num_vars = 5
+    generator = random.Random(seed)
+    perm, negated = random_transform(generator, num_vars)
+    other = np.flatnonzero(apply_transform(truth_table(minterms, num_vars), num_vars, perm, negated)).tolist()
+    cache = MinimizationCache()
+    first = cache.minimize(minterms, num_vars)
+    second = cache.minimize(other, num_vars)
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+    assert covered_by(first) == set(minterms)
+    assert covered_by(second) == set(other)
+    assert len(first) == len(second) == len(minimize_implicants(minterms))
+
+
+def test_disk_cache_is_shared(tmp_path):
+    ruta = str(tmp_path / "cache.sqlite")
+    minterms = [0, 1, 2, 5, 7, 8, 10, 15]
+    expected = MinimizationCache(path=ruta).quine_mccluskey(minterms)
+    fresh = MinimizationCache(path=ruta)
+    assert fresh.quine_mccluskey(minterms) == expected
+    assert fresh.stats()["disk_hits"] == 1
@@ -0,0 +1,118 @@
+"""
+Pruebas de la tabla y el resolvedor de cobertura contra búsquedas por fuerza bruta.
+"""
+import itertools
+import random
+import pytest
+from Cobertura import build_chart, greedy_cover, reduce_dominance, remove_redundant, solve_cover, transpose
+from Estadisticas import report_progress
+from NucleoMcClusky import find_prime_implicants, minimize_implicants
+from helpers import cube_minterms
+
+
+# Menor número de filas que cubre todas las columnas, o None si no hay cobertura
+def brute_force_size(rows, num_columns):
+    full = (1 << num_columns) - 1
+    for size in range(len(rows) + 1):
+        for combination in itertools.combinations(rows, size):
+            covered = 0
+            for row in combination:
+                covered |= row
+            if covered == full:
+                return size
+    return None
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_solve_cover_is_minimal(seed):
+    generator = random.Random(seed)
+    for _ in range(60):
+        num_columns = generator.randint(1, 8)
+        rows = [generator.getrandbits(num_columns) for _ in range(generator.randint(1, 8))]
+        expected = brute_force_size(rows, num_columns)
+        chosen = solve_cover(rows, num_columns)
+        if expected is None:
+            assert chosen is None
+            continue
+        covered = 0
+        for row in chosen:
+            covered |= rows[row]
+        assert covered == (1 << num_columns) - 1
+        assert len(chosen) == expected
+
+
+def test_essential_after_dominance():
+    # Ninguna columna tiene una sola fila hasta que la dominancia quita las filas 1, 2 y 3
+    stats = {}
+    chosen = solve_cover([0b111, 0b001, 0b010, 0b100], 3, stats=stats)
+    assert chosen == [0]
+    assert stats["essentials"] == 1
+    assert stats["greedy_picks"] == 0
+
+
+def test_build_chart_matches_cube_membership():
+    generator = random.Random(7)
+    minterms = sorted(generator.sample(range(64), 30))
+    primes = sorted(find_prime_implicants(minterms))
+    chart = build_chart(primes, minterms)
+    for row, implicant in zip(chart.rows, chart.implicants):
+        inside = set(cube_minterms(implicant))
+        assert row == sum(1 << column for column, minterm in enumerate(minterms) if minterm in inside)
+
+
+def test_chart_blocks_and_views_agree():
+    # Bloques de pocas celdas, minterms repetidos y desordenados: la tabla no cambia
+    generator = random.Random(8)
+    minterms = generator.sample(range(1 << 9), 200)
+    primes = sorted(find_prime_implicants(minterms))
+    chart = build_chart(primes, minterms + minterms[:20])
+    small = build_chart(primes, list(reversed(minterms)), block_cells=64)
+    assert chart.minterms.tolist() == sorted(minterms) and chart.num_columns == 200
+    assert small.rows == chart.rows
+    matrix = chart.matrix()
+    assert matrix.shape == (len(primes), 200)
+    assert [sum(1 << column for column in range(200) if matrix[row, column]) for row in range(len(primes))] == chart.rows
+    assert chart.density() == pytest.approx(matrix.mean())
+    assert build_chart([], minterms).rows == [] and build_chart([], minterms).density() == 0.0
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_minimize_implicants_against_brute_force(seed):
+    generator = random.Random(seed)
+    for _ in range(25):
+        num_vars = generator.randint(1, 4)
+        minterms = sorted(generator.sample(range(1 << num_vars), generator.randint(1, 1 << num_vars)))
+        chosen = minimize_implicants(minterms)
+        covered = set()
+        for implicant in chosen:
+            covered.update(cube_minterms(implicant))
+        assert covered == set(minterms)
+        primes = sorted(find_prime_implicants(minterms))
+        assert set(chosen) <= set(primes)
+        chart = build_chart(primes, minterms)
+        assert len(chosen) == brute_force_size(chart.rows, chart.num_columns)
+
+
+class Cancelled(Exception):
+    pass
+
+
+def test_cover_steps_are_cancel_points():
+    # Cada paso largo de la cobertura avisa su avance, y lanzar desde el aviso lo detiene
+    generator = random.Random(6)
+    rows = [generator.getrandbits(300) for _ in range(600)]
+    columns = transpose(rows, 300)
+    active_rows, uncovered = (1 << len(rows)) - 1, (1 << 300) - 1
+    greedy = greedy_cover(rows, columns, active_rows, uncovered)
+    steps = [lambda: transpose(rows, 300),
+             lambda: reduce_dominance(rows, columns, active_rows, uncovered),
+             lambda: greedy_cover(rows, columns, active_rows, uncovered),
+             lambda: remove_redundant(rows, greedy * 300, uncovered)]
+
+    def cancel(stage, done, total):
+        assert stage == "cover"
+        raise Cancelled
+
+    for step in steps:
+        with report_progress(cancel), pytest.raises(Cancelled):
+            step()
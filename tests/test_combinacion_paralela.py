@@ -0,0 +1,43 @@
+"""
+Pruebas de las rondas de combinación en paralelo: deben dar los mismos primos y estadísticas que la serie.
+"""
+import random
+import numpy as np
+import pytest
+import NucleoMcClusky
+from CombinacionParalela import count_ones_array, parallel_prime_implicants
+from Estadisticas import MinimizationStats
+from NucleoMcClusky import find_prime_implicants, quine_mccluskey
+
+
+def rounds_without_time(stats):
+    return [{key: value for key, value in round_.items() if key != "seconds"} for round_ in stats.rounds]
+
+
+def test_count_ones_array():
+    values = np.array([0, 1, 3, 255, 256, (1 << 40) - 1, (1 << 62) + 5], dtype=np.int64)
+    assert count_ones_array(values).tolist() == [bin(value).count("1") for value in values.tolist()]
+
+
+@pytest.mark.parametrize("min_terms", [0, 10 ** 9])
+def test_matches_serial_prime_implicants(min_terms):
+    # min_terms=0 reparte todas las rondas en procesos; 10**9 las hace todas en el proceso actual
+    generator = random.Random(min_terms % 97)
+    for num_vars in (1, 3, 6, 9):
+        for _ in range(3):
+            minterms = generator.sample(range(1 << num_vars), generator.randint(1, 1 << num_vars))
+            serial, parallel = MinimizationStats(), MinimizationStats()
+            expected = find_prime_implicants(minterms, serial)
+            assert parallel_prime_implicants(minterms, num_vars, 2, parallel, min_terms=min_terms) == expected
+            assert rounds_without_time(parallel) == rounds_without_time(serial)
+
+
+def test_quine_mccluskey_with_workers(monkeypatch):
+    monkeypatch.setattr(NucleoMcClusky, "MIN_TERMS", 100)
+    minterms = random.Random(8).sample(range(1 << 10), 400)
+    assert quine_mccluskey(minterms, workers=2) == quine_mccluskey(minterms)
+
+
+def test_too_many_variables():
+    with pytest.raises(ValueError):
+        parallel_prime_implicants([1 << 31], 32, 2)
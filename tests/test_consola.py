@@ -0,0 +1,46 @@
+"""
+Pruebas del núcleo sin interfaz gráfica y de la línea de comandos por lotes.
+"""
+import io
+import json
+import os
+import subprocess
+import sys
+from Consola import leer_funciones, procesar
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_el_nucleo_no_carga_tkinter():
+    codigo = "import sys, Consola, Lotes, NucleoMcClusky, NucleoMux; print('tkinter' in sys.modules)"
+    salida = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, capture_output=True, text=True, check=True)
+    assert salida.stdout.strip() == "False"
+
+
+def test_procesar_lineas(tmp_path):
+    ruta = tmp_path / "funciones.txt"
+    ruta.write_text("0 1 2 3\n\n# comentario\n1,3 5-7\nno es un minterm\n", encoding="utf-8")
+    salida = io.StringIO()
+    assert procesar(leer_funciones([str(ruta)]), salida, modo="ambos") == 1
+    registros = [json.loads(linea) for linea in salida.getvalue().splitlines()]
+    assert [registro["linea"] for registro in registros] == [1, 4, 5]
+    assert registros[0]["expresion"] == "1" and registros[0]["num_vars"] == 2
+    assert registros[0]["mux"]["residuos"] == ["1", "1"]
+    assert registros[1]["expresion"] == "C + AB" and registros[1]["terminos"] == ["C", "AB"]
+    assert "error" in registros[2] and registros[2]["origen"] == str(ruta)
+
+
+def test_modos():
+    for modo, presentes, ausentes in (("mcclusky", {"expresion"}, {"mux"}), ("mux", {"mux"}, {"expresion"})):
+        salida = io.StringIO()
+        procesar([("-", 1, "0 3")], salida, modo=modo)
+        registro = json.loads(salida.getvalue())
+        assert presentes <= set(registro) and not ausentes & set(registro)
+
+
+def test_linea_de_comandos_desde_la_entrada_estandar():
+    salida = subprocess.run([sys.executable, "Consola.py", "--modo", "mcclusky"], cwd=RAIZ, input="1 3\n0 1 2\n",
+                            capture_output=True, text=True, check=True)
+    registros = [json.loads(linea) for linea in salida.stdout.splitlines()]
+    assert [registro["expresion"] for registro in registros] == ["B", "A' + B'"]
+    assert all(registro["origen"] == "-" for registro in registros)
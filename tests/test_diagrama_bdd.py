@@ -0,0 +1,57 @@
+"""
+Pruebas del ROBDD y de la extracción ISOP contra la tabla de verdad.
+"""
+import random
+import numpy as np
+import pytest
+from DiagramaBDD import BDD, bdd_minimize
+from Estadisticas import report_progress
+from helpers import covered_by
+
+
+@pytest.mark.parametrize("order", [None, "reverse"])
+def test_isop_covers_lower_within_upper(order):
+    generator = random.Random(11)
+    for _ in range(40):
+        num_vars = generator.randint(1, 7)
+        space = list(range(1 << num_vars))
+        generator.shuffle(space)
+        cut_on, cut_dc = sorted(generator.sample(range(len(space) + 1), 2))
+        on, dc = space[:cut_on], space[cut_on:cut_dc]
+        manager = BDD(num_vars, list(range(num_vars))[::-1] if order else None)
+        lower = manager.from_minterms(on)
+        upper = manager.apply("or", lower, manager.from_minterms(dc))
+        implicants, node = manager.isop(lower, upper)
+        covered = covered_by(implicants)
+        assert set(on) <= covered <= set(on) | set(dc)
+        assert manager.sat_count(node) == len(covered)
+        assert all(manager.evaluate(node, minterm) == (minterm in covered) for minterm in space)
+
+
+def test_from_minterms_matches_truth_table():
+    minterms = np.array(random.Random(3).sample(range(1 << 10), 300))
+    manager = BDD(10)
+    node = manager.from_minterms(minterms)
+    assert manager.sat_count(node) == 300
+    assert manager.from_minterms(minterms.tolist()) == node
+    assert all(manager.evaluate(node, minterm) == (minterm in set(minterms.tolist())) for minterm in range(1 << 10))
+
+
+def test_bdd_minimize_is_irredundant():
+    generator = random.Random(5)
+    on = generator.sample(range(1 << 8), 90)
+    terms, num_vars = bdd_minimize(on, num_vars=8)
+    assert num_vars == 8
+    manager = BDD(8)
+    implicants, _ = manager.isop(manager.from_minterms(on))
+    assert len(implicants) == len(terms)
+    for index in range(len(implicants)):
+        assert covered_by(implicants[:index] + implicants[index + 1:]) != set(on)
+
+
+def test_bdd_minimize_reports_progress_inside_stages():
+    calls = []
+    with report_progress(lambda stage, done, total: calls.append((stage, done, total))):
+        bdd_minimize(random.Random(2).sample(range(1 << 16), 5000), num_vars=16)
+    assert {stage for stage, _, _ in calls} == {"bdd"}
+    assert len(calls) > 3  # Además de los avisos entre etapas
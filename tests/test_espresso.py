@@ -0,0 +1,71 @@
+"""
+Pruebas del minimizador heurístico: toda cobertura retornada debe ser válida, incluso sin tiempo.
+"""
+import random
+import time
+import numpy as np
+import pytest
+import Espresso
+from Espresso import cubes_table, espresso, espresso_minimize
+from NucleoMcClusky import minimize_implicants
+from helpers import covered_by
+
+
+def random_function(generator, max_vars=7):
+    num_vars = generator.randint(1, max_vars)
+    space = list(range(1 << num_vars))
+    generator.shuffle(space)
+    cut_on, cut_dc = sorted(generator.sample(range(len(space) + 1), 2))
+    return num_vars, space[:cut_on], space[cut_on:cut_dc]
+
+
+@pytest.mark.parametrize("table_vars", [Espresso.TABLE_VARS, 0])
+@pytest.mark.parametrize("time_limit", [10.0, 0.0])
+def test_espresso_cover_is_valid(time_limit, table_vars, monkeypatch):
+    # table_vars=0 obliga a usar los pasos sobre listas de cubos con el complemento como conjunto OFF
+    monkeypatch.setattr(Espresso, "TABLE_VARS", table_vars)
+    generator = random.Random(17)
+    for _ in range(80):
+        num_vars, on, dc = random_function(generator)
+        cubes = espresso([(m, 0) for m in on], num_vars, [(m, 0) for m in dc], time_limit=time_limit)
+        assert set(on) <= covered_by(cubes) <= set(on) | set(dc)
+
+
+def test_espresso_is_irredundant_and_near_minimum():
+    generator = random.Random(23)
+    for _ in range(40):
+        num_vars, on, _ = random_function(generator, 6)
+        cubes = espresso([(m, 0) for m in on], num_vars)
+        for index in range(len(cubes)):
+            assert not set(on) <= covered_by(cubes[:index] + cubes[index + 1:])
+        if on:
+            assert len(cubes) <= len(minimize_implicants(on)) + 2
+
+
+def test_time_limit_bounds_the_first_pass():
+    on = random.Random(1).sample(range(1 << 18), 1 << 16)
+    start = time.perf_counter()
+    terms, num_vars = espresso_minimize(on, num_vars=18, time_limit=0.2)
+    assert time.perf_counter() - start < 3.0
+    assert num_vars == 18 and terms
+
+
+def test_large_structured_function():
+    # 20 variables a partir de 12 cubos grandes: cientos de miles de minterms pero una cobertura pequeña
+    generator = random.Random(5)
+    cubes = []
+    for _ in range(12):
+        mask = sum(1 << bit for bit in generator.sample(range(20), 15))
+        cubes.append((generator.getrandbits(20) & ~mask, mask))
+    on = np.flatnonzero(cubes_table(cubes, 20))
+    start = time.perf_counter()
+    from_minterms, _ = espresso_minimize(on, num_vars=20)
+    from_cubes, _ = espresso_minimize(cubes=cubes, num_vars=20)
+    assert time.perf_counter() - start < 10.0
+    assert len(from_minterms) <= 12 and len(from_cubes) <= 12
+
+
+def test_single_cube_input():
+    # Un renglón de PLA con 20 posiciones libres no se expande a minterms
+    assert espresso_minimize(cubes=[(1 << 21, (1 << 21) - 2)], num_vars=22) == (["AV'"], 22)
+    assert espresso_minimize(cubes=[(1 << 25, (1 << 25) - 2)], num_vars=26) == (["AZ'"], 26)
@@ -0,0 +1,72 @@
+"""
+Pruebas de las estadísticas por fase: contadores de cada ronda de combinación, tabla y cobertura,
+recolección por contexto y aviso de avance.
+"""
+import random
+import pytest
+from Cobertura import build_chart
+from Estadisticas import MinimizationStats, active_collector, active_progress, collect_stats, report_progress
+from NucleoMcClusky import find_prime_implicants, quine_mccluskey, quine_mccluskey_multi
+
+
+def test_round_counters_on_a_known_function():
+    # 0-1, 0-2, 1-3 y 2-3 se combinan; en la segunda ronda "0-"+"1-" y "-0"+"-1" dan "--" dos veces
+    stats = MinimizationStats()
+    assert quine_mccluskey([0, 1, 2, 3], stats) == ([""], 2)
+    assert [(r["terms_in"], r["comparisons"], r["merges"], r["duplicates"], r["terms_out"]) for r in stats.rounds] == \
+        [(4, 4, 4, 0, 4), (4, 2, 2, 1, 1), (1, 0, 0, 0, 0)]
+    assert stats.num_minterms == 4
+    assert stats.chart["prime_implicants"] == 1 and stats.chart["columns"] == 4
+    assert stats.cover["essentials"] == 1 and stats.cover["cover_size"] == 1
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_counters_are_consistent(seed):
+    generator = random.Random(seed)
+    num_vars = generator.randint(2, 8)
+    space = generator.sample(range(1 << num_vars), generator.randint(2, 1 << num_vars))
+    minterms, dont_cares = sorted(space[:len(space) // 2 + 1]), sorted(space[len(space) // 2 + 1:])
+    stats = MinimizationStats()
+    terms, _ = quine_mccluskey(minterms, stats, dont_cares=dont_cares)
+    assert stats.rounds[0]["terms_in"] == len(space)
+    for current, following in zip(stats.rounds, stats.rounds[1:]):
+        assert following["terms_in"] == current["terms_out"]
+    for round_stats in stats.rounds:
+        assert round_stats["terms_out"] == round_stats["merges"] - round_stats["duplicates"]
+        assert round_stats["merges"] <= round_stats["comparisons"] and round_stats["seconds"] >= 0
+    assert stats.rounds[-1]["terms_out"] == 0
+    primes = sorted(find_prime_implicants(space))
+    assert stats.chart["prime_implicants"] == len(primes) and stats.chart["columns"] == len(minterms)
+    assert stats.chart["density"] == pytest.approx(build_chart(primes, minterms).density())
+    assert stats.cover["cover_size"] == len(terms) and stats.cover["essentials"] <= len(terms)
+    assert set(stats.phases) == {"primes", "chart", "cover"}
+    assert stats.as_dict()["rounds"] is stats.rounds
+
+
+def test_collect_stats_and_callback():
+    finished = []
+    assert active_collector() is None
+    with collect_stats(finished.append) as collector:
+        assert active_collector() is collector
+        quine_mccluskey([1, 3, 5])
+        own = MinimizationStats()
+        quine_mccluskey([0, 2], own)
+        quine_mccluskey_multi([[1, 2], [2, 3]])
+    assert active_collector() is None
+    assert collector.runs == finished and len(finished) == 3
+    assert finished[1] is own and finished[0].num_minterms == 3 and finished[2].num_minterms == 4
+    # Fuera del contexto no se recolecta nada
+    quine_mccluskey([1, 3, 5])
+    assert len(finished) == 3
+
+
+def test_report_progress():
+    generator = random.Random(5)
+    minterms = generator.sample(range(1 << 9), 250)
+    calls = []
+    with report_progress(lambda *args: calls.append(args)):
+        assert active_progress() is not None
+        quine_mccluskey(minterms)
+    assert active_progress() is None
+    assert {"primes", "chart"} <= {stage for stage, _, _ in calls}
+    assert all(0 <= done <= total for _, done, total in calls)
@@ -0,0 +1,71 @@
+"""
+Pruebas del evaluador masivo contra la evaluación directa de los términos en todas las entradas.
+"""
+import random
+import numpy as np
+import pytest
+import Evaluador
+from Evaluador import compilar_sop, contraejemplos, desempaquetar, planos_desde_minterms, simular_mux_minterms
+from NucleoMcClusky import quine_mccluskey, result_to_string
+from NucleoMux import TablaMux
+
+
+# Evalúa una suma de productos literal por literal (A es el bit más significativo)
+def evaluar_directo(terminos, NumVars, minterm):
+    for termino in terminos:
+        cumple = True
+        for posicion, letra in enumerate(termino):
+            if letra == "'":
+                continue
+            negada = termino[posicion + 1:posicion + 2] == "'"
+            bit = minterm >> (NumVars - 1 - (ord(letra) - ord("A"))) & 1
+            cumple &= bit != negada
+        if cumple:
+            return True
+    return False
+
+
+def termino_aleatorio(generator, NumVars):
+    variables = sorted(generator.sample(range(NumVars), generator.randint(1, NumVars)))
+    return "".join(chr(ord("A") + v) + ("'" if generator.random() < 0.5 else "") for v in variables)
+
+
+@pytest.mark.parametrize("limite_tabla", [Evaluador.LIMITE_TABLA, 0])
+def test_coincide_con_la_evaluacion_directa(limite_tabla, monkeypatch):
+    # limite_tabla=0 obliga a usar el código generado en lugar de la tabla de verdad
+    monkeypatch.setattr(Evaluador, "LIMITE_TABLA", limite_tabla)
+    generator = random.Random(limite_tabla)
+    for _ in range(40):
+        NumVars = generator.randint(1, 10)
+        terminos = [termino_aleatorio(generator, NumVars) for _ in range(generator.randint(1, 6))]
+        Entradas = np.arange(1 << NumVars)
+        esperado = [evaluar_directo(terminos, NumVars, m) for m in range(1 << NumVars)]
+        for resultado in (terminos, " + ".join(terminos)):
+            evaluador = compilar_sop(resultado, NumVars)
+            assert evaluador(Entradas).tolist() == esperado
+            salida = evaluador.evaluar_planos(planos_desde_minterms(Entradas, NumVars))
+            assert desempaquetar(salida, len(Entradas)).tolist() == esperado
+
+
+@pytest.mark.parametrize("NumVars", [1, 4, 10])
+def test_constantes(NumVars):
+    Entradas = np.arange(1 << NumVars)
+    for resultado in ([""], "1", [(0, (1 << NumVars) - 1)]):
+        assert compilar_sop(resultado, NumVars)(Entradas).all()
+        assert desempaquetar(compilar_sop(resultado, NumVars).evaluar_planos(planos_desde_minterms(Entradas, NumVars)),
+                             len(Entradas)).all()
+    for resultado in ([], "0", "AA'"):
+        assert not compilar_sop(resultado, NumVars)(Entradas).any()
+
+
+def test_resultados_minimizados_y_mux():
+    generator = random.Random(3)
+    for _ in range(20):
+        NumVars = generator.randint(2, 8)
+        Minterms = sorted(generator.sample(range(1 << NumVars), generator.randint(1, 1 << NumVars)))
+        terminos, _ = quine_mccluskey(Minterms, num_vars=NumVars)
+        assert len(contraejemplos(compilar_sop(result_to_string(terminos), NumVars), Minterms, NumVars)) == 0
+        equivalencias = TablaMux(Minterms, NumVars)[4]
+        assert len(contraejemplos(lambda X: simular_mux_minterms(equivalencias, X), Minterms, NumVars)) == 0
+    # Un término de más sí aparece como contraejemplo
+    assert contraejemplos(compilar_sop("A", 3), [4, 5, 6], 3).tolist() == [7]
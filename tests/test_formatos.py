@@ -0,0 +1,105 @@
+"""
+Pruebas de los formatos de entrada compactos y de su lectura desde la línea de comandos.
+"""
+import io
+import json
+import numpy as np
+import pytest
+from Consola import leer_funciones, procesar
+from Formatos import (cargar_mapa_bits, escribir_mapa_bits, leer_pla, leer_rangos, minterms_desde_verdad,
+                      verdad_desde_cubos, verdad_desde_hex, verdad_desde_mapa)
+
+
+def test_leer_rangos():
+    assert leer_rangos("1, 3-5 0x10-0x11 9").tolist() == [1, 3, 4, 5, 16, 17, 9]
+    assert leer_rangos("").tolist() == []
+    with pytest.raises(ValueError):
+        leer_rangos("5-3")
+
+
+def test_verdad_desde_hex():
+    Verdad = verdad_desde_hex("0F")  # Dos dígitos: 8 minterms, 3 variables
+    assert len(Verdad) == 8
+    assert minterms_desde_verdad(Verdad).tolist() == [0, 1, 2, 3]
+    assert minterms_desde_verdad(verdad_desde_hex("0x8")).tolist() == [3]
+    assert minterms_desde_verdad(verdad_desde_hex("8000_0001")).tolist() == [0, 31]
+    with pytest.raises(ValueError):
+        verdad_desde_hex("1F", NumVars=2)
+
+
+def test_mapa_de_bits(tmp_path):
+    Verdad = np.zeros(1 << 10, dtype=bool)
+    Verdad[[0, 7, 8, 513, 1023]] = True
+    ruta = tmp_path / "funcion.bin"
+    escribir_mapa_bits(Verdad, ruta)
+    assert ruta.stat().st_size == 128
+    assert np.array_equal(verdad_desde_mapa(cargar_mapa_bits(ruta)), Verdad)
+    assert len(verdad_desde_mapa(cargar_mapa_bits(ruta), NumVars=4)) == 16
+
+
+def test_verdad_desde_cubos():
+    Verdad = verdad_desde_cubos(np.array([0b100, 0b001]), np.array([0b011, 0b000]), 3)
+    assert minterms_desde_verdad(Verdad).tolist() == [1, 4, 5, 6, 7]
+
+
+def test_leer_pla(tmp_path):
+    ruta = tmp_path / "funcion.pla"
+    ruta.write_text(".i 3\n.o 2\n# comentario\n1-- 10\n001 -1\n0-0 01\n.e\n", encoding="utf-8")
+    pla = leer_pla(ruta)
+    assert pla["num_vars"] == 3 and pla["num_salidas"] == 2
+    on0 = verdad_desde_cubos(*pla["on"][0], 3)
+    dc0 = verdad_desde_cubos(*pla["dc"][0], 3)
+    on1 = verdad_desde_cubos(*pla["on"][1], 3)
+    assert minterms_desde_verdad(on0).tolist() == [4, 5, 6, 7]
+    assert minterms_desde_verdad(dc0).tolist() == [1]
+    assert minterms_desde_verdad(on1).tolist() == [0, 1, 2]
+
+
+def test_leer_funciones_conserva_el_ancho(tmp_path):
+    ruta = tmp_path / "tablas.txt"
+    ruta.write_text("0F\n# comentario\n00000001\n", encoding="utf-8")
+    funciones = list(leer_funciones([str(ruta)], "hex"))
+    assert [numero for _, numero, _ in funciones] == [1, 3]
+    Minterms, DontCares, NumVars = funciones[0][2]
+    assert Minterms.tolist() == [0, 1, 2, 3] and DontCares is None and NumVars == 3
+    assert funciones[1][2][0].tolist() == [0] and funciones[1][2][2] == 5
+    mapa = tmp_path / "funcion.bin"
+    escribir_mapa_bits(np.arange(16) < 4, mapa)
+    (_, _, (Minterms, _, NumVars)), = leer_funciones([str(mapa)], "mapa")
+    assert Minterms.tolist() == [0, 1, 2, 3] and NumVars == 4
+
+
+def test_procesar_hex(tmp_path):
+    ruta = tmp_path / "tabla.txt"
+    ruta.write_text("0F\n", encoding="utf-8")
+    salida = io.StringIO()
+    assert procesar(leer_funciones([str(ruta)], "hex"), salida, modo="ambos") == 0
+    registro = json.loads(salida.getvalue())
+    assert registro["num_vars"] == 3 and registro["expresion"] == "A'"
+    assert registro["mux"]["num_vars"] == 3
+
+
+def test_procesar_pla_por_cubos(tmp_path):
+    # Con espresso y bdd los cubos llegan sin expandirse: 20 posiciones libres no generan 2^20 minterms
+    ruta = tmp_path / "grande.pla"
+    ruta.write_text(".i 22\n.o 1\n1" + "-" * 20 + "0 1\n.e\n", encoding="utf-8")
+    for metodo in ("espresso", "bdd"):
+        salida = io.StringIO()
+        assert procesar(leer_funciones([str(ruta)], "pla"), salida, modo="mcclusky", metodo=metodo) == 0
+        assert json.loads(salida.getvalue())["expresion"] == "AV'"
+
+
+def test_procesar_pla_con_errores(tmp_path):
+    invalido = tmp_path / "invalido.pla"
+    invalido.write_text(".i 3\n.o 1\n1x- 1\n", encoding="utf-8")
+    ancho = tmp_path / "ancho.pla"
+    ancho.write_text(".i 25\n.o 1\n" + "-" * 25 + " 1\n", encoding="utf-8")
+    valido = tmp_path / "valido.pla"
+    valido.write_text(".i 3\n.o 2\n1-- 10\n001 -1\n0-0 01\n", encoding="utf-8")
+    salida = io.StringIO()
+    archivos = [str(invalido), str(ancho), str(valido)]
+    assert procesar(leer_funciones(archivos, "pla"), salida, modo="mcclusky") == 2
+    registros = [json.loads(linea) for linea in salida.getvalue().splitlines()]
+    assert "cubo de entrada inválido" in registros[0]["error"] and registros[0]["linea"] is None
+    assert "demasiadas para expandir" in registros[1]["error"]  # McCluskey necesitaría 2^25 minterms
+    assert [registro["expresion"] for registro in registros[2:]] == ["A", "A'B' + A'C'"]
@@ -0,0 +1,72 @@
+"""
+Pruebas de la minimización por lotes: orden de los resultados, errores y límite de tiempo por tarea,
+procesamiento en el proceso actual contra el grupo de procesos y presupuesto de la cobertura.
+"""
+import random
+import time
+import pytest
+import Lotes
+from Lotes import PRESUPUESTO_COBERTURA, minimize_many
+from NucleoMcClusky import quine_mccluskey
+
+
+def funciones_aleatorias(cantidad, semilla=0):
+    generator = random.Random(semilla)
+    funciones = []
+    for _ in range(cantidad):
+        NumVars = generator.randint(1, 6)
+        funciones.append(sorted(generator.sample(range(1 << NumVars), generator.randint(1, 1 << NumVars))))
+    return funciones
+
+
+def test_orden_de_entrada_y_por_terminacion():
+    funciones = funciones_aleatorias(30)
+    ordenados = list(minimize_many(funciones, workers=0, chunksize=4, modo="mcclusky"))
+    assert [indice for indice, _ in ordenados] == list(range(30))
+    for (_, resultado), Minterms in zip(ordenados, funciones):
+        assert (resultado["terminos"], resultado["num_vars"]) == quine_mccluskey(Minterms)
+    desordenados = list(minimize_many(funciones, workers=2, chunksize=4, ordered=False, modo="mcclusky"))
+    assert sorted(desordenados, key=lambda par: par[0]) == ordenados
+
+
+def test_el_grupo_de_procesos_coincide_con_el_proceso_actual():
+    funciones = funciones_aleatorias(40, semilla=1) + ["0-7", ([1, 2], [3], 3)]
+    esperado = list(minimize_many(funciones, workers=0, chunksize=8))
+    assert list(minimize_many(funciones, workers=2, chunksize=8)) == esperado
+
+
+def test_errores_por_tarea():
+    resultados = dict(minimize_many([[0, 3], "no es un minterm", ValueError("PLA inválido"), "1 2"], workers=0))
+    assert resultados[0]["expresion"] == "A'B' + AB"
+    assert resultados[1]["error"].startswith("ValueError")
+    assert resultados[2] == {"error": "ValueError: PLA inválido"}
+    assert resultados[3]["expresion"] == "A'B + AB'"
+
+
+@pytest.mark.skipif(not hasattr(Lotes.signal, "setitimer"), reason="el límite de tiempo requiere setitimer")
+def test_limite_de_tiempo_por_tarea(monkeypatch):
+    original = Lotes.analizar_minterms
+
+    def lento(Minterms, *args):
+        if len(Minterms) == 3:
+            time.sleep(2)
+        return original(Minterms, *args)
+
+    monkeypatch.setattr(Lotes, "analizar_minterms", lento)
+    resultados = dict(minimize_many([[1], [0, 1, 2], [2, 3]], workers=0, timeout=0.2, modo="mcclusky"))
+    assert resultados[1]["error"].startswith("TimeoutError")
+    assert resultados[0]["expresion"] == "A" and resultados[2]["expresion"] == "A"
+
+
+def test_presupuesto_de_cobertura(monkeypatch):
+    # Los lotes pasan su presupuesto explícitamente; los valores por defecto de solve_cover no cambian
+    recibidos = []
+
+    def registrar(*args, cover_budget=None, **kwargs):
+        recibidos.append(cover_budget)
+        return quine_mccluskey(*args, cover_budget=cover_budget, **kwargs)
+
+    monkeypatch.setattr(Lotes, "quine_mccluskey", registrar)
+    list(minimize_many([[0, 1], ([1], [0, 3], 2)], workers=0, modo="mcclusky"))
+    assert recibidos == [PRESUPUESTO_COBERTURA, PRESUPUESTO_COBERTURA]
+    assert Lotes.obtener_cache("").cover_budget == PRESUPUESTO_COBERTURA
@@ -0,0 +1,83 @@
+"""
+Pruebas del minimizador incremental: tras cada edición los primos son los de una minimización desde cero
+y la cobertura reparada es válida e irredundante.
+"""
+import random
+import pytest
+from MinimizacionIncremental import IncrementalMinimizer
+from NucleoMcClusky import find_prime_implicants, minimize_implicants
+from helpers import cube_minterms
+
+
+def check_cover(minimizer):
+    covered = {}
+    for implicant in minimizer.cover:
+        assert implicant in minimizer.primes
+        for minterm in cube_minterms(implicant):
+            assert minterm in minimizer.on or minterm in minimizer.dont_cares
+            covered[minterm] = covered.get(minterm, 0) + 1
+    assert minimizer.on <= set(covered)
+    # Irredundante: cada implicante es el único que cubre alguno de sus minterms ON
+    for implicant in minimizer.cover:
+        assert any(covered[minterm] == 1 for minterm in cube_minterms(implicant) if minterm in minimizer.on)
+
+
+def test_initial_cover_is_minimum():
+    generator = random.Random(4)
+    for _ in range(20):
+        minterms = generator.sample(range(64), generator.randint(1, 64))
+        minimizer = IncrementalMinimizer(minterms, num_vars=6)
+        assert minimizer.primes == find_prime_implicants(minterms)
+        assert len(minimizer.cover) == len(minimize_implicants(minterms))
+        assert minimizer.resolved_size == len(minimizer.cover)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_add_and_remove_keep_primes_and_cover(seed):
+    generator = random.Random(seed)
+    minterms = set(generator.sample(range(128), 40))
+    minimizer = IncrementalMinimizer(minterms, num_vars=7)
+    for _ in range(60):
+        minterm = generator.randrange(128)
+        if minterm in minterms:
+            minterms.discard(minterm)
+            minimizer.remove(minterm)
+        else:
+            minterms.add(minterm)
+            minimizer.add(minterm)
+        assert minimizer.on == minterms
+        assert minimizer.primes == find_prime_implicants(sorted(minterms))
+        check_cover(minimizer)
+
+
+def test_update_with_dont_cares():
+    generator = random.Random(11)
+    minimizer = IncrementalMinimizer(generator.sample(range(64), 20), num_vars=6)
+    for _ in range(15):
+        space = generator.sample(range(64), 30)
+        on, dc = space[:20], space[20:]
+        minimizer.update(on, dc)
+        assert minimizer.on == set(on) and minimizer.dont_cares == set(dc)
+        assert minimizer.primes == find_prime_implicants(space)
+        check_cover(minimizer)
+
+
+def test_resolve_restores_the_minimum():
+    generator = random.Random(2)
+    minterms = set(generator.sample(range(256), 100))
+    minimizer = IncrementalMinimizer(minterms, num_vars=8)
+    for minterm in generator.sample(range(256), 40):
+        minterms ^= {minterm}
+        minimizer.update(minterms)
+    repaired = len(minimizer.cover)
+    minimizer.resolve()
+    check_cover(minimizer)
+    assert len(minimizer.cover) == len(minimize_implicants(sorted(minterms))) <= repaired
+    assert not minimizer.needs_resolve()
+
+
+def test_needs_resolve_after_growth():
+    minimizer = IncrementalMinimizer([0, 1, 2, 3], num_vars=4)
+    assert len(minimizer.cover) == 1 and not minimizer.needs_resolve()
+    minimizer.update([0, 1, 2, 3, 5, 10])  # Dos términos nuevos sobre una cobertura resuelta de uno
+    assert minimizer.needs_resolve(slack=0.25)
@@ -0,0 +1,118 @@
+"""
+Pruebas del núcleo de McCluskey: combinación con implicantes (valor, máscara) contra la versión con
+cadenas, don't care, número de variables explícito y minimización de varias salidas con implicantes
+compartidos, contra la minimización de cada salida por separado.
+"""
+import random
+import pytest
+from NucleoMcClusky import (combine_terms, find_prime_implicants, find_tagged_prime_implicants, implicant_to_string,
+                            implicant_to_variables, minimize_implicants, minimize_multi_implicants, quine_mccluskey,
+                            quine_mccluskey_multi)
+from helpers import covered_by
+
+
+def random_outputs(generator, num_vars, num_outputs):
+    on_sets, dc_sets = [], []
+    for _ in range(num_outputs):
+        space = list(range(1 << num_vars))
+        generator.shuffle(space)
+        cut_on, cut_dc = sorted(generator.sample(range(1, len(space) + 1), 2))
+        on_sets.append(sorted(space[:cut_on]))
+        dc_sets.append(sorted(space[cut_on:cut_dc]))
+    return on_sets, dc_sets
+
+
+def test_dont_cares_are_optional_to_cover():
+    generator = random.Random(1)
+    for _ in range(40):
+        (on,), (dc,) = random_outputs(generator, generator.randint(1, 6), 1)
+        implicants = minimize_implicants(on, dont_cares=dc)
+        assert set(on) <= covered_by(implicants) <= set(on) | set(dc)
+        assert len(implicants) <= len(minimize_implicants(on))
+
+
+def test_explicit_number_of_variables():
+    assert quine_mccluskey([0, 1], num_vars=3) == (["A'B'"], 3)
+    assert quine_mccluskey([1], dont_cares=[0, 2, 3], num_vars=2) == ([""], 2)
+    with pytest.raises(ValueError):
+        quine_mccluskey([8], num_vars=3)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_tagged_primes_include_each_output_primes(seed):
+    generator = random.Random(seed)
+    on_sets, dc_sets = random_outputs(generator, generator.randint(2, 6), generator.randint(1, 4))
+    tagged = {}
+    for output, (on, dc) in enumerate(zip(on_sets, dc_sets)):
+        for minterm in on + dc:
+            tagged[minterm] = tagged.get(minterm, 0) | 1 << output
+    primes = find_tagged_prime_implicants(tagged)
+    for output, (on, dc) in enumerate(zip(on_sets, dc_sets)):
+        own = {implicant for implicant, tag in primes.items() if tag >> output & 1}
+        assert find_prime_implicants(on + dc) <= own
+        assert covered_by(own) <= set(on) | set(dc)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_multi_output_against_per_output(seed):
+    generator = random.Random(10 + seed)
+    num_vars, num_outputs = generator.randint(2, 6), generator.randint(1, 5)
+    on_sets, dc_sets = random_outputs(generator, num_vars, num_outputs)
+    outputs = minimize_multi_implicants(on_sets, dc_sets)
+    separate = [minimize_implicants(on, dont_cares=dc) for on, dc in zip(on_sets, dc_sets)]
+    for implicants, on, dc in zip(outputs, on_sets, dc_sets):
+        assert set(on) <= covered_by(implicants) <= set(on) | set(dc)
+    # La cobertura conjunta no usa más implicantes distintos que las coberturas por separado
+    assert len(set().union(*map(set, outputs))) <= len(set().union(*map(set, separate)))
+    if num_outputs == 1:
+        assert len(outputs[0]) == len(separate[0])
+
+
+def test_shared_implicant():
+    # Por separado: A'B + BC y AB' + AC (cuatro términos); juntas comparten ABC y bastan tres
+    terms, num_vars = quine_mccluskey_multi([[2, 3, 7], [4, 5, 7]], num_vars=3)
+    assert num_vars == 3
+    assert sorted(terms[0]) == ["A'B", "ABC"] and sorted(terms[1]) == ["AB'", "ABC"]
+    assert quine_mccluskey_multi([[0, 1, 2, 3], []]) == ([[""], []], 2)
+
+
+# Implicantes primos con la representación anterior: cadenas con '0', '1' y '-'
+def string_prime_implicants(minterms, num_vars):
+    current = {format(minterm, f"0{num_vars}b") for minterm in minterms}
+    primes = set()
+    while current:
+        following, checked = set(), set()
+        for first in current:
+            for second in current:
+                differences = [i for i, (x, y) in enumerate(zip(first, second)) if x != y]
+                if len(differences) == 1 and "-" not in (first[differences[0]], second[differences[0]]):
+                    following.add(first[:differences[0]] + "-" + first[differences[0] + 1:])
+                    checked.update((first, second))
+        primes |= current - checked
+        current = following
+    return primes
+
+
+def test_combine_terms():
+    assert combine_terms((0b0101, 0b0010), (0b0100, 0b0010)) == (0b0100, 0b0011)
+    assert combine_terms((0b0101, 0), (0b0110, 0)) is None  # Difieren en dos bits
+    assert combine_terms((0b0101, 0b0010), (0b0100, 0b1000)) is None  # Guiones en otras posiciones
+    assert combine_terms((3, 0), (3, 0)) is None
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_prime_implicants_match_string_engine(seed):
+    generator = random.Random(seed)
+    for _ in range(15):
+        num_vars = generator.randint(1, 7)
+        minterms = generator.sample(range(1 << num_vars), generator.randint(1, 1 << num_vars))
+        primes = find_prime_implicants(minterms)
+        assert {implicant_to_string(implicant, num_vars) for implicant in primes} == \
+            string_prime_implicants(minterms, num_vars)
+
+
+def test_terms_become_strings_at_the_end():
+    assert implicant_to_string((0b1000, 0b0101), 4) == "1-0-"
+    assert implicant_to_variables("1-0-", 4) == "AC'"
+    assert implicant_to_string((0, 0b111), 3) == "---" and implicant_to_variables("---", 3) == ""
+    assert quine_mccluskey([0, 2, 5, 7, 8, 10, 13, 15]) == (["B'D'", "BD"], 4)
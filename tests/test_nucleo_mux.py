@@ -0,0 +1,80 @@
+"""
+Pruebas de la tabla de residuos vectorizada del MUX contra la construcción entrada por entrada, y de
+las páginas y exportaciones que la formatean por bloques.
+"""
+import csv
+import json
+import random
+import numpy as np
+import pytest
+from NucleoMux import (AnalizarTabla, CodigosMux, EsPotencia, ExportarTablaCsv, ExportarTablaJson, FilasMux, RESIDUOS,
+                       TablaMux, TablaMuxArreglos, TablaMuxVerdad, VectorVerdad, calcular_num_vars)
+
+
+# Tabla con el recorrido original: cada índice se busca en la lista de minterms
+def tabla_por_entrada(Minterms, NumVars):
+    NumeroMux = 2 ** (NumVars - 1)
+    Fila1 = [-1 if i in Minterms else i for i in range(NumeroMux)]
+    Fila2 = [-1 if i + NumeroMux in Minterms else i + NumeroMux for i in range(NumeroMux)]
+    Resultado = []
+    for a_negada, a in zip(Fila1, Fila2):
+        if a_negada == -1 and a == -1:
+            Resultado.append("1")
+        elif a_negada == -1:
+            Resultado.append("A'")
+        elif a == -1:
+            Resultado.append("A")
+        else:
+            Resultado.append("0")
+    return NumVars, NumeroMux, Fila1, Fila2, Resultado
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_tabla_vectorizada_contra_el_recorrido(seed):
+    generator = random.Random(seed)
+    for _ in range(30):
+        NumVars = generator.randint(1, 9)
+        Minterms = generator.sample(range(1 << NumVars), generator.randint(1, 1 << NumVars))
+        esperado = tabla_por_entrada(Minterms, NumVars)
+        assert TablaMux(Minterms, NumVars) == esperado
+        assert TablaMux(np.array(Minterms), NumVars) == esperado
+        assert TablaMuxVerdad(VectorVerdad(Minterms, 1 << NumVars), NumVars) == esperado
+        assert AnalizarTabla(esperado[2], esperado[3]) == esperado[4]
+
+
+def test_numero_de_variables():
+    assert [calcular_num_vars(m) for m in ([0], [1], [2], [3, 1], [4], [7], [8], np.array([1023]))] == \
+        [1, 1, 2, 2, 3, 3, 4, 10]
+    assert TablaMux([0, 5])[:2] == (3, 4)
+    # Sin número de variables, el vector de verdad usa el último minterm presente
+    assert TablaMuxVerdad(VectorVerdad([5], 16))[:2] == (3, 4)
+    assert [n for n in range(20) if EsPotencia(n)] == [1, 2, 4, 8, 16]
+
+
+def test_codigos_de_residuo():
+    Tabla = np.array([[False, True, False, True], [False, False, True, True]])
+    assert CodigosMux(Tabla).tolist() == [0, 1, 2, 3]
+    assert RESIDUOS[CodigosMux(Tabla)].tolist() == ["0", "A'", "A", "1"]
+    # Los minterms fuera de la tabla se ignoran
+    assert VectorVerdad([-1, 2, 9], 4).tolist() == [False, False, True, False]
+
+
+@pytest.mark.parametrize("bloque", [1, 5, 1 << 16])
+def test_paginas_y_exportaciones_por_bloques(bloque, tmp_path):
+    generator = random.Random(bloque)
+    Minterms = generator.sample(range(1 << 7), 50)
+    NumVars, NumeroMux, Fila1, Fila2, Resultado = TablaMux(Minterms, 7)
+    _, _, Tabla, Codigos = TablaMuxArreglos(VectorVerdad(Minterms, 1 << 7), 7)
+    # Cada página de columnas es el mismo corte de las filas completas
+    for Inicio in range(0, NumeroMux, 12):
+        Fin = min(Inicio + 12, NumeroMux)
+        assert FilasMux(Tabla, Inicio, Fin).tolist() == [Fila1[Inicio:Fin], Fila2[Inicio:Fin]]
+    ExportarTablaJson(tmp_path / "tabla.json", NumVars, Tabla, Codigos, bloque=bloque)
+    assert json.loads((tmp_path / "tabla.json").read_text(encoding="utf-8")) == {
+        "num_vars": NumVars, "entradas": NumeroMux, "fila_a_negada": Fila1, "fila_a": Fila2, "residuos": Resultado}
+    ExportarTablaCsv(tmp_path / "tabla.csv", Tabla, Codigos, bloque=bloque)
+    with open(tmp_path / "tabla.csv", encoding="utf-8", newline="") as archivo:
+        filas = list(csv.reader(archivo))
+    assert filas[0] == ["entrada", "fila_a_negada", "fila_a", "residuo"]
+    assert filas[1:] == [[f"I{i}", str(a_negada), str(a), residuo]
+                         for i, (a_negada, a, residuo) in enumerate(zip(Fila1, Fila2, Resultado))]
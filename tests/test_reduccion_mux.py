@@ -0,0 +1,51 @@
+"""
+Pruebas de la parte de la interfaz del MUX que no necesita pantalla: el cálculo en el hilo trabajador
+y la agrupación de los pines de la simulación.
+"""
+import random
+import pytest
+from Estadisticas import report_progress
+from NucleoMux import RESIDUOS, TablaMux
+
+ReduccionMux = pytest.importorskip("ReduccionMux")  # Requiere tkinter, aunque no una pantalla
+agrupar_entradas, preparar_resultado = ReduccionMux.agrupar_entradas, ReduccionMux.preparar_resultado
+
+
+# Agrupación entrada por entrada: tramos de "0" o "1" de al menos `minimo` entradas forman una fila
+def agrupar_por_entrada(equivalencias, minimo=2):
+    filas, inicio = [], 0
+    while inicio < len(equivalencias):
+        fin = inicio
+        while fin + 1 < len(equivalencias) and equivalencias[fin + 1] == equivalencias[inicio]:
+            fin += 1
+        if equivalencias[inicio] in ("0", "1") and fin - inicio + 1 >= minimo:
+            filas.append((inicio, fin, equivalencias[inicio]))
+        else:
+            filas.extend((i, i, equivalencias[i]) for i in range(inicio, fin + 1))
+        inicio = fin + 1
+    return filas
+
+
+@pytest.mark.parametrize("minimo", [1, 2, 4])
+def test_agrupar_entradas_contra_el_recorrido(minimo):
+    generator = random.Random(minimo)
+    for _ in range(50):
+        equivalencias = [generator.choice(["0", "1", "A", "A'"]) for _ in range(generator.randint(1, 60))]
+        assert agrupar_entradas(equivalencias, minimo) == agrupar_por_entrada(equivalencias, minimo)
+    assert agrupar_entradas([]) == []
+    # Los residuos A y A' nunca se agrupan
+    assert agrupar_entradas(["A", "A", "0", "0", "0"]) == [(0, 0, "A"), (1, 1, "A"), (2, 4, "0")]
+
+
+def test_preparar_resultado_agrupa_en_el_trabajador():
+    generator = random.Random(9)
+    Minterms = sorted(generator.sample(range(1 << 10), 300))
+    avisos = []
+    with report_progress(lambda *args: avisos.append(args)):
+        NumVars, NumeroMux, Tabla, Codigos, Filas = preparar_resultado(Minterms)
+    assert avisos[0] == ("tabla", 0, 300) and avisos[-1] == ("tabla", 300, 300)
+    _, _, Fila1, Fila2, Resultado = TablaMux(Minterms)
+    assert (NumVars, NumeroMux) == (10, 512)
+    assert RESIDUOS[Codigos].tolist() == Resultado
+    assert (Tabla[0].tolist(), Tabla[1].tolist()) == ([x == -1 for x in Fila1], [x == -1 for x in Fila2])
+    assert Filas == agrupar_por_entrada(Resultado)